@@ -0,0 +1,10 @@
+from .utils import budget  # noqa: F401
+from .utils.profiling import install_generation_hooks, uninstall_generation_hooks
+
+
+def register():
+    install_generation_hooks()
+
+
+def unregister():
+    uninstall_generation_hooks()
@@ -0,0 +1,335 @@
+"""
+Shared helpers for the headless Vizor benchmarks.
+
+The benchmarks run inside Blender, with this checkout installed and enabled as a Rigify feature set:
+
+    blender -b --python-exit-code 1 --python benchmarks/<suite>.py -- [options]
+
+The suite script runs every metarig template in a separate Blender process, so that peak
+memory is measured per template, and collects one JSON result record from each worker.
+
+Baselines are machine specific, so none are committed. Record one on the machine that runs the
+checks with --baseline <file> --update-baseline; checking against a missing baseline, or one
+without a record for a run template, fails.
+"""
+
+import bpy
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import importlib
+import subprocess
+
+from typing import Callable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from bench_templates import REPO_ROOT, TEMPLATE_CATEGORIES, list_templates  # noqa: F401
+
+
+RESULT_MARKER = 'VIZOR_BENCH_RESULT '
+
+# Same as utils.metarig_data.LIBRARY_CACHE_ENV_VAR, which can't be imported before Rigify is set up
+METARIG_CACHE_ENV_VAR = 'VIZOR_METARIG_CACHE'
+
+DEFAULT_TOLERANCES = {'time': 0.25, 'memory': 0.15, 'count': 0.0}
+
+# Absolute slack for timings in seconds, so that timer noise on very cheap steps isn't reported
+TIME_SLACK = 0.0005
+
+# Metrics recorded for information only, too noisy to compare against a baseline
+INFO_SUFFIXES = ('estimate_ms',)
+
+
+##############################
+# Feature set and templates
+
+def ensure_rigify():
+    import addon_utils
+
+    if 'rigify' not in bpy.context.preferences.addons:
+        addon_utils.enable('rigify', default_set=True)
+
+
+def find_feature_set_package() -> str:
+    """Find the name under which Rigify imported this checkout."""
+    ensure_rigify()
+
+    init_path = os.path.realpath(os.path.join(REPO_ROOT, '__init__.py'))
+
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, '__file__', None)
+        if file and os.path.realpath(file) == init_path:
+            return name
+
+    raise RuntimeError(f"{REPO_ROOT} is not installed and enabled as a Rigify feature set")
+
+
+def import_feature_set_module(name: str):
+    """Import a module of this checkout, like 'utils.budget', under the package Rigify loaded it as."""
+    return importlib.import_module(f'{find_feature_set_package()}.{name}')
+
+
+def add_metarig(template: str) -> bpy.types.Object:
+    """Add a metarig from a template the way the Rigify Add menu does."""
+    category, stem = template.split('/')
+    module = import_feature_set_module(f'metarigs.{category}.{stem}')
+
+    bpy.ops.object.armature_add()
+    obj = bpy.context.active_object
+    obj.name = 'metarig'
+    obj.data.name = 'metarig'
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = obj.data.edit_bones
+    edit_bones.remove(edit_bones[0])
+
+    module.create(obj)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return obj
+
+
+def generate_rig(metarig: bpy.types.Object):
+    """Generate the rig like rigify.generate.generate_rig, but return the generator for inspection."""
+    from rigify import base_generate
+    from rigify.generate import Generator
+
+    rest_backup = metarig.data.pose_position
+    metarig.data.pose_position = 'REST'
+
+    try:
+        generator = Generator(bpy.context, metarig)
+        base_generate.BaseGenerator.instance = generator
+        generator.generate()
+    finally:
+        base_generate.BaseGenerator.instance = None
+        metarig.data.pose_position = rest_backup
+
+    return generator
+
+
+def clear_scene():
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+##############################
+# Measurements
+
+class Timer:
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed = time.perf_counter() - self.start
+
+
+def peak_memory_mb() -> float | None:
+    """Peak resident memory of this process in MiB."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def count_drivers() -> int:
+    ids = [*bpy.data.objects, *bpy.data.meshes, *bpy.data.curves, *bpy.data.armatures, *bpy.data.shape_keys]
+    return sum(len(id_data.animation_data.drivers) for id_data in ids if id_data.animation_data)
+
+
+def rig_counts(rig: bpy.types.Object) -> dict[str, int]:
+    """Count the bones by prefix, and the constraints, drivers and modifiers in the file."""
+    counts = {'bones': 0, 'bones_org': 0, 'bones_mch': 0, 'bones_def': 0, 'bones_ctrl': 0}
+
+    for bone in rig.data.bones:
+        prefix = bone.name.split('-', 1)[0] if '-' in bone.name else ''
+        counts['bones'] += 1
+        counts[{'ORG': 'bones_org', 'MCH': 'bones_mch', 'DEF': 'bones_def'}.get(prefix, 'bones_ctrl')] += 1
+
+    counts['constraints'] = sum(len(pbone.constraints) for pbone in rig.pose.bones)
+    counts['drivers'] = count_drivers()
+    counts['modifiers'] = sum(len(obj.modifiers) for obj in bpy.data.objects)
+    counts['objects'] = len(bpy.data.objects)
+    return counts
+
+
+##############################
+# Running workers
+
+def script_args() -> list[str]:
+    return sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+
+def report_result(record: dict):
+    """Hand a worker result to the suite process."""
+    print(RESULT_MARKER + json.dumps(record), flush=True)
+
+
+def run_worker(script: str, template: str, extra_args: list[str] = ()) -> dict:
+    """Run one template in a fresh background Blender, returning its result or error record."""
+    cmd = [bpy.app.binary_path, '-b', '--python-exit-code', '1', '--python', script,
+           '--', '--worker', template, *extra_args]
+
+    # Every worker starts with an empty metarig library cache of its own, outside the user data
+    with tempfile.TemporaryDirectory(prefix='vizor_bench_') as cache_dir:
+        env = dict(os.environ, **{METARIG_CACHE_ENV_VAR: cache_dir})
+        proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+
+    tail = (proc.stderr or proc.stdout).strip().splitlines()[-20:]
+    return {'error': f"worker exited with code {proc.returncode}", 'log': tail}
+
+
+def run_suite(script: str, templates: list[str], extra_args: list[str] = ()) -> dict[str, dict]:
+    results = {}
+
+    for template in templates:
+        print(f"{template} ...", flush=True)
+        results[template] = record = run_worker(script, template, extra_args)
+        if 'error' in record:
+            print(f"  FAILED: {record['error']}", *record.get('log', ()), sep='\n  ')
+
+    return results
+
+
+##############################
+# Results and baselines
+
+def add_suite_arguments(parser: argparse.ArgumentParser, default_output: str):
+    parser.add_argument('--worker', metavar='TEMPLATE', help=argparse.SUPPRESS)
+    parser.add_argument('--templates', nargs='*', help="template module names to run, default all")
+    parser.add_argument('--output', default=default_output, help="results file to write")
+    parser.add_argument('--baseline', help="results file to compare against")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="write the results to the baseline file instead of comparing")
+    parser.add_argument('--time-tolerance', type=float, default=DEFAULT_TOLERANCES['time'],
+                        help="allowed relative increase of timings")
+    parser.add_argument('--memory-tolerance', type=float, default=DEFAULT_TOLERANCES['memory'],
+                        help="allowed relative increase of peak memory")
+    parser.add_argument('--count-tolerance', type=float, default=DEFAULT_TOLERANCES['count'],
+                        help="allowed relative increase of bone, constraint, driver and modifier counts")
+
+
+def metric_kind(name: str) -> str:
+    if name.endswith(INFO_SUFFIXES):
+        return 'info'
+    if name.endswith('_time') or name.endswith('_ms'):
+        return 'time'
+    if name.endswith('_memory_mb'):
+        return 'memory'
+    return 'count'
+
+
+def metric_slack(name: str) -> float:
+    if metric_kind(name) != 'time':
+        return 0.0
+    return TIME_SLACK * 1000 if name.endswith('_ms') else TIME_SLACK
+
+
+def flatten_metrics(record: dict, prefix='') -> dict[str, float]:
+    metrics = {}
+
+    for key, value in record.items():
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, f'{prefix}{key}.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[prefix + key] = value
+
+    return metrics
+
+
+def compare_results(results: dict[str, dict], baseline: dict[str, dict],
+                    tolerances: dict[str, float]) -> list[str]:
+    """Return a description of every metric that got worse than the baseline allows."""
+    regressions = []
+
+    for template in results.keys() - baseline.keys():
+        regressions.append(f"{template}: no baseline record, rerun with --update-baseline")
+
+    for template, base_record in baseline.items():
+        record = results.get(template)
+
+        if record is None:
+            continue
+        if 'error' in record:
+            regressions.append(f"{template}: {record['error']}")
+            continue
+
+        metrics = flatten_metrics(record)
+
+        for name, base_value in flatten_metrics(base_record).items():
+            value = metrics.get(name)
+            if value is None or metric_kind(name) == 'info':
+                continue
+
+            limit = base_value * (1 + tolerances[metric_kind(name)]) + metric_slack(name)
+            if value > limit:
+                regressions.append(f"{template}: {name} {value:g} > {base_value:g} (limit {limit:g})")
+
+    return regressions
+
+
+def write_results(path: str, suite: str, results: dict[str, dict]):
+    with open(path, 'w', encoding='utf-8') as fp:
+        json.dump({'suite': suite, 'blender': bpy.app.version_string, 'results': results}, fp, indent=2)
+        fp.write('\n')
+
+
+def read_results(path: str) -> dict[str, dict]:
+    with open(path, encoding='utf-8') as fp:
+        return json.load(fp)['results']
+
+
+def main(suite: str, script: str, parser: argparse.ArgumentParser,
+         worker: Callable[[str, argparse.Namespace], dict],
+         worker_args: Callable[[argparse.Namespace], list[str]] = lambda args: [],
+         list_items: Callable[[argparse.Namespace], list[str]] = lambda args: list_templates(args.templates)):
+    """Run a benchmark suite or a single worker, depending on the command line."""
+    args = parser.parse_args(script_args())
+
+    if args.worker:
+        report_result(worker(args.worker, args))
+        return
+
+    results = run_suite(script, list_items(args), worker_args(args))
+
+    write_results(args.output, suite, results)
+    print(f"Results written to {args.output}")
+
+    failed = [template for template, record in results.items() if 'error' in record]
+
+    if args.baseline and args.update_baseline:
+        write_results(args.baseline, suite, results)
+        print(f"Baseline written to {args.baseline}")
+
+    elif args.baseline:
+        if not os.path.isfile(args.baseline):
+            print(f"Baseline {args.baseline} doesn't exist, create it with --update-baseline")
+            sys.exit(1)
+
+        tolerances = {'time': args.time_tolerance, 'memory': args.memory_tolerance, 'count': args.count_tolerance}
+        regressions = compare_results(results, read_results(args.baseline), tolerances)
+
+        for line in regressions:
+            print("REGRESSION", line)
+
+        if regressions:
+            sys.exit(1)
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,26 @@
+"""
+Metarig template listing shared by the benchmarks and the batch generation tool.
+
+Kept free of bpy, so that it can also be imported by the scripts that manage Blender processes
+from a plain Python interpreter.
+"""
+
+import os
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEMPLATE_CATEGORIES = ('Vizor Humans', 'Vizor Animals')
+
+
+def list_templates(names: list[str] | None = None) -> list[str]:
+    """List the metarig templates as 'Category/module' ids, optionally filtered by module name."""
+    templates = []
+
+    for category in TEMPLATE_CATEGORIES:
+        for file in sorted(os.listdir(os.path.join(REPO_ROOT, 'metarigs', category))):
+            stem, ext = os.path.splitext(file)
+            if ext == '.py' and not stem.startswith(('_', '.')) and (not names or stem in names):
+                templates.append(f'{category}/{stem}')
+
+    return templates
@@ -0,0 +1,60 @@
+"""
+Headless generation benchmark for the Vizor metarig templates.
+
+For every template in metarigs/Vizor Humans and metarigs/Vizor Animals, add the metarig, generate
+the rig with Rigify, and record the wall time, peak memory, and the bone, constraint, driver and
+modifier counts of the result. Every worker uses a fresh metarig library cache in a temporary
+directory, so the metarig creation is timed both cold, building it and writing the cache, and
+warm, appending it from the cache:
+
+    blender -b --python-exit-code 1 --python benchmarks/generation.py -- \\
+        --output generation_results.json --baseline benchmarks/generation_baseline.json
+
+Exits with code 1 if a template fails to generate, if a metric exceeds the baseline by more than
+its tolerance, or if the baseline doesn't exist or has no record of a template. The baseline is
+not committed, since timings and memory are machine specific: run once with --update-baseline to
+store the current results as the baseline.
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_common  # noqa: E402
+
+
+def run_template(template: str, _args: argparse.Namespace) -> dict:
+    # The worker starts with an empty metarig library cache: the first add builds the metarig
+    # from its data file and writes the cache, the second one appends it from the cache
+    bench_common.clear_scene()
+
+    with bench_common.Timer() as cold_timer:
+        bench_common.add_metarig(template)
+
+    bench_common.clear_scene()
+
+    with bench_common.Timer() as warm_timer:
+        metarig = bench_common.add_metarig(template)
+
+    with bench_common.Timer() as generate_timer:
+        rig = bench_common.generate_rig(metarig).obj
+
+    return {
+        'create_cold_time': cold_timer.elapsed,
+        'create_warm_time': warm_timer.elapsed,
+        'generate_time': generate_timer.elapsed,
+        'peak_memory_mb': bench_common.peak_memory_mb(),
+        **bench_common.rig_counts(rig),
+    }
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='generation.py', description="Vizor rig generation benchmark")
+    bench_common.add_suite_arguments(parser, 'generation_results.json')
+    return parser
+
+
+if __name__ == '__main__':
+    bench_common.main('generation', os.path.abspath(__file__), make_parser(), run_template)
@@ -0,0 +1,247 @@
+"""
+Headless playback benchmark for the Vizor metarig templates.
+
+For every template, generate the rig, key a deterministic synthetic animation on every control,
+step through the frames and record the depsgraph evaluation time per frame:
+
+    blender -b --python-exit-code 1 --python benchmarks/playback.py -- \\
+        --output playback_results.json --baseline benchmarks/playback_baseline.json
+
+Exits with code 1 if a template fails, or if a metric exceeds the baseline by more than its
+tolerance. The baseline is machine specific and not committed: run once with --update-baseline to
+record it, checking against a missing baseline fails.
+
+The time is broken down per rig type by ablation. For all bones created by rigs of one type, the
+following are muted:
+
+- the constraints and drivers of the bones,
+- the hook modifiers of other objects, like the curves of spline tentacles, that use the bones,
+- the drivers of other objects, their data and their shape keys that read the bones.
+
+The frames are then stepped again, and the difference from the full evaluation is reported as
+'estimate_ms' of that type, clamped at zero. It is the difference of two noisy means, so it is
+recorded for information only and not compared against the baseline; the counts of the muted
+elements are.
+"""
+
+import bpy
+import os
+import sys
+import math
+import argparse
+import statistics
+
+from mathutils import Euler
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_common  # noqa: E402
+
+
+NON_CONTROL_PREFIXES = ('ORG-', 'MCH-', 'DEF-')
+
+ROTATION_AMPLITUDE = math.radians(20)
+LOCATION_AMPLITUDE = 0.02
+
+
+##############################
+# Rig type attribution
+
+def bone_rig_types(generator) -> dict[str, str]:
+    """Map the generated bone names to the rigify type of the rig that created them."""
+    from rigify.utils.naming import strip_org
+
+    metarig_bones = generator.metarig.pose.bones
+
+    def rig_type(rig):
+        return metarig_bones[strip_org(rig.base_bone)].rigify_type
+
+    result = {name: rig_type(rig) for name, rig in getattr(generator, 'bone_owners', {}).items() if rig}
+
+    for rig in generator.rig_list:
+        result.setdefault(rig.base_bone, rig_type(rig))
+
+    return result
+
+
+def bone_driver_prefix(name: str) -> str:
+    return f'pose.bones["{bpy.utils.escape_identifier(name)}"]'
+
+
+def mute_bones(rig: bpy.types.Object, bone_names: list[str]) -> list[tuple]:
+    """
+    Mute the constraints and drivers of the bones, and the hook modifiers and drivers of other
+    objects that read them, returning the previous states.
+    """
+    budget = bench_common.import_feature_set_module('utils.budget')
+
+    names = set(bone_names)
+    prefixes = tuple(bone_driver_prefix(name) for name in bone_names)
+    saved = []
+
+    def disable(item, attr, value):
+        saved.append((item, attr, getattr(item, attr)))
+        setattr(item, attr, value)
+
+    def reads_bones(fcurve):
+        return any(
+            target.id == rig and (target.bone_target in names or target.data_path.startswith(prefixes))
+            for var in fcurve.driver.variables for target in var.targets
+        )
+
+    for name in bone_names:
+        for con in rig.pose.bones[name].constraints:
+            disable(con, 'mute', True)
+
+    if rig.animation_data:
+        for fcurve in rig.animation_data.drivers:
+            if fcurve.data_path.startswith(prefixes):
+                disable(fcurve, 'mute', True)
+
+    for obj in bpy.data.objects:
+        if obj == rig:
+            continue
+
+        for mod in obj.modifiers:
+            if mod.type == 'HOOK' and mod.object == rig and mod.subtarget in names:
+                disable(mod, 'show_viewport', False)
+
+        for id_data in budget.driver_sources(obj):
+            if id_data.animation_data:
+                for fcurve in id_data.animation_data.drivers:
+                    if reads_bones(fcurve):
+                        disable(fcurve, 'mute', True)
+
+    return saved
+
+
+def restore_mute(saved: list[tuple]):
+    for item, attr, value in reversed(saved):
+        setattr(item, attr, value)
+
+
+##############################
+# Synthetic animation
+
+def animate_controls(rig: bpy.types.Object, frame_start: int, frame_end: int, key_step: int) -> int:
+    """Key a smooth pseudo-random rotation and location on every control bone."""
+    action = bpy.data.actions.new('VizorBenchmark')
+    rig.animation_data_create().action = action
+
+    frames = list(range(frame_start, frame_end + 1, key_step))
+    controls = 0
+
+    for index, pbone in enumerate(rig.pose.bones):
+        if pbone.name.startswith(NON_CONTROL_PREFIXES):
+            continue
+
+        controls += 1
+        phases = [index * 0.37 + axis * 1.7 for axis in range(3)]
+        channels = {}
+
+        angles = [[ROTATION_AMPLITUDE * math.sin(frame * 0.1 + phase) for phase in phases] for frame in frames]
+
+        if pbone.rotation_mode == 'QUATERNION':
+            quats = [Euler(euler).to_quaternion() for euler in angles]
+            for axis in range(4):
+                channels['rotation_quaternion', axis] = [quat[axis] for quat in quats]
+        elif pbone.rotation_mode != 'AXIS_ANGLE':
+            for axis in range(3):
+                if not pbone.lock_rotation[axis]:
+                    channels['rotation_euler', axis] = [euler[axis] for euler in angles]
+
+        for axis in range(3):
+            if not pbone.lock_location[axis]:
+                channels['location', axis] = [
+                    LOCATION_AMPLITUDE * math.sin(frame * 0.13 + phases[axis]) for frame in frames
+                ]
+
+        for (prop, axis), values in channels.items():
+            fcurve = action.fcurves.new(f'{bone_driver_prefix(pbone.name)}.{prop}', index=axis,
+                                        action_group=pbone.name)
+            fcurve.keyframe_points.add(len(frames))
+            fcurve.keyframe_points.foreach_set('co', [v for pair in zip(frames, values) for v in pair])
+            fcurve.update()
+
+    return controls
+
+
+##############################
+# Measurement
+
+def time_frames(scene: bpy.types.Scene, frame_start: int, frame_end: int) -> list[float]:
+    scene.frame_set(frame_start)
+
+    times = []
+
+    for frame in range(frame_start, frame_end + 1):
+        with bench_common.Timer() as timer:
+            scene.frame_set(frame)
+        times.append(timer.elapsed)
+
+    return times
+
+
+def run_template(template: str, args: argparse.Namespace) -> dict:
+    bench_common.clear_scene()
+
+    metarig = bench_common.add_metarig(template)
+    generator = bench_common.generate_rig(metarig)
+    rig = generator.obj
+
+    scene = bpy.context.scene
+    frame_start, frame_end = 1, args.frames
+    scene.frame_start, scene.frame_end = frame_start, frame_end
+
+    controls = animate_controls(rig, frame_start, frame_end, args.key_step)
+
+    times = time_frames(scene, frame_start, frame_end)
+    frame_ms = statistics.mean(times) * 1000
+
+    type_bones: dict[str, list[str]] = {}
+    for name, rig_type in bone_rig_types(generator).items():
+        if name in rig.pose.bones:
+            type_bones.setdefault(rig_type, []).append(name)
+
+    rig_types = {}
+
+    for rig_type, bone_names in sorted(type_bones.items()):
+        saved = mute_bones(rig, bone_names)
+        try:
+            muted_ms = statistics.mean(time_frames(scene, frame_start, frame_end)) * 1000
+        finally:
+            restore_mute(saved)
+
+        rig_types[rig_type] = {
+            'estimate_ms': max(0.0, frame_ms - muted_ms),
+            'bones': len(bone_names),
+            'constraints': sum(isinstance(item, bpy.types.Constraint) for item, _, _ in saved),
+            'drivers': sum(isinstance(item, bpy.types.FCurve) for item, _, _ in saved),
+            'modifiers': sum(isinstance(item, bpy.types.Modifier) for item, _, _ in saved),
+        }
+
+    return {
+        'frames': len(times),
+        'controls': controls,
+        'frame_ms': frame_ms,
+        'median_frame_ms': statistics.median(times) * 1000,
+        'max_frame_ms': max(times) * 1000,
+        'peak_memory_mb': bench_common.peak_memory_mb(),
+        'rig_types': rig_types,
+    }
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='playback.py', description="Vizor rig playback benchmark")
+    bench_common.add_suite_arguments(parser, 'playback_results.json')
+    parser.add_argument('--frames', type=int, default=100, help="number of frames to evaluate")
+    parser.add_argument('--key-step', type=int, default=10, help="frames between synthetic keys")
+    return parser
+
+
+def worker_args(args: argparse.Namespace) -> list[str]:
+    return ['--frames', str(args.frames), '--key-step', str(args.key_step)]
+
+
+if __name__ == '__main__':
+    bench_common.main('playback', os.path.abspath(__file__), make_parser(), run_template, worker_args)
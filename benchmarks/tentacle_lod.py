@@ -0,0 +1,90 @@
+"""
+Level of detail benchmark for the spline tentacle rig.
+
+Generates one long spline tentacle with FK controls and shape key radius scaling, keys the same
+synthetic animation as the playback benchmark, and compares the depsgraph evaluation time per
+frame without the level of detail switch and at both of its levels:
+
+    blender -b --python-exit-code 1 --python benchmarks/tentacle_lod.py -- \\
+        --bones 24 --extra-controls 4 --output tentacle_lod_results.json
+
+'NO_SWITCH' generates the tentacle without the switch, to check that the switch adds nothing to
+the full level of detail. 'LOD_1' applies the low level with the switch operator of the generated
+rig UI script.
+"""
+
+import bpy
+import os
+import sys
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_common  # noqa: E402
+import playback  # noqa: E402
+import tentacle_radius  # noqa: E402
+
+
+LOD_MODES = ('NO_SWITCH', 'LOD_0', 'LOD_1')
+
+
+def set_low_lod(rig: bpy.types.Object):
+    # The level of detail is switched by the operator of the generated rig UI script, not by a property
+    set_lod = getattr(bpy.ops.pose, 'rigify_spline_tentacle_set_lod_' + rig.data['rig_id'])
+    bpy.context.view_layer.objects.active = rig
+
+    for pbone in rig.pose.bones:
+        if 'lod' in pbone:
+            set_lod(prop_bone=pbone.name, level=1)
+
+
+def run_mode(mode: str, args: argparse.Namespace) -> dict:
+    bench_common.clear_scene()
+
+    metarig = tentacle_radius.add_tentacle_metarig('SHAPE_KEYS', args)
+    params = metarig.pose.bones['tentacle01'].rigify_parameters
+    params.sik_fk_controls = True
+    params.sik_lod_switch = mode != 'NO_SWITCH'
+
+    rig = bench_common.generate_rig(metarig).obj
+    counts = bench_common.rig_counts(rig)
+
+    if mode == 'LOD_1':
+        set_low_lod(rig)
+
+    scene = bpy.context.scene
+    frame_start, frame_end = 1, args.frames
+    scene.frame_start, scene.frame_end = frame_start, frame_end
+
+    controls = playback.animate_controls(rig, frame_start, frame_end, args.key_step)
+    scaled = tentacle_radius.animate_scale(rig, frame_start, frame_end, args.key_step)
+
+    times = playback.time_frames(scene, frame_start, frame_end)
+
+    return {
+        'controls': controls,
+        'scaled_controls': scaled,
+        'frame_ms': statistics.mean(times) * 1000,
+        'median_frame_ms': statistics.median(times) * 1000,
+        'max_frame_ms': max(times) * 1000,
+        'counts': counts,
+    }
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='tentacle_lod.py', description="Spline tentacle level of detail benchmark")
+    bench_common.add_suite_arguments(parser, 'tentacle_lod_results.json')
+    parser.add_argument('--modes', nargs='*', choices=LOD_MODES, help="modes to run, default all")
+    parser.add_argument('--bones', type=int, default=24, help="number of bones in the tentacle")
+    parser.add_argument('--length', type=float, default=2.0, help="length of the tentacle")
+    parser.add_argument('--extra-controls', type=int, default=4, help="extra start and end controls each")
+    parser.add_argument('--mid-controls', type=int, default=3, help="middle controls")
+    parser.add_argument('--frames', type=int, default=100, help="number of frames to evaluate")
+    parser.add_argument('--key-step', type=int, default=10, help="frames between synthetic keys")
+    return parser
+
+
+if __name__ == '__main__':
+    bench_common.main('tentacle_lod', os.path.abspath(__file__), make_parser(), run_mode,
+                      tentacle_radius.worker_args, lambda args: list(args.modes or LOD_MODES))
@@ -0,0 +1,155 @@
+"""
+Radius scaling benchmark for the spline tentacle rig.
+
+Generates one long spline tentacle with many extra start and end controls for every radius
+scaling mode, keys a synthetic animation including control scale, and compares the generated
+drivers, shape keys and constraints and the depsgraph evaluation time per frame:
+
+    blender -b --python-exit-code 1 --python benchmarks/tentacle_radius.py -- \\
+        --bones 24 --extra-controls 4 --output tentacle_radius_results.json
+
+The 'NONE' item generates the same tentacle without radius scaling as a reference.
+"""
+
+import bpy
+import os
+import sys
+import math
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_common  # noqa: E402
+import playback  # noqa: E402
+
+
+RADIUS_MODES = ('NONE', 'SHAPE_KEYS', 'SCALE_RAMP')
+
+SCALE_AMPLITUDE = 0.3
+
+
+##############################
+# Test rig
+
+def add_tentacle_metarig(mode: str, args: argparse.Namespace) -> bpy.types.Object:
+    bench_common.ensure_rigify()
+
+    bpy.ops.object.armature_add()
+    obj = bpy.context.active_object
+    obj.name = 'metarig'
+    obj.data.name = 'metarig'
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = obj.data.edit_bones
+    edit_bones.remove(edit_bones[0])
+
+    length = args.length / args.bones
+    parent = None
+
+    for i in range(args.bones):
+        bone = edit_bones.new(f'tentacle{i + 1:02d}')
+        bone.head = (0, 0, i * length)
+        bone.tail = (0, 0, (i + 1) * length)
+        bone.parent = parent
+        bone.use_connect = parent is not None
+        parent = bone
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    pbone = obj.pose.bones['tentacle01']
+    pbone.rigify_type = 'vizor.limbs.spline_tentacle'
+
+    params = pbone.rigify_parameters
+    params.sik_start_controls = args.extra_controls
+    params.sik_end_controls = args.extra_controls
+    params.sik_mid_controls = args.mid_controls
+    params.sik_radius_scaling = mode != 'NONE'
+    if mode != 'NONE':
+        params.sik_radius_mode = mode
+
+    return obj
+
+
+def animate_scale(rig: bpy.types.Object, frame_start: int, frame_end: int, key_step: int) -> int:
+    """Key a smooth pseudo-random uniform scale on every control bone with unlocked scale."""
+    action = rig.animation_data.action
+    frames = list(range(frame_start, frame_end + 1, key_step))
+    controls = 0
+
+    for index, pbone in enumerate(rig.pose.bones):
+        if pbone.name.startswith(playback.NON_CONTROL_PREFIXES) or all(pbone.lock_scale):
+            continue
+
+        controls += 1
+        values = [1 + SCALE_AMPLITUDE * math.sin(frame * 0.07 + index * 0.61) for frame in frames]
+
+        for axis in range(3):
+            if pbone.lock_scale[axis]:
+                continue
+
+            fcurve = action.fcurves.new(f'{playback.bone_driver_prefix(pbone.name)}.scale', index=axis,
+                                        action_group=pbone.name)
+            fcurve.keyframe_points.add(len(frames))
+            fcurve.keyframe_points.foreach_set('co', [v for pair in zip(frames, values) for v in pair])
+            fcurve.update()
+
+    return controls
+
+
+##############################
+# Measurement
+
+def run_mode(mode: str, args: argparse.Namespace) -> dict:
+    bench_common.clear_scene()
+
+    metarig = add_tentacle_metarig(mode, args)
+
+    with bench_common.Timer() as timer:
+        rig = bench_common.generate_rig(metarig).obj
+
+    counts = bench_common.rig_counts(rig)
+    counts['shape_keys'] = sum(len(key.key_blocks) - 1 for key in bpy.data.shape_keys)
+
+    scene = bpy.context.scene
+    frame_start, frame_end = 1, args.frames
+    scene.frame_start, scene.frame_end = frame_start, frame_end
+
+    controls = playback.animate_controls(rig, frame_start, frame_end, args.key_step)
+    scaled = animate_scale(rig, frame_start, frame_end, args.key_step)
+
+    times = playback.time_frames(scene, frame_start, frame_end)
+
+    return {
+        'generate_time': timer.elapsed,
+        'controls': controls,
+        'scaled_controls': scaled,
+        'frame_ms': statistics.mean(times) * 1000,
+        'median_frame_ms': statistics.median(times) * 1000,
+        'max_frame_ms': max(times) * 1000,
+        'counts': counts,
+    }
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='tentacle_radius.py', description="Spline tentacle radius benchmark")
+    bench_common.add_suite_arguments(parser, 'tentacle_radius_results.json')
+    parser.add_argument('--modes', nargs='*', choices=RADIUS_MODES, help="radius modes to run, default all")
+    parser.add_argument('--bones', type=int, default=24, help="number of bones in the tentacle")
+    parser.add_argument('--length', type=float, default=2.0, help="length of the tentacle")
+    parser.add_argument('--extra-controls', type=int, default=4, help="extra start and end controls each")
+    parser.add_argument('--mid-controls', type=int, default=3, help="middle controls")
+    parser.add_argument('--frames', type=int, default=100, help="number of frames to evaluate")
+    parser.add_argument('--key-step', type=int, default=10, help="frames between synthetic keys")
+    return parser
+
+
+def worker_args(args: argparse.Namespace) -> list[str]:
+    return ['--bones', str(args.bones), '--length', str(args.length),
+            '--extra-controls', str(args.extra_controls), '--mid-controls', str(args.mid_controls),
+            '--frames', str(args.frames), '--key-step', str(args.key_step)]
+
+
+if __name__ == '__main__':
+    bench_common.main('tentacle_radius', os.path.abspath(__file__), make_parser(), run_mode, worker_args,
+                      lambda args: list(args.modes or RADIUS_MODES))
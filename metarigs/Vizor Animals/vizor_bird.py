@@ -1,4048 +1,10 @@
-import bpy
+import os
 
-from rna_prop_ui import rna_idprop_ui_create
-
-from mathutils import Color
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'vizor_bird.json')
 
 
 def create(obj):  # noqa
-    # generated by rigify.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    for i in range(6):
-        arm.rigify_colors.add()
-
-    arm.rigify_colors[0].name = "Root"
-    arm.rigify_colors[0].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[0].normal = Color((0.4353, 0.1843, 0.4157))
-    arm.rigify_colors[0].select = Color((0.3137, 0.7843, 1.0000))
-    arm.rigify_colors[0].standard_colors_lock = True
-    arm.rigify_colors[1].name = "IK"
-    arm.rigify_colors[1].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[1].normal = Color((0.6039, 0.0000, 0.0000))
-    arm.rigify_colors[1].select = Color((0.3137, 0.7843, 1.0000))
-    arm.rigify_colors[1].standard_colors_lock = True
-    arm.rigify_colors[2].name = "Special"
-    arm.rigify_colors[2].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[2].normal = Color((0.9569, 0.7882, 0.0471))
-    arm.rigify_colors[2].select = Color((0.3137, 0.7843, 1.0000))
-    arm.rigify_colors[2].standard_colors_lock = True
-    arm.rigify_colors[3].name = "Tweak"
-    arm.rigify_colors[3].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[3].normal = Color((0.0392, 0.2118, 0.5804))
-    arm.rigify_colors[3].select = Color((0.3137, 0.7843, 1.0000))
-    arm.rigify_colors[3].standard_colors_lock = True
-    arm.rigify_colors[4].name = "FK"
-    arm.rigify_colors[4].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[4].normal = Color((0.1176, 0.5686, 0.0353))
-    arm.rigify_colors[4].select = Color((0.3137, 0.7843, 1.0000))
-    arm.rigify_colors[4].standard_colors_lock = True
-    arm.rigify_colors[5].name = "Extra"
-    arm.rigify_colors[5].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[5].normal = Color((0.9686, 0.2510, 0.0941))
-    arm.rigify_colors[5].select = Color((0.3137, 0.7843, 1.0000))
-    arm.rigify_colors[5].standard_colors_lock = True
-
-    bone_collections = {}
-
-    for bcoll in list(arm.collections_all):
-        arm.collections.remove(bcoll)
-
-    def add_bone_collection(name, *, parent=None, ui_row=0, ui_title='', sel_set=False, color_set_id=0):
-        new_bcoll = arm.collections.new(name, parent=bone_collections.get(parent))
-        new_bcoll.rigify_ui_row = ui_row
-        new_bcoll.rigify_ui_title = ui_title
-        new_bcoll.rigify_sel_set = sel_set
-        new_bcoll.rigify_color_set_id = color_set_id
-        bone_collections[name] = new_bcoll
-
-    def assign_bone_collections(pose_bone, *coll_names):
-        assert not len(pose_bone.bone.collections)
-        for name in coll_names:
-            bone_collections[name].assign(pose_bone)
-
-    def assign_bone_collection_refs(params, attr_name, *coll_names):
-        ref_list = getattr(params, attr_name + '_coll_refs', None)
-        if ref_list is not None:
-            for name in coll_names:
-                ref_list.add().set_collection(bone_collections[name])
-
-    add_bone_collection('Face', ui_row=1, color_set_id=6)
-    add_bone_collection('Face (Tweak)', ui_row=2, ui_title='(Tweak)', color_set_id=4)
-    add_bone_collection('Spine', ui_row=4, color_set_id=3)
-    add_bone_collection('Spine (Tweak)', ui_row=5, ui_title='(Tweak)', color_set_id=4)
-    add_bone_collection('Wing.L (IK)', ui_row=7, color_set_id=5)
-    add_bone_collection('Wing.L (FK)', ui_row=9)
-    add_bone_collection('Wing.L (Tweak)', ui_row=8, ui_title='(Tweak)', color_set_id=4)
-    add_bone_collection('Wing.R (IK)', ui_row=7, color_set_id=5)
-    add_bone_collection('Wing.R (FK)', ui_row=9)
-    add_bone_collection('Wing.R (Tweak)', ui_row=8, ui_title='(Tweak)', color_set_id=4)
-    add_bone_collection('Leg.L (IK)', ui_row=14, color_set_id=2)
-    add_bone_collection('Leg.L (FK)', ui_row=15, color_set_id=5)
-    add_bone_collection('Leg.L (Tweak)', ui_row=16, color_set_id=4)
-    add_bone_collection('Leg.R (IK)', ui_row=14, color_set_id=2)
-    add_bone_collection('Leg.R (FK)', ui_row=15, color_set_id=5)
-    add_bone_collection('Leg.R (Tweak)', ui_row=16, color_set_id=4)
-    add_bone_collection('Claws.L', ui_row=17, color_set_id=6)
-    add_bone_collection('Claws.L (Tweak)', ui_row=18, color_set_id=4)
-    add_bone_collection('Claws.R', ui_row=17)
-    add_bone_collection('Claws.R (Tweak)', ui_row=18)
-    add_bone_collection('Feathers.L', ui_row=10)
-    add_bone_collection('Feathers.L (Tweak)', ui_row=11, color_set_id=6)
-    add_bone_collection('Feathers.R', ui_row=10)
-    add_bone_collection('Feathers.R (Tweak)', ui_row=11)
-    add_bone_collection('Tail', ui_row=12)
-    add_bone_collection('Root', ui_row=21, color_set_id=1)
-
-    bones = {}
-
-    bone = arm.edit_bones.new('spine.001')
-    bone.head = 0.0000, 0.0614, 0.3777
-    bone.tail = 0.0000, -0.0660, 0.3669
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.bbone_segments = 5
-    bones['spine.001'] = bone.name
-    bone = arm.edit_bones.new('tail.001')
-    bone.head = 0.0000, 0.0614, 0.3777
-    bone.tail = 0.0000, 0.1473, 0.3886
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.001']]
-    bone.bbone_segments = 5
-    bones['tail.001'] = bone.name
-    bone = arm.edit_bones.new('spine.002')
-    bone.head = 0.0000, -0.0660, 0.3669
-    bone.tail = 0.0000, -0.1888, 0.3690
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.001']]
-    bone.bbone_segments = 5
-    bones['spine.002'] = bone.name
-    bone = arm.edit_bones.new('pelvis.L')
-    bone.head = 0.0670, 0.0518, 0.3916
-    bone.tail = 0.0981, -0.0013, 0.2765
-    bone.roll = 1.2310
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.001']]
-    bones['pelvis.L'] = bone.name
-    bone = arm.edit_bones.new('pelvis.R')
-    bone.head = -0.0670, 0.0518, 0.3916
-    bone.tail = -0.0981, -0.0013, 0.2765
-    bone.roll = -1.2310
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.001']]
-    bones['pelvis.R'] = bone.name
-    bone = arm.edit_bones.new('tail.002')
-    bone.head = 0.0000, 0.1473, 0.3886
-    bone.tail = 0.0000, 0.2324, 0.4066
-    bone.roll = 0.0770
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['tail.001']]
-    bone.bbone_segments = 5
-    bones['tail.002'] = bone.name
-    bone = arm.edit_bones.new('neck.001')
-    bone.head = 0.0000, -0.1888, 0.3690
-    bone.tail = 0.0000, -0.2513, 0.3985
-    bone.roll = 0.0001
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bones['neck.001'] = bone.name
-    bone = arm.edit_bones.new('head.parent')
-    bone.head = 0.0000, -0.3420, 0.8127
-    bone.tail = 0.0000, -0.4516, 0.8184
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bones['head.parent'] = bone.name
-    bone = arm.edit_bones.new('shoulder.R')
-    bone.head = -0.0025, -0.1880, 0.4070
-    bone.tail = -0.0910, -0.1587, 0.4303
-    bone.roll = -2.0122
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bones['shoulder.R'] = bone.name
-    bone = arm.edit_bones.new('shoulder.L')
-    bone.head = 0.0025, -0.1880, 0.4070
-    bone.tail = 0.0910, -0.1587, 0.4303
-    bone.roll = 2.0122
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bones['shoulder.L'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.R')
-    bone.head = -0.0334, -0.1261, 0.4696
-    bone.tail = -0.0477, -0.0102, 0.4728
-    bone.roll = -3.0543
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.R'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.002.R')
-    bone.head = -0.0442, -0.1268, 0.4770
-    bone.tail = -0.0653, -0.0509, 0.4686
-    bone.roll = -3.0648
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.002.R'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.L')
-    bone.head = 0.0334, -0.1261, 0.4696
-    bone.tail = 0.0477, -0.0102, 0.4728
-    bone.roll = 3.0543
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.L'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.002.L')
-    bone.head = 0.0442, -0.1268, 0.4770
-    bone.tail = 0.0653, -0.0509, 0.4686
-    bone.roll = 3.0648
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.002.L'] = bone.name
-    bone = arm.edit_bones.new('thigh.L')
-    bone.head = 0.0996, 0.0010, 0.2645
-    bone.tail = 0.0996, 0.0390, 0.1471
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['pelvis.L']]
-    bones['thigh.L'] = bone.name
-    bone = arm.edit_bones.new('thigh.R')
-    bone.head = -0.0996, 0.0010, 0.2645
-    bone.tail = -0.0996, 0.0390, 0.1471
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['pelvis.R']]
-    bones['thigh.R'] = bone.name
-    bone = arm.edit_bones.new('tail.003')
-    bone.head = 0.0000, 0.2324, 0.4066
-    bone.tail = 0.0000, 0.3358, 0.4288
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['tail.002']]
-    bone.bbone_segments = 5
-    bones['tail.003'] = bone.name
-    bone = arm.edit_bones.new('DEF-skin_belly.005')
-    bone.head = 0.0000, 0.1964, 0.2431
-    bone.tail = 0.0000, 0.1056, 0.1989
-    bone.roll = 0.0770
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['tail.002']]
-    bone.bbone_segments = 5
-    bones['DEF-skin_belly.005'] = bone.name
-    bone = arm.edit_bones.new('neck.002')
-    bone.head = 0.0000, -0.2513, 0.3985
-    bone.tail = 0.0000, -0.3055, 0.4629
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['neck.001']]
-    bones['neck.002'] = bone.name
-    bone = arm.edit_bones.new('upper_arm.R')
-    bone.head = -0.0977, -0.1436, 0.4413
-    bone.tail = -0.2727, -0.0752, 0.4515
-    bone.roll = -2.7963
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.R']]
-    bones['upper_arm.R'] = bone.name
-    bone = arm.edit_bones.new('w_shoulder_feather.R')
-    bone.head = -0.0624, -0.2149, 0.4453
-    bone.tail = -0.0599, -0.1490, 0.4628
-    bone.roll = -2.9470
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.R']]
-    bone.bbone_segments = 5
-    bones['w_shoulder_feather.R'] = bone.name
-    bone = arm.edit_bones.new('upper_arm.L')
-    bone.head = 0.0977, -0.1436, 0.4413
-    bone.tail = 0.2727, -0.0752, 0.4515
-    bone.roll = 2.7963
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.L']]
-    bones['upper_arm.L'] = bone.name
-    bone = arm.edit_bones.new('w_shoulder_feather.L')
-    bone.head = 0.0624, -0.2149, 0.4453
-    bone.tail = 0.0599, -0.1490, 0.4628
-    bone.roll = 2.9470
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.L']]
-    bone.bbone_segments = 5
-    bones['w_shoulder_feather.L'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.001.R')
-    bone.head = -0.0477, -0.0102, 0.4728
-    bone.tail = -0.0535, 0.0368, 0.4741
-    bone.roll = -3.0543
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_body_feather.R']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.001.R'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.003.R')
-    bone.head = -0.0653, -0.0509, 0.4686
-    bone.tail = -0.1066, 0.0973, 0.4522
-    bone.roll = -3.0648
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_body_feather.002.R']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.003.R'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.001.L')
-    bone.head = 0.0477, -0.0102, 0.4728
-    bone.tail = 0.0535, 0.0368, 0.4741
-    bone.roll = 3.0543
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_body_feather.L']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.001.L'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.003.L')
-    bone.head = 0.0653, -0.0509, 0.4686
-    bone.tail = 0.1066, 0.0973, 0.4522
-    bone.roll = 3.0648
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_body_feather.002.L']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.003.L'] = bone.name
-    bone = arm.edit_bones.new('shin.L')
-    bone.head = 0.0996, 0.0390, 0.1471
-    bone.tail = 0.0996, 0.0128, 0.0322
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thigh.L']]
-    bones['shin.L'] = bone.name
-    bone = arm.edit_bones.new('shin.R')
-    bone.head = -0.0996, 0.0390, 0.1471
-    bone.tail = -0.0996, 0.0128, 0.0322
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thigh.R']]
-    bones['shin.R'] = bone.name
-    bone = arm.edit_bones.new('t_feather.L')
-    bone.head = 0.0211, 0.1856, 0.4274
-    bone.tail = 0.0697, 0.2808, 0.4256
-    bone.roll = 0.0413
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['tail.003']]
-    bone.bbone_segments = 5
-    bones['t_feather.L'] = bone.name
-    bone = arm.edit_bones.new('t_feather.R')
-    bone.head = -0.0211, 0.1856, 0.4274
-    bone.tail = -0.0697, 0.2808, 0.4256
-    bone.roll = -0.0413
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['tail.003']]
-    bone.bbone_segments = 5
-    bones['t_feather.R'] = bone.name
-    bone = arm.edit_bones.new('t_feather.L.001')
-    bone.head = 0.0165, 0.2096, 0.4265
-    bone.tail = 0.0390, 0.3196, 0.4253
-    bone.roll = 0.0124
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['tail.003']]
-    bone.bbone_segments = 5
-    bones['t_feather.L.001'] = bone.name
-    bone = arm.edit_bones.new('t_feather.R.001')
-    bone.head = -0.0165, 0.2096, 0.4265
-    bone.tail = -0.0390, 0.3196, 0.4253
-    bone.roll = -0.0124
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['tail.003']]
-    bone.bbone_segments = 5
-    bones['t_feather.R.001'] = bone.name
-    bone = arm.edit_bones.new('t_feather')
-    bone.head = -0.0028, 0.2035, 0.4251
-    bone.tail = 0.0006, 0.3302, 0.4246
-    bone.roll = 0.0055
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['tail.003']]
-    bone.bbone_segments = 5
-    bones['t_feather'] = bone.name
-    bone = arm.edit_bones.new('DEF-skin_belly.006')
-    bone.head = 0.0000, 0.1056, 0.1989
-    bone.tail = 0.0000, -0.0089, 0.1750
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['DEF-skin_belly.005']]
-    bone.bbone_segments = 5
-    bones['DEF-skin_belly.006'] = bone.name
-    bone = arm.edit_bones.new('neck.003')
-    bone.head = 0.0000, -0.3055, 0.4629
-    bone.tail = 0.0000, -0.2870, 0.5946
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['neck.002']]
-    bones['neck.003'] = bone.name
-    bone = arm.edit_bones.new('forearm.R')
-    bone.head = -0.2727, -0.0752, 0.4515
-    bone.tail = -0.5110, -0.1581, 0.4000
-    bone.roll = -3.1341
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bones['forearm.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.R')
-    bone.head = -0.2374, -0.0774, 0.4558
-    bone.tail = -0.2450, -0.0188, 0.4432
-    bone.roll = -3.1208
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.003.R')
-    bone.head = -0.1548, -0.1113, 0.4468
-    bone.tail = -0.1662, -0.0497, 0.4453
-    bone.roll = -3.0638
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.003.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.006.R')
-    bone.head = -0.0995, -0.1185, 0.4494
-    bone.tail = -0.1159, -0.0488, 0.4473
-    bone.roll = -3.0560
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.006.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.009.R')
-    bone.head = -0.1141, -0.2182, 0.4337
-    bone.tail = -0.1569, -0.1605, 0.4574
-    bone.roll = -3.0899
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.009.R'] = bone.name
-    bone = arm.edit_bones.new('w_shoulder_feather.001.R')
-    bone.head = -0.0599, -0.1490, 0.4628
-    bone.tail = -0.0575, -0.0832, 0.4803
-    bone.roll = -2.9470
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_shoulder_feather.R']]
-    bone.bbone_segments = 5
-    bones['w_shoulder_feather.001.R'] = bone.name
-    bone = arm.edit_bones.new('forearm.L')
-    bone.head = 0.2727, -0.0752, 0.4515
-    bone.tail = 0.5110, -0.1581, 0.4000
-    bone.roll = 3.1341
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bones['forearm.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.L')
-    bone.head = 0.2374, -0.0774, 0.4558
-    bone.tail = 0.2450, -0.0188, 0.4432
-    bone.roll = 3.1208
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.003.L')
-    bone.head = 0.1548, -0.1113, 0.4468
-    bone.tail = 0.1662, -0.0497, 0.4453
-    bone.roll = 3.0638
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.003.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.006.L')
-    bone.head = 0.0995, -0.1185, 0.4494
-    bone.tail = 0.1159, -0.0488, 0.4473
-    bone.roll = 3.0560
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.006.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.009.L')
-    bone.head = 0.1141, -0.2182, 0.4337
-    bone.tail = 0.1569, -0.1605, 0.4574
-    bone.roll = 3.0899
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.009.L'] = bone.name
-    bone = arm.edit_bones.new('w_shoulder_feather.001.L')
-    bone.head = 0.0599, -0.1490, 0.4628
-    bone.tail = 0.0575, -0.0832, 0.4803
-    bone.roll = 2.9470
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_shoulder_feather.L']]
-    bone.bbone_segments = 5
-    bones['w_shoulder_feather.001.L'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.004.R')
-    bone.head = -0.1066, 0.0973, 0.4522
-    bone.tail = -0.1287, 0.1768, 0.4434
-    bone.roll = -3.0648
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_body_feather.003.R']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.004.R'] = bone.name
-    bone = arm.edit_bones.new('w_body_feather.004.L')
-    bone.head = 0.1066, 0.0973, 0.4522
-    bone.tail = 0.1287, 0.1768, 0.4434
-    bone.roll = 3.0648
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_body_feather.003.L']]
-    bone.bbone_segments = 5
-    bones['w_body_feather.004.L'] = bone.name
-    bone = arm.edit_bones.new('foot.L')
-    bone.head = 0.0996, 0.0128, 0.0322
-    bone.tail = 0.0996, -0.0031, 0.0100
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['shin.L']]
-    bones['foot.L'] = bone.name
-    bone = arm.edit_bones.new('t_thumb.001.L')
-    bone.head = 0.0864, 0.0291, 0.0337
-    bone.tail = 0.0821, 0.0390, 0.0301
-    bone.roll = -2.9879
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shin.L']]
-    bones['t_thumb.001.L'] = bone.name
-    bone = arm.edit_bones.new('foot.R')
-    bone.head = -0.0996, 0.0128, 0.0322
-    bone.tail = -0.0996, -0.0031, 0.0100
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['shin.R']]
-    bones['foot.R'] = bone.name
-    bone = arm.edit_bones.new('t_thumb.001.R')
-    bone.head = -0.0864, 0.0291, 0.0337
-    bone.tail = -0.0821, 0.0390, 0.0301
-    bone.roll = 2.9879
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shin.R']]
-    bones['t_thumb.001.R'] = bone.name
-    bone = arm.edit_bones.new('t_feather.L.004')
-    bone.head = 0.0697, 0.2808, 0.4256
-    bone.tail = 0.0991, 0.3396, 0.4164
-    bone.roll = 0.0713
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.L']]
-    bone.bbone_segments = 5
-    bones['t_feather.L.004'] = bone.name
-    bone = arm.edit_bones.new('t_feather.R.004')
-    bone.head = -0.0697, 0.2808, 0.4256
-    bone.tail = -0.0991, 0.3396, 0.4164
-    bone.roll = -0.0713
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.R']]
-    bone.bbone_segments = 5
-    bones['t_feather.R.004'] = bone.name
-    bone = arm.edit_bones.new('t_feather.L.005')
-    bone.head = 0.0390, 0.3196, 0.4253
-    bone.tail = 0.0593, 0.4006, 0.4165
-    bone.roll = 0.0230
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.L.001']]
-    bone.bbone_segments = 5
-    bones['t_feather.L.005'] = bone.name
-    bone = arm.edit_bones.new('t_feather.R.005')
-    bone.head = -0.0390, 0.3196, 0.4253
-    bone.tail = -0.0593, 0.4006, 0.4165
-    bone.roll = -0.0230
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.R.001']]
-    bone.bbone_segments = 5
-    bones['t_feather.R.005'] = bone.name
-    bone = arm.edit_bones.new('t_feather.002')
-    bone.head = 0.0006, 0.3302, 0.4246
-    bone.tail = 0.0032, 0.4312, 0.4179
-    bone.roll = 0.0072
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather']]
-    bone.bbone_segments = 5
-    bones['t_feather.002'] = bone.name
-    bone = arm.edit_bones.new('DEF-skin_belly')
-    bone.head = 0.0000, -0.0089, 0.1750
-    bone.tail = 0.0000, -0.1126, 0.1936
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['DEF-skin_belly.006']]
-    bone.bbone_segments = 5
-    bones['DEF-skin_belly'] = bone.name
-    bone = arm.edit_bones.new('neck.004')
-    bone.head = 0.0000, -0.2870, 0.5946
-    bone.tail = 0.0000, -0.2993, 0.7734
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['neck.003']]
-    bones['neck.004'] = bone.name
-    bone = arm.edit_bones.new('hand.R')
-    bone.head = -0.5110, -0.1581, 0.4000
-    bone.tail = -0.6986, -0.1442, 0.3561
-    bone.roll = -3.0265
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bones['hand.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.R')
-    bone.head = -0.3079, -0.0721, 0.4494
-    bone.tail = -0.3142, -0.0137, 0.4376
-    bone.roll = 2.9776
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.003.R')
-    bone.head = -0.3772, -0.1052, 0.4424
-    bone.tail = -0.3834, -0.0405, 0.4279
-    bone.roll = 2.9178
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.003.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.006.R')
-    bone.head = -0.4425, -0.1287, 0.4195
-    bone.tail = -0.4502, -0.0607, 0.4037
-    bone.roll = 2.7814
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.006.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.009.R')
-    bone.head = -0.5013, -0.1485, 0.4018
-    bone.tail = -0.5039, -0.0761, 0.3850
-    bone.roll = 3.0739
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.009.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.001.R')
-    bone.head = -0.2450, -0.0188, 0.4432
-    bone.tail = -0.2596, 0.0942, 0.4189
-    bone.roll = -3.1208
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.001.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.004.R')
-    bone.head = -0.1662, -0.0497, 0.4453
-    bone.tail = -0.1914, 0.0867, 0.4418
-    bone.roll = -3.0638
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.003.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.004.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.007.R')
-    bone.head = -0.1159, -0.0488, 0.4473
-    bone.tail = -0.1475, 0.0852, 0.4432
-    bone.roll = -3.0560
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.006.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.007.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.010.R')
-    bone.head = -0.1569, -0.1605, 0.4574
-    bone.tail = -0.1997, -0.1028, 0.4811
-    bone.roll = -3.0899
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.009.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.010.R'] = bone.name
-    bone = arm.edit_bones.new('hand.L')
-    bone.head = 0.5110, -0.1581, 0.4000
-    bone.tail = 0.6986, -0.1442, 0.3561
-    bone.roll = 3.0265
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bones['hand.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.L')
-    bone.head = 0.3079, -0.0721, 0.4494
-    bone.tail = 0.3142, -0.0137, 0.4376
-    bone.roll = -2.9776
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.003.L')
-    bone.head = 0.3772, -0.1052, 0.4424
-    bone.tail = 0.3834, -0.0405, 0.4279
-    bone.roll = -2.9178
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.003.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.006.L')
-    bone.head = 0.4425, -0.1287, 0.4195
-    bone.tail = 0.4502, -0.0607, 0.4037
-    bone.roll = -2.7814
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.006.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.009.L')
-    bone.head = 0.5013, -0.1485, 0.4018
-    bone.tail = 0.5039, -0.0761, 0.3850
-    bone.roll = -3.0739
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.009.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.001.L')
-    bone.head = 0.2450, -0.0188, 0.4432
-    bone.tail = 0.2596, 0.0942, 0.4189
-    bone.roll = 3.1208
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.001.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.004.L')
-    bone.head = 0.1662, -0.0497, 0.4453
-    bone.tail = 0.1914, 0.0867, 0.4418
-    bone.roll = 3.0638
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.003.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.004.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.007.L')
-    bone.head = 0.1159, -0.0488, 0.4473
-    bone.tail = 0.1475, 0.0852, 0.4432
-    bone.roll = 3.0560
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.006.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.007.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.010.L')
-    bone.head = 0.1569, -0.1605, 0.4574
-    bone.tail = 0.1997, -0.1028, 0.4811
-    bone.roll = 3.0899
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.009.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.010.L'] = bone.name
-    bone = arm.edit_bones.new('foot.L.001')
-    bone.head = 0.0996, -0.0031, 0.0100
-    bone.tail = 0.0996, -0.0492, 0.0070
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.L']]
-    bones['foot.L.001'] = bone.name
-    bone = arm.edit_bones.new('t_thumb.002.L')
-    bone.head = 0.0821, 0.0390, 0.0301
-    bone.tail = 0.0757, 0.0488, 0.0183
-    bone.roll = -3.0456
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_thumb.001.L']]
-    bones['t_thumb.002.L'] = bone.name
-    bone = arm.edit_bones.new('foot.R.001')
-    bone.head = -0.0996, -0.0031, 0.0100
-    bone.tail = -0.0996, -0.0492, 0.0070
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.R']]
-    bones['foot.R.001'] = bone.name
-    bone = arm.edit_bones.new('t_thumb.002.R')
-    bone.head = -0.0821, 0.0390, 0.0301
-    bone.tail = -0.0757, 0.0488, 0.0183
-    bone.roll = 3.0456
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_thumb.001.R']]
-    bones['t_thumb.002.R'] = bone.name
-    bone = arm.edit_bones.new('t_feather.L.002')
-    bone.head = 0.0991, 0.3396, 0.4164
-    bone.tail = 0.1102, 0.3646, 0.4124
-    bone.roll = 0.0752
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.L.004']]
-    bone.bbone_segments = 5
-    bones['t_feather.L.002'] = bone.name
-    bone = arm.edit_bones.new('t_feather.R.002')
-    bone.head = -0.0991, 0.3396, 0.4164
-    bone.tail = -0.1102, 0.3646, 0.4124
-    bone.roll = -0.0752
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.R.004']]
-    bone.bbone_segments = 5
-    bones['t_feather.R.002'] = bone.name
-    bone = arm.edit_bones.new('t_feather.L.003')
-    bone.head = 0.0593, 0.4006, 0.4165
-    bone.tail = 0.0663, 0.4354, 0.4131
-    bone.roll = 0.0247
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.L.005']]
-    bone.bbone_segments = 5
-    bones['t_feather.L.003'] = bone.name
-    bone = arm.edit_bones.new('t_feather.R.003')
-    bone.head = -0.0593, 0.4006, 0.4165
-    bone.tail = -0.0663, 0.4354, 0.4131
-    bone.roll = -0.0247
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.R.005']]
-    bone.bbone_segments = 5
-    bones['t_feather.R.003'] = bone.name
-    bone = arm.edit_bones.new('t_feather.001')
-    bone.head = 0.0032, 0.4312, 0.4179
-    bone.tail = 0.0068, 0.4673, 0.4149
-    bone.roll = 0.0062
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_feather.002']]
-    bone.bbone_segments = 5
-    bones['t_feather.001'] = bone.name
-    bone = arm.edit_bones.new('DEF-skin_belly.001')
-    bone.head = 0.0000, -0.1126, 0.1936
-    bone.tail = 0.0000, -0.2876, 0.2863
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['DEF-skin_belly']]
-    bone.bbone_segments = 5
-    bones['DEF-skin_belly.001'] = bone.name
-    bone = arm.edit_bones.new('neck.005')
-    bone.head = 0.0000, -0.2993, 0.7734
-    bone.tail = 0.0000, -0.3420, 0.8127
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['neck.004']]
-    bones['neck.005'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.R')
-    bone.head = -0.5363, -0.1534, 0.3920
-    bone.tail = -0.5630, -0.0688, 0.3709
-    bone.roll = 3.0812
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.003.R')
-    bone.head = -0.6839, -0.1352, 0.3568
-    bone.tail = -0.7421, -0.1193, 0.3361
-    bone.roll = 2.9746
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.003.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.006.R')
-    bone.head = -0.5834, -0.1320, 0.3754
-    bone.tail = -0.6405, -0.0552, 0.3479
-    bone.roll = 3.0416
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.006.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.009.R')
-    bone.head = -0.6395, -0.1287, 0.3652
-    bone.tail = -0.7161, -0.0666, 0.3347
-    bone.roll = 3.0171
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.009.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.012.R')
-    bone.head = -0.6696, -0.1327, 0.3593
-    bone.tail = -0.7529, -0.0920, 0.3286
-    bone.roll = 2.9504
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.012.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.001.R')
-    bone.head = -0.3142, -0.0137, 0.4376
-    bone.tail = -0.3271, 0.1061, 0.4135
-    bone.roll = 2.9776
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.001.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.004.R')
-    bone.head = -0.3834, -0.0405, 0.4279
-    bone.tail = -0.3958, 0.0884, 0.3992
-    bone.roll = 2.9178
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.003.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.004.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.007.R')
-    bone.head = -0.4502, -0.0607, 0.4037
-    bone.tail = -0.4650, 0.0714, 0.3732
-    bone.roll = 2.7814
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.006.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.007.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.010.R')
-    bone.head = -0.5039, -0.0761, 0.3850
-    bone.tail = -0.5089, 0.0645, 0.3522
-    bone.roll = 3.0739
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.009.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.010.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.002.R')
-    bone.head = -0.2596, 0.0942, 0.4189
-    bone.tail = -0.2678, 0.1569, 0.4054
-    bone.roll = -3.1208
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.001.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.002.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.005.R')
-    bone.head = -0.1914, 0.0867, 0.4418
-    bone.tail = -0.2003, 0.1350, 0.4406
-    bone.roll = -3.0638
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.004.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.005.R'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.008.R')
-    bone.head = -0.1475, 0.0852, 0.4432
-    bone.tail = -0.1652, 0.1603, 0.4409
-    bone.roll = -3.0560
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.007.R']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.008.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.L')
-    bone.head = 0.5363, -0.1534, 0.3920
-    bone.tail = 0.5630, -0.0688, 0.3709
-    bone.roll = -3.0812
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.003.L')
-    bone.head = 0.6839, -0.1352, 0.3568
-    bone.tail = 0.7421, -0.1193, 0.3361
-    bone.roll = -2.9746
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.003.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.006.L')
-    bone.head = 0.5834, -0.1320, 0.3754
-    bone.tail = 0.6405, -0.0552, 0.3479
-    bone.roll = -3.0416
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.006.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.009.L')
-    bone.head = 0.6395, -0.1287, 0.3652
-    bone.tail = 0.7161, -0.0666, 0.3347
-    bone.roll = -3.0171
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.009.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.012.L')
-    bone.head = 0.6696, -0.1327, 0.3593
-    bone.tail = 0.7529, -0.0920, 0.3286
-    bone.roll = -2.9504
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.012.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.001.L')
-    bone.head = 0.3142, -0.0137, 0.4376
-    bone.tail = 0.3271, 0.1061, 0.4135
-    bone.roll = -2.9776
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.001.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.004.L')
-    bone.head = 0.3834, -0.0405, 0.4279
-    bone.tail = 0.3958, 0.0884, 0.3992
-    bone.roll = -2.9178
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.003.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.004.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.007.L')
-    bone.head = 0.4502, -0.0607, 0.4037
-    bone.tail = 0.4650, 0.0714, 0.3732
-    bone.roll = -2.7814
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.006.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.007.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.010.L')
-    bone.head = 0.5039, -0.0761, 0.3850
-    bone.tail = 0.5089, 0.0645, 0.3522
-    bone.roll = -3.0739
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.009.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.010.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.002.L')
-    bone.head = 0.2596, 0.0942, 0.4189
-    bone.tail = 0.2678, 0.1569, 0.4054
-    bone.roll = 3.1208
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.001.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.002.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.005.L')
-    bone.head = 0.1914, 0.0867, 0.4418
-    bone.tail = 0.2003, 0.1350, 0.4406
-    bone.roll = 3.0638
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.004.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.005.L'] = bone.name
-    bone = arm.edit_bones.new('w_upper_arm_feather.008.L')
-    bone.head = 0.1475, 0.0852, 0.4432
-    bone.tail = 0.1652, 0.1603, 0.4409
-    bone.roll = 3.0560
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_upper_arm_feather.007.L']]
-    bone.bbone_segments = 5
-    bones['w_upper_arm_feather.008.L'] = bone.name
-    bone = arm.edit_bones.new('toe.L')
-    bone.head = 0.0996, -0.0492, 0.0070
-    bone.tail = 0.0996, -0.1131, 0.0024
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.L.001']]
-    bones['toe.L'] = bone.name
-    bone = arm.edit_bones.new('t_ring.001.L')
-    bone.head = 0.1204, 0.0011, 0.0117
-    bone.tail = 0.1411, -0.0334, 0.0101
-    bone.roll = -2.9839
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.L.001']]
-    bones['t_ring.001.L'] = bone.name
-    bone = arm.edit_bones.new('t_index.001.L')
-    bone.head = 0.0797, -0.0003, 0.0126
-    bone.tail = 0.0667, -0.0380, 0.0112
-    bone.roll = 2.9697
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.L.001']]
-    bones['t_index.001.L'] = bone.name
-    bone = arm.edit_bones.new('t_middle.001.L')
-    bone.head = 0.1025, -0.0109, 0.0116
-    bone.tail = 0.1046, -0.0481, 0.0104
-    bone.roll = -2.0363
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.L.001']]
-    bones['t_middle.001.L'] = bone.name
-    bone = arm.edit_bones.new('t_thumb.002.L.001')
-    bone.head = 0.0757, 0.0488, 0.0183
-    bone.tail = 0.0742, 0.0505, 0.0135
-    bone.roll = 3.1266
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_thumb.002.L']]
-    bones['t_thumb.002.L.001'] = bone.name
-    bone = arm.edit_bones.new('toe.R')
-    bone.head = -0.0996, -0.0492, 0.0070
-    bone.tail = -0.0996, -0.1131, 0.0024
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.R.001']]
-    bones['toe.R'] = bone.name
-    bone = arm.edit_bones.new('t_ring.001.R')
-    bone.head = -0.1204, 0.0011, 0.0117
-    bone.tail = -0.1411, -0.0334, 0.0101
-    bone.roll = 2.9839
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.R.001']]
-    bones['t_ring.001.R'] = bone.name
-    bone = arm.edit_bones.new('t_index.001.R')
-    bone.head = -0.0797, -0.0003, 0.0126
-    bone.tail = -0.0667, -0.0380, 0.0112
-    bone.roll = -2.9697
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.R.001']]
-    bones['t_index.001.R'] = bone.name
-    bone = arm.edit_bones.new('t_middle.001.R')
-    bone.head = -0.1025, -0.0109, 0.0116
-    bone.tail = -0.1046, -0.0481, 0.0104
-    bone.roll = 2.0363
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.R.001']]
-    bones['t_middle.001.R'] = bone.name
-    bone = arm.edit_bones.new('t_thumb.002.R.001')
-    bone.head = -0.0757, 0.0488, 0.0183
-    bone.tail = -0.0742, 0.0505, 0.0135
-    bone.roll = -3.1266
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_thumb.002.R']]
-    bones['t_thumb.002.R.001'] = bone.name
-    bone = arm.edit_bones.new('DEF-skin_belly.003')
-    bone.head = 0.0000, -0.2876, 0.2863
-    bone.tail = 0.0000, -0.3505, 0.3934
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['DEF-skin_belly.001']]
-    bone.bbone_segments = 5
-    bones['DEF-skin_belly.003'] = bone.name
-    bone = arm.edit_bones.new('head')
-    bone.head = 0.0000, -0.3420, 0.8127
-    bone.tail = 0.0000, -0.4105, 0.8163
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['neck.005']]
-    bones['head'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.001.R')
-    bone.head = -0.5630, -0.0688, 0.3709
-    bone.tail = -0.6135, 0.0912, 0.3311
-    bone.roll = 3.0812
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.001.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.004.R')
-    bone.head = -0.7421, -0.1193, 0.3361
-    bone.tail = -0.8537, -0.0887, 0.2962
-    bone.roll = 2.9746
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.003.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.004.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.007.R')
-    bone.head = -0.6405, -0.0552, 0.3479
-    bone.tail = -0.7569, 0.1015, 0.2919
-    bone.roll = 3.0416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.006.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.007.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.010.R')
-    bone.head = -0.7161, -0.0666, 0.3347
-    bone.tail = -0.8695, 0.0578, 0.2737
-    bone.roll = 3.0171
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.009.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.010.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.013.R')
-    bone.head = -0.7529, -0.0920, 0.3286
-    bone.tail = -0.9247, -0.0082, 0.2655
-    bone.roll = 2.9504
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.012.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.013.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.002.R')
-    bone.head = -0.3271, 0.1061, 0.4135
-    bone.tail = -0.3330, 0.1616, 0.4023
-    bone.roll = 2.9776
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.001.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.002.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.005.R')
-    bone.head = -0.3958, 0.0884, 0.3992
-    bone.tail = -0.4020, 0.1535, 0.3847
-    bone.roll = 2.9178
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.004.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.005.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.008.R')
-    bone.head = -0.4650, 0.0714, 0.3732
-    bone.tail = -0.4731, 0.1434, 0.3565
-    bone.roll = 2.7814
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.007.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.008.R'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.011.R')
-    bone.head = -0.5089, 0.0645, 0.3522
-    bone.tail = -0.5116, 0.1412, 0.3344
-    bone.roll = 3.0739
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.010.R']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.011.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.001.L')
-    bone.head = 0.5630, -0.0688, 0.3709
-    bone.tail = 0.6135, 0.0912, 0.3311
-    bone.roll = -3.0812
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.001.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.004.L')
-    bone.head = 0.7421, -0.1193, 0.3361
-    bone.tail = 0.8537, -0.0887, 0.2962
-    bone.roll = -2.9746
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.003.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.004.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.007.L')
-    bone.head = 0.6405, -0.0552, 0.3479
-    bone.tail = 0.7569, 0.1015, 0.2919
-    bone.roll = -3.0416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.006.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.007.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.010.L')
-    bone.head = 0.7161, -0.0666, 0.3347
-    bone.tail = 0.8695, 0.0578, 0.2737
-    bone.roll = -3.0171
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.009.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.010.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.013.L')
-    bone.head = 0.7529, -0.0920, 0.3286
-    bone.tail = 0.9247, -0.0082, 0.2655
-    bone.roll = -2.9504
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.012.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.013.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.002.L')
-    bone.head = 0.3271, 0.1061, 0.4135
-    bone.tail = 0.3330, 0.1616, 0.4023
-    bone.roll = -2.9776
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.001.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.002.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.005.L')
-    bone.head = 0.3958, 0.0884, 0.3992
-    bone.tail = 0.4020, 0.1535, 0.3847
-    bone.roll = -2.9178
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.004.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.005.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.008.L')
-    bone.head = 0.4650, 0.0714, 0.3732
-    bone.tail = 0.4731, 0.1434, 0.3565
-    bone.roll = -2.7814
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.007.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.008.L'] = bone.name
-    bone = arm.edit_bones.new('w_forearm_feather.011.L')
-    bone.head = 0.5089, 0.0645, 0.3522
-    bone.tail = 0.5116, 0.1412, 0.3344
-    bone.roll = -3.0739
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_forearm_feather.010.L']]
-    bone.bbone_segments = 5
-    bones['w_forearm_feather.011.L'] = bone.name
-    bone = arm.edit_bones.new('t_ring.002.L')
-    bone.head = 0.1411, -0.0334, 0.0101
-    bone.tail = 0.1704, -0.0805, 0.0076
-    bone.roll = -2.9754
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_ring.001.L']]
-    bones['t_ring.002.L'] = bone.name
-    bone = arm.edit_bones.new('t_index.002.L')
-    bone.head = 0.0667, -0.0380, 0.0112
-    bone.tail = 0.0500, -0.0816, 0.0072
-    bone.roll = 2.7307
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_index.001.L']]
-    bones['t_index.002.L'] = bone.name
-    bone = arm.edit_bones.new('t_middle.002.L')
-    bone.head = 0.1046, -0.0481, 0.0104
-    bone.tail = 0.1083, -0.1051, 0.0084
-    bone.roll = -2.1172
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_middle.001.L']]
-    bones['t_middle.002.L'] = bone.name
-    bone = arm.edit_bones.new('t_ring.002.R')
-    bone.head = -0.1411, -0.0334, 0.0101
-    bone.tail = -0.1704, -0.0805, 0.0076
-    bone.roll = 2.9754
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_ring.001.R']]
-    bones['t_ring.002.R'] = bone.name
-    bone = arm.edit_bones.new('t_index.002.R')
-    bone.head = -0.0667, -0.0380, 0.0112
-    bone.tail = -0.0500, -0.0816, 0.0072
-    bone.roll = -2.7307
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_index.001.R']]
-    bones['t_index.002.R'] = bone.name
-    bone = arm.edit_bones.new('t_middle.002.R')
-    bone.head = -0.1046, -0.0481, 0.0104
-    bone.tail = -0.1083, -0.1051, 0.0084
-    bone.roll = 2.1172
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_middle.001.R']]
-    bones['t_middle.002.R'] = bone.name
-    bone = arm.edit_bones.new('DEF-skin_belly.004')
-    bone.head = 0.0000, -0.3505, 0.3934
-    bone.tail = 0.0000, -0.3556, 0.4940
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['DEF-skin_belly.003']]
-    bone.bbone_segments = 5
-    bones['DEF-skin_belly.004'] = bone.name
-    bone = arm.edit_bones.new('beak_001.B')
-    bone.head = 0.0000, -0.3717, 0.8005
-    bone.tail = 0.0000, -0.4118, 0.7801
-    bone.roll = 0.0001
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['beak_001.B'] = bone.name
-    bone = arm.edit_bones.new('eye.L')
-    bone.head = 0.0210, -0.4032, 0.8309
-    bone.tail = 0.0351, -0.4182, 0.8302
-    bone.roll = 0.0612
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['eye.L'] = bone.name
-    bone = arm.edit_bones.new('eye.R')
-    bone.head = -0.0210, -0.4032, 0.8309
-    bone.tail = -0.0351, -0.4182, 0.8302
-    bone.roll = -0.0612
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['eye.R'] = bone.name
-    bone = arm.edit_bones.new('eyeLidT.L')
-    bone.head = 0.0210, -0.4032, 0.8309
-    bone.tail = 0.0356, -0.4135, 0.8411
-    bone.roll = -1.0782
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['eyeLidT.L'] = bone.name
-    bone = arm.edit_bones.new('eyeLidT.R')
-    bone.head = -0.0210, -0.4032, 0.8309
-    bone.tail = -0.0356, -0.4135, 0.8411
-    bone.roll = 1.0782
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['eyeLidT.R'] = bone.name
-    bone = arm.edit_bones.new('eyeLidB.L')
-    bone.head = 0.0210, -0.4032, 0.8309
-    bone.tail = 0.0357, -0.4144, 0.8218
-    bone.roll = 0.7881
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['eyeLidB.L'] = bone.name
-    bone = arm.edit_bones.new('eyeLidB.R')
-    bone.head = -0.0210, -0.4032, 0.8309
-    bone.tail = -0.0357, -0.4144, 0.8218
-    bone.roll = -0.7881
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['head']]
-    bones['eyeLidB.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.002.R')
-    bone.head = -0.6135, 0.0912, 0.3311
-    bone.tail = -0.6431, 0.1851, 0.3077
-    bone.roll = 3.0812
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.001.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.002.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.005.R')
-    bone.head = -0.8537, -0.0887, 0.2962
-    bone.tail = -0.9169, -0.0714, 0.2737
-    bone.roll = 2.9746
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.004.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.005.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.008.R')
-    bone.head = -0.7569, 0.1015, 0.2919
-    bone.tail = -0.8115, 0.1751, 0.2655
-    bone.roll = 3.0416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.007.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.008.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.011.R')
-    bone.head = -0.8695, 0.0578, 0.2737
-    bone.tail = -0.9457, 0.1195, 0.2433
-    bone.roll = 3.0171
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.010.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.011.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.014.R')
-    bone.head = -0.9247, -0.0082, 0.2655
-    bone.tail = -1.0030, 0.0301, 0.2367
-    bone.roll = 2.9504
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.013.R']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.014.R'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.002.L')
-    bone.head = 0.6135, 0.0912, 0.3311
-    bone.tail = 0.6431, 0.1851, 0.3077
-    bone.roll = -3.0812
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.001.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.002.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.005.L')
-    bone.head = 0.8537, -0.0887, 0.2962
-    bone.tail = 0.9169, -0.0714, 0.2737
-    bone.roll = -2.9746
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.004.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.005.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.008.L')
-    bone.head = 0.7569, 0.1015, 0.2919
-    bone.tail = 0.8115, 0.1751, 0.2655
-    bone.roll = -3.0416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.007.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.008.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.011.L')
-    bone.head = 0.8695, 0.0578, 0.2737
-    bone.tail = 0.9457, 0.1195, 0.2433
-    bone.roll = -3.0171
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.010.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.011.L'] = bone.name
-    bone = arm.edit_bones.new('w_hand_feather.014.L')
-    bone.head = 0.9247, -0.0082, 0.2655
-    bone.tail = 1.0030, 0.0301, 0.2367
-    bone.roll = -2.9504
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['w_hand_feather.013.L']]
-    bone.bbone_segments = 5
-    bones['w_hand_feather.014.L'] = bone.name
-    bone = arm.edit_bones.new('t_ring.003.L')
-    bone.head = 0.1704, -0.0805, 0.0076
-    bone.tail = 0.1809, -0.0996, 0.0016
-    bone.roll = -2.1752
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_ring.002.L']]
-    bones['t_ring.003.L'] = bone.name
-    bone = arm.edit_bones.new('t_index.003.L')
-    bone.head = 0.0500, -0.0816, 0.0072
-    bone.tail = 0.0425, -0.0971, 0.0015
-    bone.roll = 1.9664
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_index.002.L']]
-    bones['t_index.003.L'] = bone.name
-    bone = arm.edit_bones.new('t_middle.003.L')
-    bone.head = 0.1083, -0.1051, 0.0084
-    bone.tail = 0.1092, -0.1260, 0.0030
-    bone.roll = -0.2692
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_middle.002.L']]
-    bones['t_middle.003.L'] = bone.name
-    bone = arm.edit_bones.new('t_ring.003.R')
-    bone.head = -0.1704, -0.0805, 0.0076
-    bone.tail = -0.1809, -0.0996, 0.0016
-    bone.roll = 2.1752
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_ring.002.R']]
-    bones['t_ring.003.R'] = bone.name
-    bone = arm.edit_bones.new('t_index.003.R')
-    bone.head = -0.0500, -0.0816, 0.0072
-    bone.tail = -0.0425, -0.0971, 0.0015
-    bone.roll = -1.9664
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_index.002.R']]
-    bones['t_index.003.R'] = bone.name
-    bone = arm.edit_bones.new('t_middle.003.R')
-    bone.head = -0.1083, -0.1051, 0.0084
-    bone.tail = -0.1092, -0.1260, 0.0030
-    bone.roll = 0.2692
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['t_middle.002.R']]
-    bones['t_middle.003.R'] = bone.name
-    bone = arm.edit_bones.new('beak.002.B')
-    bone.head = 0.0000, -0.4118, 0.7801
-    bone.tail = 0.0000, -0.5103, 0.7760
-    bone.roll = 0.0001
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['beak_001.B']]
-    bones['beak.002.B'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['spine.001']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.pivot_pos = 1
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Spine (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Spine (Tweak)')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['tail.001']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.copy_rotation_axes = (True, False, True)
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.connect_chain = True
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Spine (Tweak)')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['spine.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['pelvis.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'cube'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['pelvis.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.make_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'cube'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['tail.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['neck.001']]
-    pbone.rigify_type = 'spines.super_head'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.connect_chain = True
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Spine (Tweak)')
-    pbone = obj.pose.bones[bones['head.parent']]
-    pbone.rigify_type = 'basic.pivot'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_extra_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_parent_switch = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.register_parent = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.register_parent_tags = ''
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_control = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_extra_deform = False
-    except AttributeError:
-        pass
-    # custom properties
-    rna_idprop_ui_create(
-        pbone,
-        'head-pin',
-        default=0.0,
-        min=0.0,
-        max=1.0,
-        soft_min=0.0,
-        soft_max=1.0,
-        subtype='NONE',
-        description='',
-        precision=3,
-        step=0.10000000149011612,
-    )
-    pbone = obj.pose.bones[bones['shoulder.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['shoulder.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_body_feather.R']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_body_feather.002.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_body_feather.L']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_body_feather.002.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thigh.L']]
-    pbone.rigify_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    try:
-        pbone.rigify_parameters.limb_type = 'paw'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Leg.L (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Leg.L (FK)')
-    pbone = obj.pose.bones[bones['thigh.R']]
-    pbone.rigify_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    try:
-        pbone.rigify_parameters.limb_type = 'paw'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Leg.R (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Leg.R (FK)')
-    pbone = obj.pose.bones[bones['tail.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['DEF-skin_belly.005']]
-    pbone.rigify_type = 'basic.raw_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['neck.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['upper_arm.R']]
-    pbone.rigify_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Wing.L (IK)')
-    try:
-        pbone.rigify_parameters.copy_rotation_axes = (False, False, False)
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Wing.L (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Wing.L (FK)')
-    pbone = obj.pose.bones[bones['w_shoulder_feather.R']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['upper_arm.L']]
-    pbone.rigify_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Wing.L (IK)')
-    try:
-        pbone.rigify_parameters.copy_rotation_axes = (False, False, False)
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Wing.L (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Wing.L (FK)')
-    pbone = obj.pose.bones[bones['w_shoulder_feather.L']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_body_feather.001.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_body_feather.003.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_body_feather.001.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_body_feather.003.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['shin.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['shin.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['t_feather.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_feather.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_feather.L.001']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_feather.R.001']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_feather']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['DEF-skin_belly.006']]
-    pbone.rigify_type = 'basic.raw_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.copy_rotation_axes = (True, False, True)
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.connect_chain = True
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Spine (Tweak)')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['neck.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['forearm.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Wing.L (IK)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.parent_bone = ''
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.003.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.006.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.009.R']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_shoulder_feather.001.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['forearm.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Wing.L (IK)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.parent_bone = ''
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.003.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.006.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.009.L']]
-    pbone.rigify_type = 'basic.copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_shoulder_feather.001.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_body_feather.004.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_body_feather.004.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['foot.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['t_thumb.001.L']]
-    pbone.rigify_type = 'limbs.simple_tentacle'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.L (Tweak)')
-    pbone = obj.pose.bones[bones['foot.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['t_thumb.001.R']]
-    pbone.rigify_type = 'limbs.simple_tentacle'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.R (Tweak)')
-    pbone = obj.pose.bones[bones['t_feather.L.004']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.R.004']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.L.005']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.R.005']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['DEF-skin_belly']]
-    pbone.rigify_type = 'basic.raw_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.pivot_pos = 1
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Spine (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Spine (Tweak)')
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['neck.004']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['hand.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Wing.L (IK)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.003.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.006.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.009.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.001.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.004.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.007.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.010.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['hand.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Wing.L (IK)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.003.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.006.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.009.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.001.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.004.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.007.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.010.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['foot.L.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['t_thumb.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['foot.R.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['t_thumb.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['t_feather.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.L.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.R.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['t_feather.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Tail')
-    pbone = obj.pose.bones[bones['DEF-skin_belly.001']]
-    pbone.rigify_type = 'basic.raw_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['neck.005']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['w_hand_feather.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.003.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.parent_bone = ''
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.006.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.009.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.012.R']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.001.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.004.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.007.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.010.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.005.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.008.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.003.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.parent_bone = ''
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.006.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.009.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.012.L']]
-    pbone.rigify_type = 'basic.my_copy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_widget = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_controls = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deforms = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.001.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.004.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.007.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.010.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.005.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_upper_arm_feather.008.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['toe.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['t_ring.001.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_extra_ik_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_index.001.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_extra_ik_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_middle.001.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.L (Tweak)')
-    try:
-        pbone.rigify_parameters.make_extra_ik_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_thumb.002.L.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['toe.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['t_ring.001.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.R (Tweak)')
-    try:
-        pbone.rigify_parameters.roll_alignment = 'automatic'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_extra_ik_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_index.001.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.R (Tweak)')
-    try:
-        pbone.rigify_parameters.make_extra_ik_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_middle.001.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Claws.R (Tweak)')
-    try:
-        pbone.rigify_parameters.make_extra_ik_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_thumb.002.R.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['DEF-skin_belly.003']]
-    pbone.rigify_type = 'basic.raw_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['head']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    pbone = obj.pose.bones[bones['w_hand_feather.001.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.004.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.007.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.010.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.013.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.005.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.008.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.011.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.001.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.004.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.007.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.010.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_hand_feather.013.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    pbone = obj.pose.bones[bones['w_forearm_feather.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.005.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.008.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_forearm_feather.011.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_ring.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['t_index.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['t_middle.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['t_ring.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['t_index.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['t_middle.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['DEF-skin_belly.004']]
-    pbone.rigify_type = 'basic.raw_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Spine')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['beak_001.B']]
-    pbone.rigify_type = 'limbs.simple_tentacle'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Face (Tweak)')
-    pbone = obj.pose.bones[bones['eye.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eye.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eyeLidT.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'circle'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eyeLidT.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'circle'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eyeLidB.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'circle'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eyeLidB.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.002.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.005.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.008.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.parent_bone = ''
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.011.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.014.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.002.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.005.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.008.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.parent_bone = ''
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.011.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['w_hand_feather.014.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Feathers.L (Tweak)')
-    try:
-        pbone.rigify_parameters.relink_constraints = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.optional_widget_type = 'bone'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['t_ring.003.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['t_index.003.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['t_middle.003.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.L')
-    pbone = obj.pose.bones[bones['t_ring.003.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['t_index.003.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['t_middle.003.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Claws.R')
-    pbone = obj.pose.bones[bones['beak.002.B']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        bone.bbone_x = bone.bbone_z = bone.length * 0.05
-        arm.edit_bones.active = bone
-
-    arm.collections.active_index = 0
-
-    return bones
-
+    # Rigify imports every template to build the Add menu, so the loader is only imported when used
+    from ...utils.metarig_data import create_metarig_from_file
 
-if __name__ == "__main__":
-    create(bpy.context.active_object)
+    return create_metarig_from_file(obj, DATA_PATH)
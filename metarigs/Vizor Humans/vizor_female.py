@@ -1,1864 +1,10 @@
-import bpy
+import os
 
-from rna_prop_ui import rna_idprop_ui_create
-
-from mathutils import Color
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'vizor_female.json')
 
 
 def create(obj):  # noqa
-    # generated by rigify.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    for i in range(10):
-        arm.rigify_colors.add()
-
-    arm.rigify_colors[0].name = "Root"
-    arm.rigify_colors[0].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[0].normal = Color((0.4353, 0.1843, 0.4157))
-    arm.rigify_colors[0].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[0].standard_colors_lock = True
-    arm.rigify_colors[1].name = "IK"
-    arm.rigify_colors[1].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[1].normal = Color((0.6039, 0.0000, 0.0000))
-    arm.rigify_colors[1].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[1].standard_colors_lock = True
-    arm.rigify_colors[2].name = "Special"
-    arm.rigify_colors[2].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[2].normal = Color((0.9569, 0.7882, 0.0471))
-    arm.rigify_colors[2].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[2].standard_colors_lock = True
-    arm.rigify_colors[3].name = "Tweak"
-    arm.rigify_colors[3].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[3].normal = Color((0.0392, 0.2118, 0.5804))
-    arm.rigify_colors[3].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[3].standard_colors_lock = True
-    arm.rigify_colors[4].name = "FK"
-    arm.rigify_colors[4].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[4].normal = Color((0.1176, 0.5686, 0.0353))
-    arm.rigify_colors[4].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[4].standard_colors_lock = True
-    arm.rigify_colors[5].name = "Extra"
-    arm.rigify_colors[5].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[5].normal = Color((0.4392, 0.9676, 0.2431))
-    arm.rigify_colors[5].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[5].standard_colors_lock = True
-    arm.rigify_colors[6].name = "Cape IK"
-    arm.rigify_colors[6].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[6].normal = Color((0.6940, 0.1068, 0.0000))
-    arm.rigify_colors[6].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[6].standard_colors_lock = True
-    arm.rigify_colors[7].name = "Skirt IK"
-    arm.rigify_colors[7].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[7].normal = Color((0.6530, 0.0000, 0.3077))
-    arm.rigify_colors[7].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[7].standard_colors_lock = True
-    arm.rigify_colors[8].name = "Cape FK"
-    arm.rigify_colors[8].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[8].normal = Color((0.0000, 0.1499, 0.7535))
-    arm.rigify_colors[8].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[8].standard_colors_lock = True
-    arm.rigify_colors[9].name = "Skirt FK"
-    arm.rigify_colors[9].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[9].normal = Color((0.0000, 0.3482, 0.1740))
-    arm.rigify_colors[9].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[9].standard_colors_lock = True
-
-    bone_collections = {}
-
-    for bcoll in list(arm.collections_all):
-        arm.collections.remove(bcoll)
-
-    def add_bone_collection(name, *, parent=None, ui_row=0, ui_title='', sel_set=False, color_set_id=0):
-        new_bcoll = arm.collections.new(name, parent=bone_collections.get(parent))
-        new_bcoll.rigify_ui_row = ui_row
-        new_bcoll.rigify_ui_title = ui_title
-        new_bcoll.rigify_sel_set = sel_set
-        new_bcoll.rigify_color_set_id = color_set_id
-        bone_collections[name] = new_bcoll
-
-    def assign_bone_collections(pose_bone, *coll_names):
-        assert not len(pose_bone.bone.collections)
-        for name in coll_names:
-            bone_collections[name].assign(pose_bone)
-
-    def assign_bone_collection_refs(params, attr_name, *coll_names):
-        ref_list = getattr(params, attr_name + '_coll_refs', None)
-        if ref_list is not None:
-            for name in coll_names:
-                ref_list.add().set_collection(bone_collections[name])
-
-    add_bone_collection('Prop', ui_row=15, color_set_id=6)
-    add_bone_collection('Skirt (IK)', ui_row=14, color_set_id=8)
-    add_bone_collection('Skirt (FK)', ui_row=14, color_set_id=10)
-    add_bone_collection('Cape (IK)', ui_row=13, color_set_id=7)
-    add_bone_collection('Cape (FK)', ui_row=13, color_set_id=9)
-    add_bone_collection('Face', ui_row=1, color_set_id=5)
-    add_bone_collection('Face (Primary)', ui_row=2, color_set_id=2)
-    add_bone_collection('Face (Secondary)', ui_row=2, color_set_id=3)
-    add_bone_collection('Torso', ui_row=3, color_set_id=3)
-    add_bone_collection('Torso (Tweak)', ui_row=4, color_set_id=4)
-    add_bone_collection('Fingers', ui_row=5, color_set_id=6)
-    add_bone_collection('Fingers (Detail)', ui_row=6, color_set_id=5)
-    add_bone_collection('Arm.L (IK)', ui_row=7, color_set_id=2)
-    add_bone_collection('Arm.L (FK)', ui_row=8, color_set_id=5)
-    add_bone_collection('Arm.L (Tweak)', ui_row=9, color_set_id=4)
-    add_bone_collection('Arm.R (IK)', ui_row=7, color_set_id=2)
-    add_bone_collection('Arm.R (FK)', ui_row=8, color_set_id=5)
-    add_bone_collection('Arm.R (Tweak)', ui_row=9, color_set_id=4)
-    add_bone_collection('Leg.L (IK)', ui_row=10, color_set_id=2)
-    add_bone_collection('Leg.L (FK)', ui_row=11, color_set_id=5)
-    add_bone_collection('Leg.L (Tweak)', ui_row=12, color_set_id=4)
-    add_bone_collection('Leg.R (IK)', ui_row=10, color_set_id=2)
-    add_bone_collection('Leg.R (FK)', ui_row=11, color_set_id=5)
-    add_bone_collection('Leg.R (Tweak)', ui_row=12, color_set_id=4)
-    add_bone_collection('Root', ui_row=16, color_set_id=1)
-
-    bones = {}
-
-    bone = arm.edit_bones.new('spine')
-    bone.head = -0.0000, -0.0025, 0.6775
-    bone.tail = -0.0000, -0.0148, 0.7709
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bones['spine'] = bone.name
-    bone = arm.edit_bones.new('spine.001')
-    bone.head = -0.0000, -0.0148, 0.7709
-    bone.tail = -0.0000, -0.0392, 0.8834
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['spine.001'] = bone.name
-    bone = arm.edit_bones.new('thigh.L')
-    bone.head = 0.0909, -0.0054, 0.7215
-    bone.tail = 0.0771, -0.0092, 0.4049
-    bone.roll = 0.0183
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['thigh.L'] = bone.name
-    bone = arm.edit_bones.new('thigh.R')
-    bone.head = -0.0909, -0.0054, 0.7215
-    bone.tail = -0.0771, -0.0092, 0.4049
-    bone.roll = -0.0183
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['thigh.R'] = bone.name
-    bone = arm.edit_bones.new('pelvis.L')
-    bone.head = 0.0000, -0.0025, 0.6775
-    bone.tail = 0.0969, -0.0502, 0.7720
-    bone.roll = -1.0122
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['pelvis.L'] = bone.name
-    bone = arm.edit_bones.new('pelvis.R')
-    bone.head = -0.0000, -0.0025, 0.6775
-    bone.tail = -0.0969, -0.0502, 0.7720
-    bone.roll = 1.0122
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['pelvis.R'] = bone.name
-    bone = arm.edit_bones.new('spine.002')
-    bone.head = -0.0000, -0.0392, 0.8834
-    bone.tail = -0.0000, -0.0220, 0.9923
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.001']]
-    bones['spine.002'] = bone.name
-    bone = arm.edit_bones.new('shin.L')
-    bone.head = 0.0771, -0.0092, 0.4049
-    bone.tail = 0.0724, 0.0275, 0.0967
-    bone.roll = -0.0100
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thigh.L']]
-    bones['shin.L'] = bone.name
-    bone = arm.edit_bones.new('shin.R')
-    bone.head = -0.0771, -0.0092, 0.4049
-    bone.tail = -0.0724, 0.0275, 0.0967
-    bone.roll = 0.0100
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thigh.R']]
-    bones['shin.R'] = bone.name
-    bone = arm.edit_bones.new('spine.003')
-    bone.head = -0.0000, -0.0220, 0.9923
-    bone.tail = -0.0000, 0.0230, 1.1391
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bones['spine.003'] = bone.name
-    bone = arm.edit_bones.new('foot.L')
-    bone.head = 0.0724, 0.0275, 0.0967
-    bone.tail = 0.0741, -0.0440, 0.0271
-    bone.roll = -0.0362
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['shin.L']]
-    bones['foot.L'] = bone.name
-    bone = arm.edit_bones.new('foot.R')
-    bone.head = -0.0724, 0.0275, 0.0967
-    bone.tail = -0.0741, -0.0440, 0.0271
-    bone.roll = 0.0362
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['shin.R']]
-    bones['foot.R'] = bone.name
-    bone = arm.edit_bones.new('spine.004')
-    bone.head = -0.0000, 0.0230, 1.1391
-    bone.tail = -0.0000, 0.0225, 1.2007
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['spine.004'] = bone.name
-    bone = arm.edit_bones.new('shoulder.L')
-    bone.head = 0.0215, -0.0058, 1.1222
-    bone.tail = 0.1045, 0.0028, 1.1141
-    bone.roll = 0.1097
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['shoulder.L'] = bone.name
-    bone = arm.edit_bones.new('shoulder.R')
-    bone.head = -0.0215, -0.0058, 1.1222
-    bone.tail = -0.1045, 0.0028, 1.1141
-    bone.roll = -0.1097
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['shoulder.R'] = bone.name
-    bone = arm.edit_bones.new('prop')
-    bone.head = -1.0381, -0.0043, 0.0000
-    bone.tail = -1.0381, -0.0043, 1.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['prop'] = bone.name
-    bone = arm.edit_bones.new('breast.L')
-    bone.head = 0.0660, -0.0579, 1.0200
-    bone.tail = 0.0660, -0.1120, 1.0200
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['breast.L'] = bone.name
-    bone = arm.edit_bones.new('breast.R')
-    bone.head = -0.0660, -0.0579, 1.0200
-    bone.tail = -0.0660, -0.1120, 1.0200
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['breast.R'] = bone.name
-    bone = arm.edit_bones.new('toe.L')
-    bone.head = 0.0741, -0.0440, 0.0271
-    bone.tail = 0.0837, -0.1080, 0.0205
-    bone.roll = -5.0725
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.L']]
-    bones['toe.L'] = bone.name
-    bone = arm.edit_bones.new('heel.02.L')
-    bone.head = 0.0485, 0.0724, 0.0005
-    bone.tail = 0.1114, 0.0724, 0.0005
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.L']]
-    bones['heel.02.L'] = bone.name
-    bone = arm.edit_bones.new('toe.R')
-    bone.head = -0.0741, -0.0440, 0.0271
-    bone.tail = -0.0837, -0.1080, 0.0205
-    bone.roll = 5.0725
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.R']]
-    bones['toe.R'] = bone.name
-    bone = arm.edit_bones.new('heel.02.R')
-    bone.head = -0.0485, 0.0724, 0.0005
-    bone.tail = -0.1114, 0.0724, 0.0005
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.R']]
-    bones['heel.02.R'] = bone.name
-    bone = arm.edit_bones.new('spine.005')
-    bone.head = -0.0000, 0.0225, 1.2007
-    bone.tail = -0.0000, 0.0216, 1.2982
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.004']]
-    bones['spine.005'] = bone.name
-    bone = arm.edit_bones.new('upper_arm.L')
-    bone.head = 0.1197, 0.0246, 1.1069
-    bone.tail = 0.2902, 0.0319, 1.0036
-    bone.roll = 2.0897
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.L']]
-    bones['upper_arm.L'] = bone.name
-    bone = arm.edit_bones.new('upper_arm.R')
-    bone.head = -0.1197, 0.0246, 1.1069
-    bone.tail = -0.2902, 0.0319, 1.0036
-    bone.roll = -2.0897
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.R']]
-    bones['upper_arm.R'] = bone.name
-    bone = arm.edit_bones.new('spine.006')
-    bone.head = -0.0000, 0.0216, 1.2982
-    bone.tail = -0.0000, 0.0212, 1.4994
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.005']]
-    bones['spine.006'] = bone.name
-    bone = arm.edit_bones.new('forearm.L')
-    bone.head = 0.2902, 0.0319, 1.0036
-    bone.tail = 0.4673, -0.0388, 0.9013
-    bone.roll = 1.9965
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bones['forearm.L'] = bone.name
-    bone = arm.edit_bones.new('forearm.R')
-    bone.head = -0.2902, 0.0319, 1.0036
-    bone.tail = -0.4673, -0.0388, 0.9013
-    bone.roll = -1.9965
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bones['forearm.R'] = bone.name
-    bone = arm.edit_bones.new('face')
-    bone.head = -0.0000, 0.0216, 1.2982
-    bone.tail = -0.0000, 0.0216, 1.3751
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.006']]
-    bones['face'] = bone.name
-    bone = arm.edit_bones.new('hand.L')
-    bone.head = 0.4673, -0.0388, 0.9013
-    bone.tail = 0.5118, -0.0623, 0.8703
-    bone.roll = 2.1073
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bones['hand.L'] = bone.name
-    bone = arm.edit_bones.new('hand.R')
-    bone.head = -0.4673, -0.0388, 0.9013
-    bone.tail = -0.5118, -0.0623, 0.8703
-    bone.roll = -2.1073
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bones['hand.R'] = bone.name
-    bone = arm.edit_bones.new('forehead.L')
-    bone.head = 0.0223, -0.0863, 1.4306
-    bone.tail = 0.0160, -0.1085, 1.3656
-    bone.roll = 1.6943
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.L'] = bone.name
-    bone = arm.edit_bones.new('forehead.L.001')
-    bone.head = 0.0703, -0.0725, 1.4232
-    bone.tail = 0.0692, -0.0888, 1.3782
-    bone.roll = 1.1648
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.L.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.L.002')
-    bone.head = 0.0906, -0.0454, 1.4004
-    bone.tail = 0.0882, -0.0703, 1.3614
-    bone.roll = 0.5689
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.L.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.001')
-    bone.head = 0.0882, -0.0703, 1.3614
-    bone.tail = 0.0692, -0.0888, 1.3782
-    bone.roll = -2.0701
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['brow.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.R')
-    bone.head = -0.0223, -0.0863, 1.4306
-    bone.tail = -0.0160, -0.1085, 1.3656
-    bone.roll = -1.6943
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.R'] = bone.name
-    bone = arm.edit_bones.new('forehead.R.001')
-    bone.head = -0.0703, -0.0725, 1.4232
-    bone.tail = -0.0692, -0.0888, 1.3782
-    bone.roll = -1.1648
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.R.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.R.002')
-    bone.head = -0.0906, -0.0454, 1.4004
-    bone.tail = -0.0882, -0.0703, 1.3614
-    bone.roll = -0.5689
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.R.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.001')
-    bone.head = -0.0882, -0.0703, 1.3614
-    bone.tail = -0.0692, -0.0888, 1.3782
-    bone.roll = 2.0701
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['brow.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('eye.L')
-    bone.head = 0.0456, -0.0637, 1.3365
-    bone.tail = 0.0477, -0.0990, 1.3351
-    bone.roll = -1.9040
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['eye.L'] = bone.name
-    bone = arm.edit_bones.new('eye.R')
-    bone.head = -0.0456, -0.0637, 1.3365
-    bone.tail = -0.0477, -0.0990, 1.3351
-    bone.roll = 1.9040
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['eye.R'] = bone.name
-    bone = arm.edit_bones.new('jaw_master')
-    bone.head = 0.0000, -0.0103, 1.2808
-    bone.tail = 0.0000, -0.1059, 1.2134
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['jaw_master'] = bone.name
-    bone = arm.edit_bones.new('palm.01.L')
-    bone.head = 0.4717, -0.0596, 0.9007
-    bone.tail = 0.5053, -0.0859, 0.8803
-    bone.roll = -2.5121
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.01.L'] = bone.name
-    bone = arm.edit_bones.new('palm.02.L')
-    bone.head = 0.4734, -0.0493, 0.8986
-    bone.tail = 0.5145, -0.0655, 0.8823
-    bone.roll = -2.8396
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.02.L'] = bone.name
-    bone = arm.edit_bones.new('palm.03.L')
-    bone.head = 0.4763, -0.0395, 0.8973
-    bone.tail = 0.5130, -0.0474, 0.8805
-    bone.roll = -2.8925
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.03.L'] = bone.name
-    bone = arm.edit_bones.new('palm.04.L')
-    bone.head = 0.4787, -0.0291, 0.8960
-    bone.tail = 0.5113, -0.0311, 0.8732
-    bone.roll = -2.7588
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.04.L'] = bone.name
-    bone = arm.edit_bones.new('palm.01.R')
-    bone.head = -0.4717, -0.0596, 0.9007
-    bone.tail = -0.5053, -0.0859, 0.8803
-    bone.roll = 2.5121
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.01.R'] = bone.name
-    bone = arm.edit_bones.new('palm.02.R')
-    bone.head = -0.4734, -0.0493, 0.8986
-    bone.tail = -0.5145, -0.0655, 0.8823
-    bone.roll = 2.8396
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.02.R'] = bone.name
-    bone = arm.edit_bones.new('palm.03.R')
-    bone.head = -0.4763, -0.0395, 0.8973
-    bone.tail = -0.5130, -0.0474, 0.8805
-    bone.roll = 2.8925
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.03.R'] = bone.name
-    bone = arm.edit_bones.new('palm.04.R')
-    bone.head = -0.4787, -0.0291, 0.8960
-    bone.tail = -0.5113, -0.0311, 0.8732
-    bone.roll = 2.7588
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.04.R'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.002')
-    bone.head = 0.0692, -0.0888, 1.3782
-    bone.tail = 0.0160, -0.1085, 1.3656
-    bone.roll = 2.8802
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['brow.T.L.001']]
-    bones['brow.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.002')
-    bone.head = -0.0692, -0.0888, 1.3782
-    bone.tail = -0.0160, -0.1085, 1.3656
-    bone.roll = -2.8802
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['brow.T.R.001']]
-    bones['brow.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L')
-    bone.head = 0.0808, -0.0744, 1.3426
-    bone.tail = 0.0703, -0.0883, 1.3502
-    bone.roll = -0.0614
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.L']]
-    bones['lid.T.L'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L')
-    bone.head = 0.0233, -0.0913, 1.3150
-    bone.tail = 0.0447, -0.0919, 1.3119
-    bone.roll = -0.0680
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.L']]
-    bones['lid.B.L'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R')
-    bone.head = -0.0808, -0.0744, 1.3426
-    bone.tail = -0.0703, -0.0883, 1.3502
-    bone.roll = 0.0614
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.R']]
-    bones['lid.T.R'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R')
-    bone.head = -0.0233, -0.0913, 1.3150
-    bone.tail = -0.0447, -0.0919, 1.3119
-    bone.roll = 0.0680
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.R']]
-    bones['lid.B.R'] = bone.name
-    bone = arm.edit_bones.new('f_index.01.L')
-    bone.head = 0.5053, -0.0859, 0.8803
-    bone.tail = 0.5303, -0.0994, 0.8551
-    bone.roll = -2.1013
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.L']]
-    bones['f_index.01.L'] = bone.name
-    bone = arm.edit_bones.new('thumb.01.L')
-    bone.head = 0.4575, -0.0545, 0.8867
-    bone.tail = 0.4696, -0.0819, 0.8608
-    bone.roll = 0.0519
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.L']]
-    bones['thumb.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_middle.01.L')
-    bone.head = 0.5145, -0.0655, 0.8823
-    bone.tail = 0.5432, -0.0795, 0.8525
-    bone.roll = -2.2819
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.02.L']]
-    bones['f_middle.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_ring.01.L')
-    bone.head = 0.5130, -0.0474, 0.8805
-    bone.tail = 0.5406, -0.0552, 0.8504
-    bone.roll = -2.4373
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.03.L']]
-    bones['f_ring.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.01.L')
-    bone.head = 0.5113, -0.0311, 0.8732
-    bone.tail = 0.5284, -0.0336, 0.8521
-    bone.roll = -2.4839
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.04.L']]
-    bones['f_pinky.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_index.01.R')
-    bone.head = -0.5053, -0.0859, 0.8803
-    bone.tail = -0.5303, -0.0994, 0.8551
-    bone.roll = 2.1013
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.R']]
-    bones['f_index.01.R'] = bone.name
-    bone = arm.edit_bones.new('thumb.01.R')
-    bone.head = -0.4575, -0.0545, 0.8867
-    bone.tail = -0.4696, -0.0819, 0.8608
-    bone.roll = -0.0519
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.R']]
-    bones['thumb.01.R'] = bone.name
-    bone = arm.edit_bones.new('f_middle.01.R')
-    bone.head = -0.5145, -0.0655, 0.8823
-    bone.tail = -0.5432, -0.0795, 0.8525
-    bone.roll = 2.2819
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.02.R']]
-    bones['f_middle.01.R'] = bone.name
-    bone = arm.edit_bones.new('f_ring.01.R')
-    bone.head = -0.5130, -0.0474, 0.8805
-    bone.tail = -0.5406, -0.0552, 0.8504
-    bone.roll = 2.4373
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.03.R']]
-    bones['f_ring.01.R'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.01.R')
-    bone.head = -0.5113, -0.0311, 0.8732
-    bone.tail = -0.5284, -0.0336, 0.8521
-    bone.roll = 2.4839
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.04.R']]
-    bones['f_pinky.01.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.001')
-    bone.head = 0.0703, -0.0883, 1.3502
-    bone.tail = 0.0515, -0.0974, 1.3495
-    bone.roll = -0.3729
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.L']]
-    bones['lid.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.001')
-    bone.head = 0.0447, -0.0919, 1.3119
-    bone.tail = 0.0653, -0.0887, 1.3189
-    bone.roll = -0.3332
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.L']]
-    bones['lid.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.001')
-    bone.head = -0.0703, -0.0883, 1.3502
-    bone.tail = -0.0515, -0.0974, 1.3495
-    bone.roll = 0.3729
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.R']]
-    bones['lid.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.001')
-    bone.head = -0.0447, -0.0919, 1.3119
-    bone.tail = -0.0653, -0.0887, 1.3189
-    bone.roll = 0.3332
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.R']]
-    bones['lid.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('f_index.02.L')
-    bone.head = 0.5303, -0.0994, 0.8551
-    bone.tail = 0.5415, -0.1056, 0.8363
-    bone.roll = -1.7677
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.01.L']]
-    bones['f_index.02.L'] = bone.name
-    bone = arm.edit_bones.new('thumb.02.L')
-    bone.head = 0.4696, -0.0819, 0.8608
-    bone.tail = 0.4844, -0.0959, 0.8365
-    bone.roll = -0.1080
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.01.L']]
-    bones['thumb.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_middle.02.L')
-    bone.head = 0.5432, -0.0795, 0.8525
-    bone.tail = 0.5563, -0.0867, 0.8308
-    bone.roll = -1.9897
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.01.L']]
-    bones['f_middle.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_ring.02.L')
-    bone.head = 0.5406, -0.0552, 0.8504
-    bone.tail = 0.5550, -0.0593, 0.8295
-    bone.roll = -2.2661
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.01.L']]
-    bones['f_ring.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.02.L')
-    bone.head = 0.5284, -0.0336, 0.8521
-    bone.tail = 0.5394, -0.0358, 0.8349
-    bone.roll = -2.3616
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.01.L']]
-    bones['f_pinky.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_index.02.R')
-    bone.head = -0.5303, -0.0994, 0.8551
-    bone.tail = -0.5415, -0.1056, 0.8363
-    bone.roll = 1.7677
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.01.R']]
-    bones['f_index.02.R'] = bone.name
-    bone = arm.edit_bones.new('thumb.02.R')
-    bone.head = -0.4696, -0.0819, 0.8608
-    bone.tail = -0.4844, -0.0959, 0.8365
-    bone.roll = 0.1080
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.01.R']]
-    bones['thumb.02.R'] = bone.name
-    bone = arm.edit_bones.new('f_middle.02.R')
-    bone.head = -0.5432, -0.0795, 0.8525
-    bone.tail = -0.5563, -0.0867, 0.8308
-    bone.roll = 1.9897
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.01.R']]
-    bones['f_middle.02.R'] = bone.name
-    bone = arm.edit_bones.new('f_ring.02.R')
-    bone.head = -0.5406, -0.0552, 0.8504
-    bone.tail = -0.5550, -0.0593, 0.8295
-    bone.roll = 2.2661
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.01.R']]
-    bones['f_ring.02.R'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.02.R')
-    bone.head = -0.5284, -0.0336, 0.8521
-    bone.tail = -0.5394, -0.0358, 0.8349
-    bone.roll = 2.3616
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.01.R']]
-    bones['f_pinky.02.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.002')
-    bone.head = 0.0515, -0.0974, 1.3495
-    bone.tail = 0.0312, -0.0978, 1.3368
-    bone.roll = -0.4587
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.001']]
-    bones['lid.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.002')
-    bone.head = 0.0653, -0.0887, 1.3189
-    bone.tail = 0.0768, -0.0818, 1.3293
-    bone.roll = -0.3377
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.L.001']]
-    bones['lid.B.L.002'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.002')
-    bone.head = -0.0515, -0.0974, 1.3495
-    bone.tail = -0.0312, -0.0978, 1.3368
-    bone.roll = 0.4587
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.001']]
-    bones['lid.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.002')
-    bone.head = -0.0653, -0.0887, 1.3189
-    bone.tail = -0.0768, -0.0818, 1.3293
-    bone.roll = 0.3377
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.R.001']]
-    bones['lid.B.R.002'] = bone.name
-    bone = arm.edit_bones.new('f_index.03.L')
-    bone.head = 0.5415, -0.1056, 0.8363
-    bone.tail = 0.5541, -0.1128, 0.8151
-    bone.roll = -1.7666
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.02.L']]
-    bones['f_index.03.L'] = bone.name
-    bone = arm.edit_bones.new('thumb.03.L')
-    bone.head = 0.4844, -0.0959, 0.8365
-    bone.tail = 0.4974, -0.1045, 0.8171
-    bone.roll = -0.1608
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.02.L']]
-    bones['thumb.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_middle.03.L')
-    bone.head = 0.5563, -0.0867, 0.8308
-    bone.tail = 0.5696, -0.0939, 0.8063
-    bone.roll = -1.9240
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.02.L']]
-    bones['f_middle.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_ring.03.L')
-    bone.head = 0.5550, -0.0593, 0.8295
-    bone.tail = 0.5683, -0.0637, 0.8074
-    bone.roll = -2.1937
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.02.L']]
-    bones['f_ring.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.03.L')
-    bone.head = 0.5394, -0.0358, 0.8349
-    bone.tail = 0.5503, -0.0380, 0.8173
-    bone.roll = -2.3430
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.02.L']]
-    bones['f_pinky.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_index.03.R')
-    bone.head = -0.5415, -0.1056, 0.8363
-    bone.tail = -0.5541, -0.1128, 0.8151
-    bone.roll = 1.7666
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.02.R']]
-    bones['f_index.03.R'] = bone.name
-    bone = arm.edit_bones.new('thumb.03.R')
-    bone.head = -0.4844, -0.0959, 0.8365
-    bone.tail = -0.4974, -0.1045, 0.8171
-    bone.roll = 0.1608
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.02.R']]
-    bones['thumb.03.R'] = bone.name
-    bone = arm.edit_bones.new('f_middle.03.R')
-    bone.head = -0.5563, -0.0867, 0.8308
-    bone.tail = -0.5696, -0.0939, 0.8063
-    bone.roll = 1.9240
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.02.R']]
-    bones['f_middle.03.R'] = bone.name
-    bone = arm.edit_bones.new('f_ring.03.R')
-    bone.head = -0.5550, -0.0593, 0.8295
-    bone.tail = -0.5683, -0.0637, 0.8074
-    bone.roll = 2.1937
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.02.R']]
-    bones['f_ring.03.R'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.03.R')
-    bone.head = -0.5394, -0.0358, 0.8349
-    bone.tail = -0.5503, -0.0380, 0.8173
-    bone.roll = 2.3430
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.02.R']]
-    bones['f_pinky.03.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.003')
-    bone.head = 0.0312, -0.0978, 1.3368
-    bone.tail = 0.0233, -0.0913, 1.3150
-    bone.roll = -0.5562
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.002']]
-    bones['lid.T.L.003'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.003')
-    bone.head = 0.0768, -0.0818, 1.3293
-    bone.tail = 0.0808, -0.0744, 1.3426
-    bone.roll = -0.3473
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.L.002']]
-    bones['lid.B.L.003'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.003')
-    bone.head = -0.0312, -0.0978, 1.3368
-    bone.tail = -0.0233, -0.0913, 1.3150
-    bone.roll = 0.5562
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.002']]
-    bones['lid.T.R.003'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.003')
-    bone.head = -0.0768, -0.0818, 1.3293
-    bone.tail = -0.0808, -0.0744, 1.3426
-    bone.roll = 0.3473
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.R.002']]
-    bones['lid.B.R.003'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['spine']]
-    pbone.rigify_type = 'spines.basic_spine'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Torso (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Torso (Tweak)')
-    pbone = obj.pose.bones[bones['spine.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['thigh.L']]
-    pbone.rigify_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    try:
-        pbone.rigify_parameters.limb_type = 'leg'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.extra_ik_toe = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Leg.L (FK)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Leg.L (Tweak)')
-    try:
-        pbone.rigify_parameters.rotation_axis = 'x'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thigh.R']]
-    pbone.rigify_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    try:
-        pbone.rigify_parameters.limb_type = 'leg'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.extra_ik_toe = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Leg.R (FK)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Leg.R (Tweak)')
-    try:
-        pbone.rigify_parameters.rotation_axis = 'x'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.auto_align_extremity = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['pelvis.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.make_control = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['pelvis.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.make_control = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['spine.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['shin.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['shin.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['spine.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['foot.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['foot.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['spine.004']]
-    pbone.rigify_type = 'spines.super_head'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.connect_chain = True
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Torso (Tweak)')
-    pbone = obj.pose.bones[bones['shoulder.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'shoulder'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['shoulder.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'shoulder'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['prop']]
-    pbone.rigify_type = 'basic.pivot'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Prop')
-    try:
-        pbone.rigify_parameters.make_extra_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_parent_switch = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.register_parent = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.register_parent_tags = 'injected'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_extra_deform = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['breast.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['breast.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['toe.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['heel.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['toe.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['heel.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['spine.005']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['upper_arm.L']]
-    pbone.rigify_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.L (IK)')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Arm.L (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Arm.L (FK)')
-    pbone = obj.pose.bones[bones['upper_arm.R']]
-    pbone.rigify_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.R (IK)')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Arm.R (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Arm.R (FK)')
-    pbone = obj.pose.bones[bones['spine.006']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['forearm.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.L (IK)')
-    pbone = obj.pose.bones[bones['forearm.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.R (IK)')
-    pbone = obj.pose.bones[bones['face']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face', 'Face (Primary)', 'Face (Secondary)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'secondary', 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['hand.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.L (IK)')
-    pbone = obj.pose.bones[bones['hand.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.R (IK)')
-    pbone = obj.pose.bones[bones['forehead.L']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.L.001']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.L.002']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['brow.T.L.001']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Primary)')
-    try:
-        pbone.rigify_parameters.skin_chain_priority = 1
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['forehead.R']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.R.001']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.R.002']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['brow.T.R.001']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Primary)')
-    try:
-        pbone.rigify_parameters.skin_chain_priority = 1
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eye.L']]
-    pbone.rigify_type = 'face.skin_eye'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_deform = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eye.R']]
-    pbone.rigify_type = 'face.skin_eye'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.eyelid_follow_split = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deform = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['jaw_master']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.jaw_mouth_influence = 1.0
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'jaw'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['palm.01.L']]
-    pbone.rigify_type = 'limbs.super_palm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.04.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.01.R']]
-    pbone.rigify_type = 'limbs.super_palm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.04.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['brow.T.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['brow.T.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.L']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.B.L']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.T.R']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.B.R']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_index.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thumb.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_middle.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_ring.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_pinky.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_index.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thumb.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_middle.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_ring.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_pinky.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.T.L.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.L.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.R.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.R.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['f_index.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_index.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['lid.T.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['f_index.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_index.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['lid.T.L.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.L.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.R.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.R.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        bone.bbone_x = bone.bbone_z = bone.length * 0.05
-        arm.edit_bones.active = bone
-
-    arm.collections.active_index = 0
-
-    return bones
-
+    # Rigify imports every template to build the Add menu, so the loader is only imported when used
+    from ...utils.metarig_data import create_metarig_from_file
 
-if __name__ == "__main__":
-    create(bpy.context.active_object)
+    return create_metarig_from_file(obj, DATA_PATH)
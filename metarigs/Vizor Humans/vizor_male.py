@@ -1,1815 +1,10 @@
-import bpy
+import os
 
-from rna_prop_ui import rna_idprop_ui_create
-
-from mathutils import Color
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'vizor_male.json')
 
 
 def create(obj):  # noqa
-    # generated by rigify.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    for i in range(10):
-        arm.rigify_colors.add()
-
-    arm.rigify_colors[0].name = "Root"
-    arm.rigify_colors[0].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[0].normal = Color((0.4353, 0.1843, 0.4157))
-    arm.rigify_colors[0].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[0].standard_colors_lock = True
-    arm.rigify_colors[1].name = "IK"
-    arm.rigify_colors[1].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[1].normal = Color((0.6039, 0.0000, 0.0000))
-    arm.rigify_colors[1].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[1].standard_colors_lock = True
-    arm.rigify_colors[2].name = "Special"
-    arm.rigify_colors[2].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[2].normal = Color((0.9569, 0.7882, 0.0471))
-    arm.rigify_colors[2].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[2].standard_colors_lock = True
-    arm.rigify_colors[3].name = "Tweak"
-    arm.rigify_colors[3].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[3].normal = Color((0.0392, 0.2118, 0.5804))
-    arm.rigify_colors[3].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[3].standard_colors_lock = True
-    arm.rigify_colors[4].name = "FK"
-    arm.rigify_colors[4].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[4].normal = Color((0.1176, 0.5686, 0.0353))
-    arm.rigify_colors[4].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[4].standard_colors_lock = True
-    arm.rigify_colors[5].name = "Extra"
-    arm.rigify_colors[5].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[5].normal = Color((0.4392, 0.9676, 0.2431))
-    arm.rigify_colors[5].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[5].standard_colors_lock = True
-    arm.rigify_colors[6].name = "Cape IK"
-    arm.rigify_colors[6].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[6].normal = Color((0.6940, 0.1068, 0.0000))
-    arm.rigify_colors[6].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[6].standard_colors_lock = True
-    arm.rigify_colors[7].name = "Skirt IK"
-    arm.rigify_colors[7].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[7].normal = Color((0.6530, 0.0000, 0.3077))
-    arm.rigify_colors[7].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[7].standard_colors_lock = True
-    arm.rigify_colors[8].name = "Cape FK"
-    arm.rigify_colors[8].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[8].normal = Color((0.0000, 0.1499, 0.7535))
-    arm.rigify_colors[8].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[8].standard_colors_lock = True
-    arm.rigify_colors[9].name = "Skirt FK"
-    arm.rigify_colors[9].active = Color((0.5490, 1.0000, 1.0000))
-    arm.rigify_colors[9].normal = Color((0.0000, 0.3482, 0.1740))
-    arm.rigify_colors[9].select = Color((0.3140, 0.7840, 1.0000))
-    arm.rigify_colors[9].standard_colors_lock = True
-
-    bone_collections = {}
-
-    for bcoll in list(arm.collections_all):
-        arm.collections.remove(bcoll)
-
-    def add_bone_collection(name, *, parent=None, ui_row=0, ui_title='', sel_set=False, color_set_id=0):
-        new_bcoll = arm.collections.new(name, parent=bone_collections.get(parent))
-        new_bcoll.rigify_ui_row = ui_row
-        new_bcoll.rigify_ui_title = ui_title
-        new_bcoll.rigify_sel_set = sel_set
-        new_bcoll.rigify_color_set_id = color_set_id
-        bone_collections[name] = new_bcoll
-
-    def assign_bone_collections(pose_bone, *coll_names):
-        assert not len(pose_bone.bone.collections)
-        for name in coll_names:
-            bone_collections[name].assign(pose_bone)
-
-    def assign_bone_collection_refs(params, attr_name, *coll_names):
-        ref_list = getattr(params, attr_name + '_coll_refs', None)
-        if ref_list is not None:
-            for name in coll_names:
-                ref_list.add().set_collection(bone_collections[name])
-
-    add_bone_collection('Prop', ui_row=15, color_set_id=6)
-    add_bone_collection('Skirt (IK)', ui_row=14, color_set_id=8)
-    add_bone_collection('Skirt (FK)', ui_row=14, color_set_id=10)
-    add_bone_collection('Cape (IK)', ui_row=13, color_set_id=7)
-    add_bone_collection('Cape (FK)', ui_row=13, color_set_id=9)
-    add_bone_collection('Face', ui_row=1, color_set_id=5)
-    add_bone_collection('Face (Primary)', ui_row=2, color_set_id=2)
-    add_bone_collection('Face (Secondary)', ui_row=2, color_set_id=3)
-    add_bone_collection('Torso', ui_row=3, color_set_id=3)
-    add_bone_collection('Torso (Tweak)', ui_row=4, color_set_id=4)
-    add_bone_collection('Fingers', ui_row=5, color_set_id=6)
-    add_bone_collection('Fingers (Detail)', ui_row=6, color_set_id=5)
-    add_bone_collection('Arm.L (IK)', ui_row=7, color_set_id=2)
-    add_bone_collection('Arm.L (FK)', ui_row=8, color_set_id=5)
-    add_bone_collection('Arm.L (Tweak)', ui_row=9, color_set_id=4)
-    add_bone_collection('Arm.R (IK)', ui_row=7, color_set_id=2)
-    add_bone_collection('Arm.R (FK)', ui_row=8, color_set_id=5)
-    add_bone_collection('Arm.R (Tweak)', ui_row=9, color_set_id=4)
-    add_bone_collection('Leg.L (IK)', ui_row=10, color_set_id=2)
-    add_bone_collection('Leg.L (FK)', ui_row=11, color_set_id=5)
-    add_bone_collection('Leg.L (Tweak)', ui_row=12, color_set_id=4)
-    add_bone_collection('Leg.R (IK)', ui_row=10, color_set_id=2)
-    add_bone_collection('Leg.R (FK)', ui_row=11, color_set_id=5)
-    add_bone_collection('Leg.R (Tweak)', ui_row=12, color_set_id=4)
-    add_bone_collection('Root', ui_row=16, color_set_id=1)
-
-    bones = {}
-
-    bone = arm.edit_bones.new('spine')
-    bone.head = -0.0000, -0.0189, 0.6988
-    bone.tail = -0.0003, -0.0284, 0.7593
-    bone.roll = -0.0055
-    bone.use_connect = False
-    bones['spine'] = bone.name
-    bone = arm.edit_bones.new('spine.001')
-    bone.head = -0.0003, -0.0284, 0.7593
-    bone.tail = -0.0000, -0.0299, 0.8488
-    bone.roll = 0.0032
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['spine.001'] = bone.name
-    bone = arm.edit_bones.new('thigh.L')
-    bone.head = 0.0697, -0.0188, 0.6988
-    bone.tail = 0.0699, -0.0226, 0.3558
-    bone.roll = -0.0264
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['thigh.L'] = bone.name
-    bone = arm.edit_bones.new('thigh.R')
-    bone.head = -0.0697, -0.0188, 0.6988
-    bone.tail = -0.0699, -0.0226, 0.3558
-    bone.roll = 0.0264
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine']]
-    bones['thigh.R'] = bone.name
-    bone = arm.edit_bones.new('spine.002')
-    bone.head = -0.0000, -0.0299, 0.8488
-    bone.tail = -0.0000, -0.0205, 0.9614
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.001']]
-    bones['spine.002'] = bone.name
-    bone = arm.edit_bones.new('shin.L')
-    bone.head = 0.0699, -0.0226, 0.3558
-    bone.tail = 0.0652, 0.0140, 0.0870
-    bone.roll = -0.0080
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thigh.L']]
-    bones['shin.L'] = bone.name
-    bone = arm.edit_bones.new('shin.R')
-    bone.head = -0.0699, -0.0226, 0.3558
-    bone.tail = -0.0652, 0.0140, 0.0870
-    bone.roll = 0.0080
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thigh.R']]
-    bones['shin.R'] = bone.name
-    bone = arm.edit_bones.new('spine.003')
-    bone.head = -0.0000, -0.0205, 0.9614
-    bone.tail = 0.0000, -0.0091, 1.1069
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.002']]
-    bones['spine.003'] = bone.name
-    bone = arm.edit_bones.new('foot.L')
-    bone.head = 0.0652, 0.0140, 0.0870
-    bone.tail = 0.0669, -0.0995, 0.0287
-    bone.roll = -0.0445
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['shin.L']]
-    bones['foot.L'] = bone.name
-    bone = arm.edit_bones.new('foot.R')
-    bone.head = -0.0652, 0.0140, 0.0870
-    bone.tail = -0.0669, -0.0995, 0.0287
-    bone.roll = 0.0445
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['shin.R']]
-    bones['foot.R'] = bone.name
-    bone = arm.edit_bones.new('spine.004')
-    bone.head = 0.0000, -0.0091, 1.1069
-    bone.tail = 0.0000, -0.0060, 1.1807
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['spine.004'] = bone.name
-    bone = arm.edit_bones.new('shoulder.L')
-    bone.head = 0.0259, -0.0330, 1.0915
-    bone.tail = 0.1328, 0.0071, 1.0718
-    bone.roll = 0.1706
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['shoulder.L'] = bone.name
-    bone = arm.edit_bones.new('shoulder.R')
-    bone.head = -0.0259, -0.0330, 1.0915
-    bone.tail = -0.1328, 0.0071, 1.0718
-    bone.roll = -0.1706
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['shoulder.R'] = bone.name
-    bone = arm.edit_bones.new('prop')
-    bone.head = -1.0381, -0.0043, 0.0000
-    bone.tail = -1.0381, -0.0043, 1.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.003']]
-    bones['prop'] = bone.name
-    bone = arm.edit_bones.new('toe.L')
-    bone.head = 0.0669, -0.0995, 0.0287
-    bone.tail = 0.0669, -0.1461, 0.0189
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.L']]
-    bones['toe.L'] = bone.name
-    bone = arm.edit_bones.new('heel.02.L')
-    bone.head = 0.0356, 0.0724, 0.0005
-    bone.tail = 0.0957, 0.0724, 0.0005
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.L']]
-    bones['heel.02.L'] = bone.name
-    bone = arm.edit_bones.new('toe.R')
-    bone.head = -0.0669, -0.0995, 0.0287
-    bone.tail = -0.0669, -0.1461, 0.0189
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['foot.R']]
-    bones['toe.R'] = bone.name
-    bone = arm.edit_bones.new('heel.02.R')
-    bone.head = -0.0356, 0.0724, 0.0005
-    bone.tail = -0.0957, 0.0724, 0.0005
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['foot.R']]
-    bones['heel.02.R'] = bone.name
-    bone = arm.edit_bones.new('spine.005')
-    bone.head = 0.0000, -0.0060, 1.1807
-    bone.tail = 0.0000, -0.0067, 1.2465
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.004']]
-    bones['spine.005'] = bone.name
-    bone = arm.edit_bones.new('upper_arm.L')
-    bone.head = 0.1556, 0.0099, 1.0641
-    bone.tail = 0.3242, 0.0171, 0.9531
-    bone.roll = 2.1264
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.L']]
-    bones['upper_arm.L'] = bone.name
-    bone = arm.edit_bones.new('upper_arm.R')
-    bone.head = -0.1556, 0.0099, 1.0641
-    bone.tail = -0.3242, 0.0171, 0.9531
-    bone.roll = -2.1264
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['shoulder.R']]
-    bones['upper_arm.R'] = bone.name
-    bone = arm.edit_bones.new('spine.006')
-    bone.head = 0.0000, -0.0067, 1.2465
-    bone.tail = 0.0000, 0.0012, 1.4524
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['spine.005']]
-    bones['spine.006'] = bone.name
-    bone = arm.edit_bones.new('forearm.L')
-    bone.head = 0.3242, 0.0171, 0.9531
-    bone.tail = 0.4593, -0.0326, 0.8467
-    bone.roll = 2.1841
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_arm.L']]
-    bones['forearm.L'] = bone.name
-    bone = arm.edit_bones.new('forearm.R')
-    bone.head = -0.3242, 0.0171, 0.9531
-    bone.tail = -0.4593, -0.0326, 0.8467
-    bone.roll = -2.1841
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_arm.R']]
-    bones['forearm.R'] = bone.name
-    bone = arm.edit_bones.new('face')
-    bone.head = 0.0000, -0.0067, 1.2465
-    bone.tail = 0.0000, 0.0034, 1.3402
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.006']]
-    bones['face'] = bone.name
-    bone = arm.edit_bones.new('hat')
-    bone.head = 0.0000, -0.0090, 1.3555
-    bone.tail = 0.0000, 0.0392, 1.4844
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['spine.006']]
-    bones['hat'] = bone.name
-    bone = arm.edit_bones.new('hand.L')
-    bone.head = 0.4593, -0.0326, 0.8467
-    bone.tail = 0.5314, -0.0652, 0.7805
-    bone.roll = 2.2844
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['forearm.L']]
-    bones['hand.L'] = bone.name
-    bone = arm.edit_bones.new('hand.R')
-    bone.head = -0.4593, -0.0326, 0.8467
-    bone.tail = -0.5314, -0.0652, 0.7805
-    bone.roll = -2.2844
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['forearm.R']]
-    bones['hand.R'] = bone.name
-    bone = arm.edit_bones.new('forehead.L')
-    bone.head = 0.0184, -0.1110, 1.3942
-    bone.tail = 0.0136, -0.1240, 1.3389
-    bone.roll = 1.6828
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.L'] = bone.name
-    bone = arm.edit_bones.new('forehead.L.001')
-    bone.head = 0.0552, -0.0956, 1.3879
-    bone.tail = 0.0544, -0.1094, 1.3496
-    bone.roll = 1.1615
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.L.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.L.002')
-    bone.head = 0.0716, -0.0724, 1.3685
-    bone.tail = 0.0690, -0.0937, 1.3353
-    bone.roll = 0.5985
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.L.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.001')
-    bone.head = 0.0690, -0.0937, 1.3353
-    bone.tail = 0.0544, -0.1094, 1.3496
-    bone.roll = -1.9868
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['brow.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.R')
-    bone.head = -0.0184, -0.1110, 1.3942
-    bone.tail = -0.0136, -0.1240, 1.3389
-    bone.roll = -1.6828
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.R'] = bone.name
-    bone = arm.edit_bones.new('forehead.R.001')
-    bone.head = -0.0552, -0.0956, 1.3879
-    bone.tail = -0.0544, -0.1094, 1.3496
-    bone.roll = -1.1615
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.R.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.R.002')
-    bone.head = -0.0716, -0.0724, 1.3685
-    bone.tail = -0.0690, -0.0937, 1.3353
-    bone.roll = -0.5985
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['forehead.R.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.001')
-    bone.head = -0.0690, -0.0937, 1.3353
-    bone.tail = -0.0544, -0.1094, 1.3496
-    bone.roll = 1.9868
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['brow.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('eye.L')
-    bone.head = 0.0371, -0.0820, 1.3183
-    bone.tail = 0.0378, -0.1083, 1.3183
-    bone.roll = 3.3311
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['eye.L'] = bone.name
-    bone = arm.edit_bones.new('eye.R')
-    bone.head = -0.0371, -0.0820, 1.3183
-    bone.tail = -0.0378, -0.1083, 1.3183
-    bone.roll = -3.3311
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['eye.R'] = bone.name
-    bone = arm.edit_bones.new('jaw_master')
-    bone.head = 0.0000, -0.0271, 1.2509
-    bone.tail = 0.0000, -0.1390, 1.1962
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['face']]
-    bones['jaw_master'] = bone.name
-    bone = arm.edit_bones.new('palm.01.L')
-    bone.head = 0.4791, -0.0608, 0.8294
-    bone.tail = 0.5229, -0.0924, 0.7950
-    bone.roll = -2.3350
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.01.L'] = bone.name
-    bone = arm.edit_bones.new('palm.02.L')
-    bone.head = 0.4822, -0.0490, 0.8266
-    bone.tail = 0.5342, -0.0691, 0.7948
-    bone.roll = -2.6179
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.02.L'] = bone.name
-    bone = arm.edit_bones.new('palm.03.L')
-    bone.head = 0.4870, -0.0359, 0.8259
-    bone.tail = 0.5329, -0.0439, 0.7919
-    bone.roll = -2.6531
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.03.L'] = bone.name
-    bone = arm.edit_bones.new('palm.04.L')
-    bone.head = 0.4882, -0.0217, 0.8233
-    bone.tail = 0.5288, -0.0227, 0.7837
-    bone.roll = -2.5938
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.L']]
-    bones['palm.04.L'] = bone.name
-    bone = arm.edit_bones.new('palm.01.R')
-    bone.head = -0.4791, -0.0608, 0.8294
-    bone.tail = -0.5229, -0.0924, 0.7950
-    bone.roll = 2.3350
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.01.R'] = bone.name
-    bone = arm.edit_bones.new('palm.02.R')
-    bone.head = -0.4822, -0.0490, 0.8266
-    bone.tail = -0.5342, -0.0691, 0.7948
-    bone.roll = 2.6179
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.02.R'] = bone.name
-    bone = arm.edit_bones.new('palm.03.R')
-    bone.head = -0.4870, -0.0359, 0.8259
-    bone.tail = -0.5329, -0.0439, 0.7919
-    bone.roll = 2.6531
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.03.R'] = bone.name
-    bone = arm.edit_bones.new('palm.04.R')
-    bone.head = -0.4882, -0.0217, 0.8233
-    bone.tail = -0.5288, -0.0227, 0.7837
-    bone.roll = 2.5938
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['hand.R']]
-    bones['palm.04.R'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.002')
-    bone.head = 0.0544, -0.1094, 1.3496
-    bone.tail = 0.0136, -0.1240, 1.3389
-    bone.roll = 2.8479
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['brow.T.L.001']]
-    bones['brow.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.002')
-    bone.head = -0.0544, -0.1094, 1.3496
-    bone.tail = -0.0136, -0.1240, 1.3389
-    bone.roll = -2.8479
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['brow.T.R.001']]
-    bones['brow.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L')
-    bone.head = 0.0602, -0.0978, 1.3161
-    bone.tail = 0.0538, -0.1057, 1.3234
-    bone.roll = 0.2837
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.L']]
-    bones['lid.T.L'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L')
-    bone.head = 0.0173, -0.1062, 1.3124
-    bone.tail = 0.0305, -0.1090, 1.3067
-    bone.roll = 0.2478
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.L']]
-    bones['lid.B.L'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R')
-    bone.head = -0.0602, -0.0978, 1.3161
-    bone.tail = -0.0538, -0.1057, 1.3234
-    bone.roll = -0.2837
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.R']]
-    bones['lid.T.R'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R')
-    bone.head = -0.0173, -0.1062, 1.3124
-    bone.tail = -0.0305, -0.1090, 1.3067
-    bone.roll = -0.2478
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['eye.R']]
-    bones['lid.B.R'] = bone.name
-    bone = arm.edit_bones.new('f_index.01.L')
-    bone.head = 0.5229, -0.0924, 0.7950
-    bone.tail = 0.5443, -0.1058, 0.7648
-    bone.roll = -1.8784
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.L']]
-    bones['f_index.01.L'] = bone.name
-    bone = arm.edit_bones.new('thumb.01.L')
-    bone.head = 0.4641, -0.0638, 0.8207
-    bone.tail = 0.4788, -0.0832, 0.7879
-    bone.roll = 0.0591
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.L']]
-    bones['thumb.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_middle.01.L')
-    bone.head = 0.5342, -0.0691, 0.7948
-    bone.tail = 0.5585, -0.0828, 0.7593
-    bone.roll = -2.0657
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.02.L']]
-    bones['f_middle.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_ring.01.L')
-    bone.head = 0.5329, -0.0439, 0.7919
-    bone.tail = 0.5558, -0.0522, 0.7564
-    bone.roll = -2.2365
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.03.L']]
-    bones['f_ring.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.01.L')
-    bone.head = 0.5288, -0.0227, 0.7837
-    bone.tail = 0.5426, -0.0258, 0.7592
-    bone.roll = -2.2989
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.04.L']]
-    bones['f_pinky.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_index.01.R')
-    bone.head = -0.5229, -0.0924, 0.7950
-    bone.tail = -0.5443, -0.1058, 0.7648
-    bone.roll = 1.8784
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.R']]
-    bones['f_index.01.R'] = bone.name
-    bone = arm.edit_bones.new('thumb.01.R')
-    bone.head = -0.4641, -0.0638, 0.8207
-    bone.tail = -0.4788, -0.0832, 0.7879
-    bone.roll = -0.0591
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.01.R']]
-    bones['thumb.01.R'] = bone.name
-    bone = arm.edit_bones.new('f_middle.01.R')
-    bone.head = -0.5342, -0.0691, 0.7948
-    bone.tail = -0.5585, -0.0828, 0.7593
-    bone.roll = 2.0657
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.02.R']]
-    bones['f_middle.01.R'] = bone.name
-    bone = arm.edit_bones.new('f_ring.01.R')
-    bone.head = -0.5329, -0.0439, 0.7919
-    bone.tail = -0.5558, -0.0522, 0.7564
-    bone.roll = 2.2365
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.03.R']]
-    bones['f_ring.01.R'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.01.R')
-    bone.head = -0.5288, -0.0227, 0.7837
-    bone.tail = -0.5426, -0.0258, 0.7592
-    bone.roll = 2.2989
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.04.R']]
-    bones['f_pinky.01.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.001')
-    bone.head = 0.0538, -0.1057, 1.3234
-    bone.tail = 0.0412, -0.1097, 1.3279
-    bone.roll = 0.1213
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.L']]
-    bones['lid.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.001')
-    bone.head = 0.0305, -0.1090, 1.3067
-    bone.tail = 0.0451, -0.1083, 1.3064
-    bone.roll = -0.0148
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.L']]
-    bones['lid.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.001')
-    bone.head = -0.0538, -0.1057, 1.3234
-    bone.tail = -0.0412, -0.1097, 1.3279
-    bone.roll = -0.1213
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.R']]
-    bones['lid.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.001')
-    bone.head = -0.0305, -0.1090, 1.3067
-    bone.tail = -0.0451, -0.1083, 1.3064
-    bone.roll = 0.0148
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.R']]
-    bones['lid.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('f_index.02.L')
-    bone.head = 0.5443, -0.1058, 0.7648
-    bone.tail = 0.5525, -0.1119, 0.7436
-    bone.roll = -1.5611
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.01.L']]
-    bones['f_index.02.L'] = bone.name
-    bone = arm.edit_bones.new('thumb.02.L')
-    bone.head = 0.4788, -0.0832, 0.7879
-    bone.tail = 0.4932, -0.0958, 0.7560
-    bone.roll = 0.0539
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.01.L']]
-    bones['thumb.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_middle.02.L')
-    bone.head = 0.5585, -0.0828, 0.7593
-    bone.tail = 0.5683, -0.0898, 0.7349
-    bone.roll = -1.7829
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.01.L']]
-    bones['f_middle.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_ring.02.L')
-    bone.head = 0.5558, -0.0522, 0.7564
-    bone.tail = 0.5669, -0.0566, 0.7326
-    bone.roll = -2.0694
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.01.L']]
-    bones['f_ring.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.02.L')
-    bone.head = 0.5426, -0.0258, 0.7592
-    bone.tail = 0.5509, -0.0284, 0.7398
-    bone.roll = -2.1743
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.01.L']]
-    bones['f_pinky.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_index.02.R')
-    bone.head = -0.5443, -0.1058, 0.7648
-    bone.tail = -0.5525, -0.1119, 0.7436
-    bone.roll = 1.5611
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.01.R']]
-    bones['f_index.02.R'] = bone.name
-    bone = arm.edit_bones.new('thumb.02.R')
-    bone.head = -0.4788, -0.0832, 0.7879
-    bone.tail = -0.4932, -0.0958, 0.7560
-    bone.roll = -0.0539
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.01.R']]
-    bones['thumb.02.R'] = bone.name
-    bone = arm.edit_bones.new('f_middle.02.R')
-    bone.head = -0.5585, -0.0828, 0.7593
-    bone.tail = -0.5683, -0.0898, 0.7349
-    bone.roll = 1.7829
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.01.R']]
-    bones['f_middle.02.R'] = bone.name
-    bone = arm.edit_bones.new('f_ring.02.R')
-    bone.head = -0.5558, -0.0522, 0.7564
-    bone.tail = -0.5669, -0.0566, 0.7326
-    bone.roll = 2.0694
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.01.R']]
-    bones['f_ring.02.R'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.02.R')
-    bone.head = -0.5426, -0.0258, 0.7592
-    bone.tail = -0.5509, -0.0284, 0.7398
-    bone.roll = 2.1743
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.01.R']]
-    bones['f_pinky.02.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.002')
-    bone.head = 0.0412, -0.1097, 1.3279
-    bone.tail = 0.0259, -0.1088, 1.3241
-    bone.roll = -0.1439
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.001']]
-    bones['lid.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.002')
-    bone.head = 0.0451, -0.1083, 1.3064
-    bone.tail = 0.0548, -0.1037, 1.3100
-    bone.roll = -0.1087
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.L.001']]
-    bones['lid.B.L.002'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.002')
-    bone.head = -0.0412, -0.1097, 1.3279
-    bone.tail = -0.0259, -0.1088, 1.3241
-    bone.roll = 0.1439
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.001']]
-    bones['lid.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.002')
-    bone.head = -0.0451, -0.1083, 1.3064
-    bone.tail = -0.0548, -0.1037, 1.3100
-    bone.roll = 0.1087
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.R.001']]
-    bones['lid.B.R.002'] = bone.name
-    bone = arm.edit_bones.new('f_index.03.L')
-    bone.head = 0.5525, -0.1119, 0.7436
-    bone.tail = 0.5618, -0.1188, 0.7197
-    bone.roll = -1.5594
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.02.L']]
-    bones['f_index.03.L'] = bone.name
-    bone = arm.edit_bones.new('thumb.03.L')
-    bone.head = 0.4932, -0.0958, 0.7560
-    bone.tail = 0.5055, -0.1055, 0.7295
-    bone.roll = 0.0460
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.02.L']]
-    bones['thumb.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_middle.03.L')
-    bone.head = 0.5683, -0.0898, 0.7349
-    bone.tail = 0.5778, -0.0968, 0.7075
-    bone.roll = -1.7213
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.02.L']]
-    bones['f_middle.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_ring.03.L')
-    bone.head = 0.5669, -0.0566, 0.7326
-    bone.tail = 0.5766, -0.0613, 0.7079
-    bone.roll = -1.9958
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.02.L']]
-    bones['f_ring.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.03.L')
-    bone.head = 0.5509, -0.0284, 0.7398
-    bone.tail = 0.5589, -0.0312, 0.7200
-    bone.roll = -2.1548
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.02.L']]
-    bones['f_pinky.03.L'] = bone.name
-    bone = arm.edit_bones.new('f_index.03.R')
-    bone.head = -0.5525, -0.1119, 0.7436
-    bone.tail = -0.5618, -0.1188, 0.7197
-    bone.roll = 1.5594
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_index.02.R']]
-    bones['f_index.03.R'] = bone.name
-    bone = arm.edit_bones.new('thumb.03.R')
-    bone.head = -0.4932, -0.0958, 0.7560
-    bone.tail = -0.5055, -0.1055, 0.7295
-    bone.roll = -0.0460
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['thumb.02.R']]
-    bones['thumb.03.R'] = bone.name
-    bone = arm.edit_bones.new('f_middle.03.R')
-    bone.head = -0.5683, -0.0898, 0.7349
-    bone.tail = -0.5778, -0.0968, 0.7075
-    bone.roll = 1.7213
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_middle.02.R']]
-    bones['f_middle.03.R'] = bone.name
-    bone = arm.edit_bones.new('f_ring.03.R')
-    bone.head = -0.5669, -0.0566, 0.7326
-    bone.tail = -0.5766, -0.0613, 0.7079
-    bone.roll = 1.9958
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_ring.02.R']]
-    bones['f_ring.03.R'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.03.R')
-    bone.head = -0.5509, -0.0284, 0.7398
-    bone.tail = -0.5589, -0.0312, 0.7200
-    bone.roll = 2.1548
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.02.R']]
-    bones['f_pinky.03.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.003')
-    bone.head = 0.0259, -0.1088, 1.3241
-    bone.tail = 0.0173, -0.1062, 1.3124
-    bone.roll = -0.3129
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.002']]
-    bones['lid.T.L.003'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.003')
-    bone.head = 0.0548, -0.1037, 1.3100
-    bone.tail = 0.0602, -0.0978, 1.3161
-    bone.roll = -0.1651
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.L.002']]
-    bones['lid.B.L.003'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.003')
-    bone.head = -0.0259, -0.1088, 1.3241
-    bone.tail = -0.0173, -0.1062, 1.3124
-    bone.roll = 0.3129
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.002']]
-    bones['lid.T.R.003'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.003')
-    bone.head = -0.0548, -0.1037, 1.3100
-    bone.tail = -0.0602, -0.0978, 1.3161
-    bone.roll = 0.1651
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['lid.B.R.002']]
-    bones['lid.B.R.003'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['spine']]
-    pbone.rigify_type = 'vizor.spines.basic_spine'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Torso (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Torso (Tweak)')
-    pbone = obj.pose.bones[bones['spine.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['thigh.L']]
-    pbone.rigify_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    try:
-        pbone.rigify_parameters.limb_type = 'leg'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.extra_ik_toe = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Leg.L (FK)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Leg.L (Tweak)')
-    try:
-        pbone.rigify_parameters.rotation_axis = 'x'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thigh.R']]
-    pbone.rigify_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    try:
-        pbone.rigify_parameters.limb_type = 'leg'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.extra_ik_toe = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Leg.R (FK)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Leg.R (Tweak)')
-    try:
-        pbone.rigify_parameters.rotation_axis = 'x'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.auto_align_extremity = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['spine.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['shin.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['shin.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['spine.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['foot.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['foot.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['spine.004']]
-    pbone.rigify_type = 'spines.super_head'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.connect_chain = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Torso (Tweak)')
-    pbone = obj.pose.bones[bones['shoulder.L']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'shoulder'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['shoulder.R']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.make_widget = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'shoulder'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['prop']]
-    pbone.rigify_type = 'basic.pivot'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Prop')
-    try:
-        pbone.rigify_parameters.make_extra_control = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_parent_switch = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.register_parent = True
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.register_parent_tags = 'injected'
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_extra_deform = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['toe.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['heel.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.L (IK)')
-    pbone = obj.pose.bones[bones['toe.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['heel.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Leg.R (IK)')
-    pbone = obj.pose.bones[bones['spine.005']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['upper_arm.L']]
-    pbone.rigify_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.L (IK)')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Arm.L (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Arm.L (FK)')
-    pbone = obj.pose.bones[bones['upper_arm.R']]
-    pbone.rigify_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.R (IK)')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Arm.R (Tweak)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'fk', 'Arm.R (FK)')
-    pbone = obj.pose.bones[bones['spine.006']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    pbone = obj.pose.bones[bones['forearm.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.L (IK)')
-    pbone = obj.pose.bones[bones['forearm.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.R (IK)')
-    pbone = obj.pose.bones[bones['face']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face', 'Face (Primary)', 'Face (Secondary)')
-    assign_bone_collection_refs(pbone.rigify_parameters, 'secondary', 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['hat']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Torso')
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'cube'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['hand.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.L (IK)')
-    pbone = obj.pose.bones[bones['hand.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Arm.R (IK)')
-    pbone = obj.pose.bones[bones['forehead.L']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.L.001']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.L.002']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['brow.T.L.001']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Primary)')
-    try:
-        pbone.rigify_parameters.skin_chain_priority = 1
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['forehead.R']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.R.001']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['forehead.R.002']]
-    pbone.rigify_type = 'skin.basic_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['brow.T.R.001']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Primary)')
-    try:
-        pbone.rigify_parameters.skin_chain_priority = 1
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eye.L']]
-    pbone.rigify_type = 'face.skin_eye'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.make_deform = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['eye.R']]
-    pbone.rigify_type = 'face.skin_eye'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.eyelid_follow_split = False
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.make_deform = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['jaw_master']]
-    pbone.rigify_type = 'basic.super_copy'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face')
-    try:
-        pbone.rigify_parameters.jaw_mouth_influence = 1.0
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.super_copy_widget_type = 'jaw'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['palm.01.L']]
-    pbone.rigify_type = 'limbs.super_palm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.04.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.01.R']]
-    pbone.rigify_type = 'limbs.super_palm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['palm.04.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['brow.T.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['brow.T.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.L']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.B.L']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.T.R']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.B.R']]
-    pbone.rigify_type = 'skin.stretchy_chain'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    try:
-        pbone.rigify_parameters.skin_chain_pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.rigify_parameters.skin_control_orientation_bone = 'face'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_index.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thumb.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_middle.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_ring.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_pinky.01.L']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_index.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['thumb.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_middle.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_ring.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_pinky.01.R']]
-    pbone.rigify_type = 'limbs.super_finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    try:
-        pbone.rigify_parameters.ik_local_location = False
-    except AttributeError:
-        pass
-    assign_bone_collection_refs(pbone.rigify_parameters, 'tweak', 'Fingers (Detail)')
-    try:
-        pbone.rigify_parameters.primary_rotation_axis = 'X'
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['lid.T.L.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.L.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.R.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.R.001']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['f_index.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.02.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_index.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.02.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['lid.T.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.L.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.R.002']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['f_index.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.03.L']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_index.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['thumb.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_middle.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_ring.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['f_pinky.03.R']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Fingers')
-    pbone = obj.pose.bones[bones['lid.T.L.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.L.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.T.R.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-    pbone = obj.pose.bones[bones['lid.B.R.003']]
-    pbone.rigify_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    assign_bone_collections(pbone, 'Face (Secondary)')
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        bone.bbone_x = bone.bbone_z = bone.length * 0.05
-        arm.edit_bones.active = bone
-
-    arm.collections.active_index = 0
-
-    return bones
-
+    # Rigify imports every template to build the Add menu, so the loader is only imported when used
+    from ...utils.metarig_data import create_metarig_from_file
 
-if __name__ == "__main__":
-    create(bpy.context.active_object)
+    return create_metarig_from_file(obj, DATA_PATH)
@@ -2,6 +2,8 @@ import bpy
 from rigify.base_rig import stage, BaseRig
 import rigify.utils as utils
 
+from ....utils.topology import get_topology
+
 class Rig(BaseRig):
 
     def generate_bbone(self, name):
@@ -37,7 +39,7 @@ class Rig(BaseRig):
 
     @stage.generate_bones
     def generate_chain_bones(self):
-        base_chain = [self.base_bone] + utils.connected_children_names(self.obj, self.base_bone)
+        base_chain = [self.base_bone] + get_topology(self).connected_chain(self.base_bone)
         self.bones.deform = [self.generate_bbone(b) for b in base_chain]
         self.bones.ctrl = self.generate_control_chain(base_chain, True, True)
         
@@ -2,12 +2,13 @@ import bpy
 from typing import Optional
 from rigify.rigs.skin.skin_rigs import BaseSkinChainRigWithRotationOption
 from rigify.base_rig import stage
-from rigify.utils.rig import connected_children_names
 from rigify.utils.misc import map_list
 from rigify.utils.naming import make_derived_name
 from itertools import count, repeat
 from rigify.rigs.skin.skin_nodes import ControlBoneNode, ControlNodeEnd
 
+from ....utils.topology import get_topology
+
 class Rig(BaseSkinChainRigWithRotationOption):
     class MchBones (BaseSkinChainRigWithRotationOption.MchBones):
         handles: list[str]
@@ -23,7 +24,7 @@ class Rig(BaseSkinChainRigWithRotationOption):
     control_nodes: list[ControlBoneNode]
 
     def find_org_bones(self, bone) -> list[str]:
-        return [bone.name] + connected_children_names(self.obj, bone.name)
+        return [bone.name] + get_topology(self).connected_chain(bone.name)
 
     @stage.initialize
     def init_control_nodes(self):
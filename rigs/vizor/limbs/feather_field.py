@@ -0,0 +1,179 @@
+import bpy
+import numpy as np
+from bpy.types import PoseBone
+
+from rigify.base_rig import BaseRig, stage
+from rigify.utils.naming import make_derived_name
+from rigify.utils.misc import map_list
+from rigify.utils.widgets_basic import create_limb_widget
+
+from ....utils import feather_fold
+from ....utils.feather_projection import find_feather_fractions, interpolation_weights
+from ....utils.topology import get_topology
+
+
+class Rig(BaseRig):
+    ''' Feather field: the children of the rig bone are sorted by distance like in the feather rig, and a few of
+        them, spread evenly along the fan, get guide controls. Every other feather follows the two guides around
+        it with a single Armature constraint, weighted by its position along the fan at generation time.
+
+        Plain feathers are moved directly and get a deform bone each. Feathers that are bases of child rigs, which
+        drive their own ORG bones, get an MCH moved by the field instead, and the root bones of the child rig are
+        parented to it.
+
+        Optionally the pose of the feathers in the metarig is recorded as the folded state, and a spread
+        property blends all feathers of the rig between it and the rest pose through one driver.
+    '''
+    rig_parent_bone: str
+    guide_orgs: list[str]
+    feather_weights: dict[str, list[tuple[str, float]]]
+    child_rigs: dict[str, BaseRig]
+    plain_orgs: list[str]
+    field_bones: dict[str, str]  # bone moved by the field for every feather: the ORG, or an MCH for child rigs
+    fold: feather_fold.FeatherFold | None
+
+    class CtrlBones(BaseRig.CtrlBones):
+        guides: list[str]
+
+    bones: BaseRig.ToplevelBones[
+        list[str],
+        'Rig.CtrlBones',
+        BaseRig.MchBones,
+        list[str]
+    ]
+
+    def find_org_bones(self, bone: PoseBone) -> list[str]:
+        children = get_topology(self).children(bone.name)
+        base_head = bone.bone.head
+        children.sort()
+        children.sort(key=lambda b: (self.get_bone(b).head - base_head).length)
+        return children
+
+    def initialize(self):
+        if len(self.bones.org) < 2:
+            self.raise_error("input of a rig type feather field must not less than 2 bones")
+
+        self.rig_parent_bone = self.get_bone_parent(self.bones.org[0])
+        self.guide_count = min(self.params.feather_field_guides, len(self.bones.org))
+
+        self.fold = feather_fold.FeatherFold(self, self.bones.org) if self.params.feather_fold else None
+
+    ##############################
+    # Guide controls and weights
+
+    @stage.generate_bones
+    def make_guide_controls(self):
+        org = self.bones.org
+        fractions = find_feather_fractions(self, org)
+
+        # Pick guides evenly by their order along the fan, which keeps their fractions increasing
+        order = np.argsort(fractions, kind='stable')
+        picks = order[np.round(np.linspace(0, len(org) - 1, self.guide_count)).astype(int)]
+
+        self.guide_orgs = [org[i] for i in picks]
+        self.bones.ctrl.guides = map_list(self.make_guide_control, self.guide_orgs)
+
+        if self.fold:
+            self.fold.panel_bones = self.bones.ctrl.guides
+
+        weights = interpolation_weights(fractions, fractions[picks])
+        guides = self.bones.ctrl.guides
+
+        self.feather_weights = {
+            name: [(guides[j], float(row[j])) for j in np.flatnonzero(row > 1e-4)]
+            for name, row in zip(org, weights) if name not in self.guide_orgs
+        }
+
+    def make_guide_control(self, org: str):
+        return self.copy_bone(org, make_derived_name(org, 'ctrl', '_guide'))
+
+    ##############################
+    # Field bones
+
+    @stage.generate_bones
+    def make_field_bones(self):
+        # Feathers that are bases of child rigs are driven by their own controls, so the field moves
+        # an MCH that the root bones of the child rig are moved under. Plain feathers are moved directly
+        # and get a deform bone, since Rigify only keeps deform on DEF bones.
+        org_set = set(self.bones.org)
+        self.child_rigs = {child.base_bone: child for child in self.rigify_children if child.base_bone in org_set}
+        self.field_bones = {}
+        self.plain_orgs = [org for org in self.bones.org if org not in self.child_rigs]
+
+        for org in self.bones.org:
+            if org in self.child_rigs:
+                self.field_bones[org] = self.copy_bone(org, make_derived_name(org, 'mch', '_field'))
+            else:
+                self.field_bones[org] = org
+
+        self.bones.deform = map_list(self.make_deform_bone, self.plain_orgs)
+
+        if self.fold:
+            self.fold.fold_bones = dict(self.field_bones)
+
+        # The Armature constraint applies the whole motion of the guides, so the feathers must not inherit it again
+        for org, bone in self.field_bones.items():
+            if org in self.feather_weights or bone != org:
+                self.generator.disable_auto_parent(bone)
+
+    def make_deform_bone(self, org: str):
+        name = self.copy_bone(org, make_derived_name(org, 'def'))
+        self.get_bone(name).use_deform = True
+        return name
+
+    @stage.parent_bones
+    def parent_field_bones(self):
+        for ctrl in self.bones.ctrl.guides:
+            self.set_bone_parent(ctrl, self.rig_parent_bone)
+
+        for org, bone in self.field_bones.items():
+            if org in self.feather_weights or bone != org:
+                self.set_bone_parent(bone, None)
+
+        for org, deform in zip(self.plain_orgs, self.bones.deform):
+            self.set_bone_parent(deform, org)
+
+    @stage.apply_bones
+    def apply_field_bones(self):
+        # Runs after the child rigs parented their bones
+        for org, child in self.child_rigs.items():
+            field = self.field_bones[org]
+            roots = [b for b in child.bones.flatten() if b != org and self.get_bone_parent(b) == self.base_bone]
+            for bone in [org, *roots]:
+                self.set_bone_parent(bone, field)
+
+    @stage.rig_bones
+    def rig_feathers(self):
+        for org, ctrl in zip(self.guide_orgs, self.bones.ctrl.guides):
+            self.make_constraint(self.field_bones[org], 'COPY_TRANSFORMS', ctrl)
+
+        for org, targets in self.feather_weights.items():
+            self.make_constraint(
+                self.field_bones[org], 'ARMATURE', targets=targets,
+                use_deform_preserve_volume=self.params.feather_field_preserve_volume
+            )
+
+    @stage.generate_widgets
+    def make_guide_widgets(self):
+        for ctrl in self.bones.ctrl.guides:
+            create_limb_widget(self.obj, ctrl)
+
+    @classmethod
+    def add_parameters(cls, params):
+        params.feather_field_guides = bpy.props.IntProperty(
+            name="Guide Controls", min=2, default=3,
+            description="Number of feathers, spread evenly along the fan, that get a control "
+                        "and drive the feathers between them"
+        )
+        params.feather_field_preserve_volume = bpy.props.BoolProperty(
+            name="Preserve Volume", default=True,
+            description="Blend the guide rotations with dual quaternions, so feathers between "
+                        "strongly rotated guides don't shrink"
+        )
+        feather_fold.add_parameters(params)
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        layout.prop(params, 'feather_field_guides')
+        layout.prop(params, 'feather_field_preserve_volume')
+        feather_fold.parameters_ui(layout, params)
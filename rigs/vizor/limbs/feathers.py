@@ -1,21 +1,24 @@
 import bpy
 from bpy.types import PoseBone
-from rigify.utils.rig import is_rig_base_bone, connected_children_names
 from rigify.utils.bones import put_bone
 from rigify.base_rig import BaseRig, stage, RigComponent
 from rigify.utils.naming import make_derived_name
 from rigify.utils.misc import map_list
 from itertools import count
 
-import mathutils
 from mathutils import Vector
 
+from ....utils import feather_fold
+from ....utils.feather_projection import find_feather_targets
+from ....utils.topology import get_topology
+
 class Rig(BaseRig):
     ''' This rig will collect metarig children bones of a feather rig bone and sort them by distance from the main
         org feather bone. So put main Feather rig bone to the right of the child bones. 
     '''
     create_stretch_mch: bool
     rig_parent_bone: str
+    fold: feather_fold.FeatherFold | None
 
     class CtrlBones(BaseRig.CtrlBones):
         first: str
@@ -25,6 +28,7 @@ class Rig(BaseRig):
         stretch: str
         damp_targets: list[str]
         damp_owners: list[str]
+        folds: list[str]
     
     bones: BaseRig.ToplevelBones[
         list[str],
@@ -34,7 +38,7 @@ class Rig(BaseRig):
     ]
 
     def find_org_bones(self, bone: PoseBone) -> list[str]:
-        children = [b.name for b in bone.children] #get names of the children bones
+        children = get_topology(self).children(bone.name) #get names of the children bones
         base_head = bone.bone.head
         children.sort()
         children.sort(key=lambda b: (self.get_bone(b).head - base_head).length)
@@ -49,6 +53,7 @@ class Rig(BaseRig):
         else:
             self.create_stretch_mch = True
         self.rig_parent_bone = self.get_bone_parent(self.bones.org[0])
+        self.fold = feather_fold.FeatherFold(self, self.bones.org) if self.params.feather_fold else None
     #CTRLS first & last
     @stage.generate_bones
     def make_ctrl_bones(self):
@@ -56,10 +61,12 @@ class Rig(BaseRig):
         
         if self.create_stretch_mch:
 
-            org_length = sum(self.get_bone(b).length for b in connected_children_names(self.obj, org[0])) + self.get_bone(org[0]).length
+            topology = get_topology(self)
+
+            org_length = sum(self.get_bone(b).length for b in topology.connected_chain(org[0])) + self.get_bone(org[0]).length
             self.bones.ctrl.first = self.copy_bone(org[0], make_derived_name(org[0], 'ctrl', '_first'),length=org_length*1.1)
             
-            org_length = sum(self.get_bone(b).length for b in connected_children_names(self.obj, org[-1])) + self.get_bone(org[-1]).length
+            org_length = sum(self.get_bone(b).length for b in topology.connected_chain(org[-1])) + self.get_bone(org[-1]).length
             self.bones.ctrl.last = self.copy_bone(org[-1], make_derived_name(org[-1], 'ctrl', '_last'),length=org_length*1.1)
     @stage.parent_bones
     def parent_ctrl_bones(self):
@@ -88,71 +95,16 @@ class Rig(BaseRig):
     @stage.generate_bones
     def make_target_bones(self):
         if self.create_stretch_mch:
-            self.bones.mch.damp_targets = map_list(self.make_target_bone, count(0), self.bones.org[1:-1])
+            feathers = self.bones.org[1:-1]
+            #tgt bones will be placed at the intersections of the feather bones and the stretch bone
+            positions = find_feather_targets(self, feathers, self.bones.mch.stretch)
+            self.bones.mch.damp_targets = map_list(self.make_target_bone, feathers, positions)
 
-    def make_target_bone(self, i: int, bone: str):
+    def make_target_bone(self, bone: str, new_pos: Vector):
         tgt_bone = self.copy_bone(bone, make_derived_name(bone, 'mch', '_target'))
-        new_pos = self.find_closest_projected_intersection(bone, self.bones.mch.stretch) #tgt bone will be placed at interseciton of feather bone and stretch bone
-        if new_pos is None:
-            self.raise_error(f"Cant find closest projection intersection for {bone}")
         put_bone(self.obj, tgt_bone, new_pos)
         return tgt_bone
-    
-    def find_closest_projected_intersection(self, bone2_name, bone1_name, projection_plane='XY'):
-        """Finds the intersection of an extended line of bone2 projected towards bone1 (2d plane)"""
-        obj = self.obj
-        bone1 = self.get_bone(bone1_name)
-        bone2 = self.get_bone(bone2_name)
-        
-        mat = obj.matrix_world
-        b1_head, b1_tail = mat @ bone1.head, mat @ bone1.tail
-        b2_head, b2_tail = mat @ bone2.head, mat @ bone2.tail
-
-        # Select projection plane
-        if projection_plane == 'XY':
-            b1_p1, b1_p2 = b1_head.xy, b1_tail.xy
-            b2_p1, b2_p2 = b2_head.xy, b2_tail.xy
-            z_coord = (b1_head.z + b1_tail.z + b2_head.z + b2_tail.z) / 4
-        elif projection_plane == 'XZ':
-            b1_p1, b1_p2 = b1_head.xz, b1_tail.xz
-            b2_p1, b2_p2 = b2_head.xz, b2_tail.xz
-            z_coord = (b1_head.y + b1_tail.y + b2_head.y + b2_tail.y) / 4
-        elif projection_plane == 'YZ':
-            b1_p1, b1_p2 = b1_head.yz, b1_tail.yz
-            b2_p1, b2_p2 = b2_head.yz, b2_tail.yz
-            z_coord = (b1_head.x + b1_tail.x + b2_head.x + b2_tail.x) / 4
-        else:
-            raise ValueError("Invalid projection plane. Use 'XY', 'XZ', or 'YZ'.")
-
-        # Extend bone2 into an infinite line by treating it as a segment going to infinity
-        def extend_point(p1, p2, factor=1000):
-            """Extend a segment infinitely by moving points outward."""
-            direction = (p2 - p1).normalized()
-            return p1 - direction * factor, p2 + direction * factor
-
-        extended_b2_p1, extended_b2_p2 = extend_point(b2_p1, b2_p2)
 
-        # Find intersection of the extended line with bone1
-        intersection = mathutils.geometry.intersect_line_line_2d(b1_p1, b1_p2, extended_b2_p1, extended_b2_p2)
-
-        if intersection:
-            # Convert 2D point back to 3D
-            if projection_plane == 'XY':
-                intersection_3d = mathutils.Vector((intersection.x, intersection.y, z_coord))
-            elif projection_plane == 'XZ':
-                intersection_3d = mathutils.Vector((intersection.x, z_coord, intersection.y))
-            elif projection_plane == 'YZ':
-                intersection_3d = mathutils.Vector((z_coord, intersection.x, intersection.y))
-
-            # Ensure the intersection is on the finite bone1 segment
-            closest_point, factor = mathutils.geometry.intersect_point_line(intersection_3d, b1_head, b1_tail)
-            
-            if 0.0 <= factor <= 1.0:
-                return closest_point  # Valid intersection inside main_bone segment
-            else:
-                return b1_head if factor < 0 else b1_tail  # Use the closest bone1 endpoint
-
-        return None  # No valid intersection
     @stage.parent_bones
     def parent_target_bones(self):
         if self.create_stretch_mch:
@@ -172,4 +124,42 @@ class Rig(BaseRig):
     def rig_damped_bones(self):
         if self.create_stretch_mch:
             for owner, target in zip(self.bones.mch.damp_owners, self.bones.mch.damp_targets):
-                self.make_constraint(owner, 'DAMPED_TRACK', target)
\ No newline at end of file
+                self.make_constraint(owner, 'DAMPED_TRACK', target)
+    #MCH fold bones
+    #the feathers are usually bases of child rigs that copy their own controls, so the fold rotates
+    #a bone between the rig bone and the root bones of the feather instead of the ORG itself
+    @stage.generate_bones
+    def make_fold_bones(self):
+        if self.fold:
+            folded = list(self.fold.rotations)
+            self.bones.mch.folds = map_list(self.make_fold_bone, folded)
+            self.fold.fold_bones = dict(zip(folded, self.bones.mch.folds))
+    def make_fold_bone(self, bone: str):
+        return self.copy_bone(bone, make_derived_name(bone, 'mch', '_fold'), parent=True)
+    @stage.parent_bones
+    def find_fold_panel_bones(self):
+        if self.fold:
+            panel_bones = [self.bones.ctrl.first, self.bones.ctrl.last] if self.create_stretch_mch else []
+            for child in self.rigify_children:
+                if child.base_bone in self.fold.fold_bones:
+                    panel_bones += child.bones.flatten('ctrl')
+            self.fold.panel_bones = panel_bones
+    @stage.apply_bones
+    def apply_fold_bones(self):
+        #runs after the child rigs parented their bones
+        if self.fold:
+            child_rigs = {child.base_bone: child for child in self.rigify_children}
+            for org, fold in self.fold.fold_bones.items():
+                roots = [org]
+                if child := child_rigs.get(org):
+                    roots += [b for b in child.bones.flatten() if b != org and self.get_bone_parent(b) == self.base_bone]
+                for bone in roots:
+                    self.set_bone_parent(bone, fold)
+
+    @classmethod
+    def add_parameters(cls, params):
+        feather_fold.add_parameters(params)
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        feather_fold.parameters_ui(layout, params)
@@ -10,6 +10,7 @@ import itertools
 import bisect
 import math
 import json
+import numpy as np
 
 from rigify.utils.naming import strip_org, make_derived_name
 from rigify.utils.bones import set_bone_widget_transform, align_bone_orientation
@@ -22,6 +23,7 @@ from rigify.utils.animation import add_generic_snap_fk_to_ik
 from rigify.utils.switch_parent import SwitchParentBuilder
 
 from rigify.base_rig import stage
+from rigify.base_generate import GeneratorPlugin
 from rigify.rig_ui_template import PanelLayout, UTILITIES_FUNC_COMMON_IK_FK
 
 from rigify.rigs.chain_rigs import SimpleChainRig
@@ -30,6 +32,28 @@ from rigify.rigs.widgets import create_gear_widget
 from typing import NamedTuple, Sequence
 from itertools import count
 
+from ....utils.arc_length import (SCRIPT_UTILITIES_ARC_LENGTH, auto_bezier_polylines,
+                                  resample_polylines)
+from ....utils.profiling import write_report_text
+
+
+# Curve resolutions tried by the automatic resolution, from the cheapest
+AUTO_CURVE_RESOLUTIONS = (1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 48, 64)
+
+AUTO_RESOLUTION_TEXT = 'vizor_spline_resolution'
+
+
+class AutoResolutionReport(GeneratorPlugin):
+    """Collects the automatic spline fits of all tentacles of a generation, and reports them at the end."""
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.lines: list[str] = []
+
+    def finalize(self):
+        write_report_text(AUTO_RESOLUTION_TEXT, '\n'.join(self.lines) + '\n')
+
 
 class Rig(SimpleChainRig):
     ##############################
@@ -48,6 +72,10 @@ class Rig(SimpleChainRig):
     use_tip: bool
     use_fk: bool
     use_radius: bool
+    use_radius_keys: bool
+    use_radius_scale: bool
+    use_lod: bool
+    use_driver_free: bool
     max_curve_radius: float
 
     org_lengths: list[float]
@@ -63,6 +91,7 @@ class Rig(SimpleChainRig):
         name: str
 
     num_main_controls: int
+    curve_resolution: int | None
     main_control_pos_list: list['Rig.PosSpec']
     start_control_pos_list: list['Rig.PosSpec']
     end_control_pos_list: list['Rig.PosSpec']
@@ -97,6 +126,8 @@ class Rig(SimpleChainRig):
         self.use_stretch = (self.stretch_control_mode == 'MANUAL_STRETCH')
         self.use_tip = (self.stretch_control_mode == 'DIRECT_TIP')
         self.use_fk = self.params.sik_fk_controls
+        self.use_lod = self.params.sik_lod_switch
+        self.use_driver_free = self.params.sik_driver_free
 
         # Compute org chain lengths and control distribution
         if self.use_tip:
@@ -107,10 +138,26 @@ class Rig(SimpleChainRig):
         self.chain_length = self.org_tot_lengths[-1]
         self.avg_length = self.chain_length / len(org_bones)
 
-        end_idx = len(org_bones) - 1
+        # Find which bones hold main controls, and pick the curve resolution
+        self.curve_resolution = None
+
+        if self.params.sik_auto_resolution:
+            self.fit_spline_resolution(org_bones)
+        else:
+            self.layout_controls(self.params.sik_mid_controls)
+
+        # Radius scaling
+        self.use_radius = self.params.sik_radius_scaling
+        self.use_radius_keys = self.use_radius and self.params.sik_radius_mode == 'SHAPE_KEYS'
+        self.use_radius_scale = self.use_radius and self.params.sik_radius_mode == 'SCALE_RAMP'
+        self.max_curve_radius = self.params.sik_max_radius if self.use_radius_keys else 1.0
+
+    def layout_controls(self, num_mid_controls: int):
+        """Distribute the main and extra control positions along the chain."""
+        org_chain = self.bones.org
+        end_idx = len(self.org_lengths) - 1
 
-        # Find which bones hold main controls
-        self.num_main_controls = self.params.sik_mid_controls + 2
+        self.num_main_controls = num_mid_controls + 2
         main_control_step = self.chain_length / (self.num_main_controls - 1)
 
         self.main_control_pos_list = [
@@ -149,9 +196,55 @@ class Rig(SimpleChainRig):
             self.end_control_pos_list[0] = self.PosSpec(
                 end_idx, max(0.0, 1 - end_range * 0.25), self.make_name('end'))
 
-        # Radius scaling
-        self.use_radius = self.params.sik_radius_scaling
-        self.max_curve_radius = self.params.sik_max_radius if self.use_radius else 1.0
+    def fit_spline_resolution(self, org_bones):
+        """
+        Pick the cheapest middle control count and curve resolution for which the spline through
+        the rest pose controls follows the chain joints within the tolerance.
+        """
+        joints = np.array([*(bone.head for bone in org_bones), org_bones[-1].tail])
+        fractions = np.array([0, *self.org_tot_lengths]) / self.chain_length
+        tolerance = self.params.sik_auto_tolerance * self.chain_length
+
+        def control_point(pos_spec):
+            idx, head_tail = pos_spec[0], pos_spec[1]
+            if idx >= len(org_bones):
+                return joints[-1]
+            return joints[idx] + (joints[idx + 1] - joints[idx]) * head_tail
+
+        best = None
+
+        for num_mid in range(max(2, len(org_bones))):
+            self.layout_controls(num_mid)
+
+            pos_specs = [self.main_control_pos_list[0], *reversed(self.start_control_pos_list),
+                         *self.main_control_pos_list[1:-1], *self.end_control_pos_list,
+                         self.main_control_pos_list[-1]]
+            points = np.array([list(map(control_point, pos_specs))])
+
+            for resolution in AUTO_CURVE_RESOLUTIONS:
+                polyline = auto_bezier_polylines(points, resolution)
+                fitted, _ = resample_polylines(polyline, fractions)
+                error = float(np.max(np.linalg.norm(fitted[0] - joints, axis=1)))
+
+                if best is None or error < best[0]:
+                    best = (error, num_mid, resolution)
+
+                if error <= tolerance:
+                    break
+            else:
+                continue
+
+            break
+        else:
+            error, num_mid, resolution = best
+            self.layout_controls(num_mid)
+
+        self.curve_resolution = resolution
+
+        AutoResolutionReport(self.generator).lines.append(
+            f"{strip_org(self.base_bone)}: resolution {resolution}, {num_mid} middle controls, "
+            f"rest pose error {error:.4g} ({error / self.chain_length:.2%} of the chain length"
+            f"{'' if error <= tolerance else ', over tolerance'})")
 
     ##############################
     # Utilities
@@ -163,6 +256,14 @@ class Rig(SimpleChainRig):
         prev = tot_lengths[idx - 1] if idx > 0 else 0
         return self.PosSpec(idx, min(1.0, (pos - prev) / (tot_lengths[idx] - prev)), name)
 
+    def get_pos_spec_length(self, pos_spec: 'Rig.PosSpec'):
+        """Distance along the chain of a position spec."""
+        idx = pos_spec[0]
+        if idx >= len(self.org_lengths):
+            return self.chain_length
+        prev = self.org_tot_lengths[idx - 1] if idx > 0 else 0
+        return prev + pos_spec[1] * self.org_lengths[idx]
+
     def make_name(self, mid_part: str):
         """Make a name for a bone not tied to a specific org bone"""
         return self.name_base + self.name_sep + mid_part + self.name_suffix
@@ -225,6 +326,7 @@ class Rig(SimpleChainRig):
         ik: list[str]                  # Spline IK chain, extracting the shape of the curve.
         ik_final: list[str]            # Final IK result with tip_fix.
         end_stretch: str               # Bone used in distributing the end twist control scaling.
+        end_twist: str                 # Per bone share of the end twist, without per bone drivers.
         tip_fix_parent: str            # Bones used to match tip control rotation and scale.
         tip_fix: str
         rot: str
@@ -282,6 +384,9 @@ class Rig(SimpleChainRig):
 
             self.add_end_controls_buttons(panel, master, rig_name)
 
+        if self.params.sik_start_controls > 0 or self.params.sik_end_controls > 0:
+            add_toggle_controls_batch_buttons(panel)
+
         # End twist correction for directly controllable tip
         if self.use_tip:
             max_val = len(self.bones.org) * math.pi
@@ -301,6 +406,30 @@ class Rig(SimpleChainRig):
 
             self.add_fk_snap_buttons(panel, master, rig_name)
 
+        # Level of detail switch
+        if self.use_lod:
+            self.make_property(
+                master, 'lod', 0, min=0, max=1,
+                description="Current level of detail of " + rig_name + ", changed with the level of detail "
+                            "buttons. Setting or keying it directly has no effect"
+            )
+
+            self.add_lod_buttons(panel, master, rig_name)
+
+        # Export of the deformation as plain FK keys
+        add_spline_bake_deform(panel, deform_bones=self.bones.deform, rig_name=rig_name)
+
+    def add_lod_buttons(self, panel: 'PanelLayout', master: str, _rig_name: str):
+        ik_bones = [*self.bones.mch.ik]
+
+        if self.use_tip:
+            ik_bones += [self.bones.mch.tip_fix_parent, self.bones.mch.tip_fix, *self.bones.mch.ik_final]
+
+        add_spline_lod_buttons(
+            panel, prop_bone=master, ik_bones=ik_bones,
+            org_bones=self.bones.org, org_targets=self.get_ik_final(), use_fk=self.use_fk
+        )
+
     def add_start_controls_buttons(self, panel: 'PanelLayout', master: str, _rig_name: str):
         row = panel.row(align=True)
         row.custom_prop(master, 'start_controls', text="Start Controls")
@@ -348,12 +477,16 @@ class Rig(SimpleChainRig):
             rig_name=rig_name
         )
 
+        twist_bone, twist_share = self.get_twist_source() if self.use_driver_free else ('', 1.0)
+
         add_spline_snap_ik_to_fk(
             panel,
             fk_bones=self.bones.ctrl.fk, ik_bones=self.get_ik_final(),
             ik_ctrl_bones=ik_controls,
             use_tip=self.use_tip,
             use_stretch=self.use_stretch,
+            twist_bone=twist_bone,
+            twist_share=twist_share,
             rig_name=rig_name
         )
 
@@ -394,8 +527,10 @@ class Rig(SimpleChainRig):
 
     @stage.rig_bones
     def rig_twist_control_bones(self):
-        if not self.use_tip:
+        if not self.use_tip and not self.use_driver_free:
             # Copy the location of the end bone to provide more convenient tool behavior.
+            # Without drivers the IK chain reads the control through constraints, so it must stay
+            # independent of the chain; the widget is still displayed at the end bone.
             self.make_constraint(self.bones.ctrl.end_twist, 'COPY_LOCATION', self.bones.org[-1])
 
     @stage.generate_widgets
@@ -416,6 +551,9 @@ class Rig(SimpleChainRig):
         if self.use_stretch:
             self.bones.mch.end_stretch = self.make_mch_end_stretch_bone('end-twist.stretch', 1.15)
 
+        if self.use_tip and self.use_driver_free:
+            self.bones.mch.end_twist = self.make_mch_end_stretch_bone('end-twist', 1.15)
+
     def make_mch_end_stretch_bone(self, name_base, size):
         name = make_derived_name(self.make_name(name_base), 'mch')
         return self.copy_bone(self.bones.org[0], name, length=self.avg_length * size * 0.5)
@@ -425,19 +563,38 @@ class Rig(SimpleChainRig):
         if self.use_stretch:
             self.set_bone_parent(self.bones.mch.end_stretch, self.bones.ctrl.master, inherit_scale='AVERAGE')
 
+        if self.use_tip and self.use_driver_free:
+            self.set_bone_parent(self.bones.mch.end_twist, self.bones.ctrl.master, inherit_scale='NONE')
+
     @stage.rig_bones
     def rig_mch_twist_control_bones(self):
         if self.use_stretch:
             self.rig_mch_end_stretch_bone(self.bones.mch.end_stretch, self.bones.ctrl.end_twist)
 
+        if self.use_tip and self.use_driver_free:
+            self.rig_mch_end_twist_bone(self.bones.mch.end_twist)
+
     def rig_mch_end_stretch_bone(self, mch, ctrl):
-        # Break the dependency cycle caused by COPY_LOCATION above by copying raw properties.
-        self.make_driver(mch, 'scale', index=0, variables=[(ctrl, '.scale.x')])
-        self.make_driver(mch, 'scale', index=1, variables=[(ctrl, '.scale.y')])
-        self.make_driver(mch, 'scale', index=2, variables=[(ctrl, '.scale.z')])
+        if self.use_driver_free:
+            # The control has no COPY_LOCATION in this mode, so its local scale can be copied directly.
+            self.make_constraint(mch, 'COPY_SCALE', ctrl, space='LOCAL')
+        else:
+            # Break the dependency cycle caused by COPY_LOCATION above by copying raw properties.
+            self.make_driver(mch, 'scale', index=0, variables=[(ctrl, '.scale.x')])
+            self.make_driver(mch, 'scale', index=1, variables=[(ctrl, '.scale.y')])
+            self.make_driver(mch, 'scale', index=2, variables=[(ctrl, '.scale.z')])
 
         self.make_constraint(mch, 'MAINTAIN_VOLUME', mode='UNIFORM', owner_space='LOCAL')
 
+    def rig_mch_end_twist_bone(self, mch):
+        # A single driver converts the end twist property into the share of one chain bone, which
+        # stays within the +-180 degree range of the twist constraints as long as the property does.
+        self.get_bone(mch).rotation_mode = 'XYZ'
+
+        self.make_driver(
+            mch, 'rotation_euler', index=1, expression='var / %d' % len(self.bones.org),
+            variables=[(self.bones.ctrl.master, 'end_twist')])
+
     ##############################
     # Spline controls
 
@@ -670,9 +827,12 @@ class Rig(SimpleChainRig):
         spline_data = self.spline_obj.data
         spline_data.dimensions = '3D'
 
+        if self.curve_resolution:
+            spline_data.resolution_u = self.curve_resolution
+
         self.make_spline_points(spline_data, self.all_controls)
 
-        if self.use_radius:
+        if self.use_radius_keys:
             self.make_spline_keys(self.spline_obj, self.all_controls)
 
     def make_spline_points(self, spline_data, all_controls):
@@ -700,7 +860,7 @@ class Rig(SimpleChainRig):
         for i, info in enumerate(self.all_controls):
             self.rig_spline_hook(i, *info)
 
-        if self.use_radius:
+        if self.use_radius_keys:
             controls = self.all_controls[1:-1] if self.use_tip else self.all_controls[1:]
 
             for i, info in enumerate(controls):
@@ -727,10 +887,10 @@ class Rig(SimpleChainRig):
         hooks = self.mch_hooks_table[subtype]
         target = hooks[index] if hooks else ctrl
 
-        expr = '1 - var'
-        scale_var = [driver_var_transform(self.obj, target, type='SCALE_AVG', space='LOCAL')]
+        scale_var = driver_var_transform(self.obj, target, type='SCALE_AVG', space='LOCAL')
+
+        make_driver(key, 'value', expression='1 - var', variables=[scale_var])
 
-        make_driver(key, 'value', expression=expr, variables=scale_var)
         key.slider_min = 1 - self.max_curve_radius
 
     ##############################
@@ -763,13 +923,16 @@ class Rig(SimpleChainRig):
 
         # Apply end twist rotation
         rot_fac = 1.0 / num_ik
-        if self.use_tip:
-            rot_var = [(self.bones.ctrl.master, 'end_twist')]
+        if self.use_driver_free:
+            self.rig_mch_ik_twist_constraint(mch)
         else:
-            rot_var = [(self.bones.ctrl.end_twist, '.rotation_euler.y')]
+            if self.use_tip:
+                rot_var = [(self.bones.ctrl.master, 'end_twist')]
+            else:
+                rot_var = [(self.bones.ctrl.end_twist, '.rotation_euler.y')]
 
-        self.make_driver(
-            mch, 'rotation_euler', index=1, expression='var * %f' % rot_fac, variables=rot_var)
+            self.make_driver(
+                mch, 'rotation_euler', index=1, expression='var * %f' % rot_fac, variables=rot_var)
 
         # Copy the common scale
         self.make_constraint(mch, 'COPY_SCALE', self.bones.ctrl.main[0])
@@ -781,13 +944,72 @@ class Rig(SimpleChainRig):
                 power=(i + 1) / num_ik
             )
 
+        if self.use_radius_scale:
+            self.rig_mch_ik_radius_scale(i, mch)
+
+    def get_twist_source(self):
+        """The bone holding the end twist read by the twist constraints, and the share of each chain bone."""
+        if self.use_tip:
+            return self.bones.mch.end_twist, 1.0
+        return self.bones.ctrl.end_twist, 1.0 / len(self.bones.org)
+
+    def rig_mch_ik_twist_constraint(self, mch):
+        # Map the Y twist of the source to a share of it, like the per bone driver does. Unlike the
+        # driver, this only covers twisting the end control within +-180 degrees.
+        source, share = self.get_twist_source()
+
+        self.make_constraint(
+            mch, 'TRANSFORM', source, space='LOCAL',
+            map_from='ROTATION', from_rotation_mode='SWING_TWIST_Y',
+            from_min_y_rot=-math.pi, from_max_y_rot=math.pi,
+            map_to='ROTATION', map_to_y_from='Y',
+            to_min_y_rot=-math.pi * share, to_max_y_rot=math.pi * share,
+        )
+
+    def get_radius_scale_sources(self):
+        """List the chain positions of the spline points and the bones providing their radius."""
+        pos_specs = [self.main_control_pos_list[0], *reversed(self.start_control_pos_list),
+                     *self.main_control_pos_list[1:-1], *self.end_control_pos_list,
+                     self.main_control_pos_list[-1]]
+
+        # Like the radius shape keys, the first point and the direct tip keep the radius 1
+        sources = [None]
+
+        for (bone, subtype, index) in self.all_controls[1:]:
+            hooks = self.mch_hooks_table[subtype]
+            sources.append(hooks[index] if hooks else bone)
+
+        if self.use_tip:
+            sources[-1] = None
+
+        return sorted(zip(map(self.get_pos_spec_length, pos_specs), sources), key=lambda item: item[0])
+
+    def rig_mch_ik_radius_scale(self, i, mch):
+        # Interpolate the thickness scale of the two closest spline points with scale power ramps,
+        # instead of driving a curve radius shape key for every point.
+        points = self.get_radius_scale_sources()
+        pos = self.org_tot_lengths[i] - self.org_lengths[i] / 2
+
+        idx = bisect.bisect_right([length for length, _ in points], pos)
+        idx = min(max(idx, 1), len(points) - 1)
+        (prev_pos, prev_src), (next_pos, next_src) = points[idx - 1], points[idx]
+
+        fac = (pos - prev_pos) / (next_pos - prev_pos) if next_pos > prev_pos else 1.0
+
+        for source, power in ((prev_src, 1 - fac), (next_src, fac)):
+            if source and power > 0:
+                self.make_constraint(
+                    mch, 'COPY_SCALE', source, use_offset=True, space='LOCAL',
+                    use_y=False, power=power
+                )
+
     def rig_mch_ik_constraint(self, mch):
         ik_bone = self.get_bone(mch)
 
         make_constraint(
             ik_bone, 'SPLINE_IK', self.spline_obj,
             chain_count=len(self.bones.mch.ik),
-            use_curve_radius=self.use_radius,
+            use_curve_radius=self.use_radius_keys,
             y_scale_mode='BONE_ORIGINAL' if self.use_stretch else 'FIT_CURVE',
             xz_scale_mode='VOLUME_PRESERVE',
             use_original_scale=True,
@@ -887,7 +1109,6 @@ class Rig(SimpleChainRig):
 
         if self.use_fk:
             con = self.make_constraint(org, 'COPY_TRANSFORMS', self.bones.ctrl.fk[i])
-
             self.make_driver(con, 'influence', variables=[(self.bones.ctrl.master, 'IK_FK')])
 
     ##############################
@@ -937,9 +1158,21 @@ class Rig(SimpleChainRig):
             description="Number of extra spline control points attached to the start control"
         )
         params.sik_mid_controls = bpy.props.IntProperty(
-            name="Middle Controls", min=1, default=1,
+            name="Middle Controls", min=0, default=1,
             description="Number of spline control points in the middle"
         )
+        params.sik_auto_resolution = bpy.props.BoolProperty(
+            name="Auto Resolution",
+            default=False,
+            description="Choose the number of middle controls and the curve resolution automatically, "
+                        "as the cheapest ones that follow the rest shape of the chain within the tolerance"
+        )
+        params.sik_auto_tolerance = bpy.props.FloatProperty(
+            name="Tolerance",
+            default=0.01, min=0.0001, max=0.5, precision=4,
+            description="Allowed deviation of the curve from the rest pose joints, "
+                        "relative to the chain length"
+        )
         params.sik_end_controls = bpy.props.IntProperty(
             name="Extra End Controls", min=0, default=1,
             description="Number of extra spline control points attached to the end control"
@@ -961,6 +1194,14 @@ class Rig(SimpleChainRig):
             description="Allow scaling the spline control bones to affect the thickness via "
                         "curve radius"
         )
+        params.sik_radius_mode = bpy.props.EnumProperty(
+            name="Radius Mode",
+            description="How the scale of the spline controls is applied to the thickness",
+            items=[('SHAPE_KEYS', 'Curve Radius', 'Drive the curve radius with one shape key per control'),
+                   ('SCALE_RAMP', 'Scale Constraints',
+                    'Copy the control scale into the IK chain with interpolating scale constraints, '
+                    'without shape keys or drivers')]
+        )
         params.sik_max_radius = bpy.props.FloatProperty(
             name="Maximum Radius", min=1, default=10,
             description="Maximum supported scale factor for the spline control bones"
@@ -970,6 +1211,19 @@ class Rig(SimpleChainRig):
             name="FK Controls", default=True,
             description="Generate an FK control chain for the tentacle"
         )
+        params.sik_lod_switch = bpy.props.BoolProperty(
+            name="Level Of Detail Switch", default=False,
+            description="Add level of detail buttons to the rig panel. The low level mutes the constraints and "
+                        "drivers of the spline IK chain, the curve hooks and the radius shape keys and hides "
+                        "the curve, following the FK chain instead or keeping the rest shape relative to the "
+                        "master control without FK controls. The level is not animatable"
+        )
+        params.sik_driver_free = bpy.props.BoolProperty(
+            name="Driver-Free Twist And Stretch", default=False,
+            description="Rig the end twist and stretch with constraints instead of drivers on every chain bone. "
+                        "The end twist control then only twists within 180 degrees, and stays at the tentacle "
+                        "base instead of following the tip"
+        )
         params.separate_rotation = bpy.props.BoolProperty(
             name='Separate Rotation',
             description='Add MCH to copy Rotation from Root bone',
@@ -985,7 +1239,14 @@ class Rig(SimpleChainRig):
         layout.label(icon='INFO', text='A straight line rest shape works best.')
 
         layout.prop(params, 'sik_start_controls')
-        layout.prop(params, 'sik_mid_controls')
+
+        row = layout.row(align=True)
+        row.prop(params, 'sik_auto_resolution', text='', icon='AUTO')
+        if params.sik_auto_resolution:
+            row.prop(params, 'sik_auto_tolerance')
+        else:
+            row.prop(params, 'sik_mid_controls')
+
         layout.prop(params, 'sik_end_controls')
 
         if cls.stretch_control_mode is None:
@@ -995,9 +1256,15 @@ class Rig(SimpleChainRig):
 
         col = layout.column()
         col.active = params.sik_radius_scaling
-        col.prop(params, 'sik_max_radius')
+        col.prop(params, 'sik_radius_mode', text='')
+
+        row = col.row()
+        row.active = params.sik_radius_mode == 'SHAPE_KEYS'
+        row.prop(params, 'sik_max_radius')
 
         layout.prop(params, 'sik_fk_controls')
+        layout.prop(params, 'sik_lod_switch')
+        layout.prop(params, 'sik_driver_free')
         layout.prop(params, 'separate_rotation')
 
         col = layout.column()
@@ -1011,7 +1278,7 @@ class Rig(SimpleChainRig):
 
 SCRIPT_REGISTER_OP_SNAP_IK_FK = ['POSE_OT_rigify_spline_tentacle_ik2fk']
 
-SCRIPT_UTILITIES_OP_SNAP_IK_FK = UTILITIES_FUNC_COMMON_IK_FK + ['''
+SCRIPT_UTILITIES_OP_SNAP_IK_FK = UTILITIES_FUNC_COMMON_IK_FK + SCRIPT_UTILITIES_ARC_LENGTH + ['''
 ########################
 ## Limb Snap IK to FK ##
 ########################
@@ -1022,14 +1289,62 @@ class RigifySplineTentacleIk2FkBase:
     ctrl_bones:   StringProperty(name="IK Controls")
     use_tip:      bpy.props.BoolProperty(name="Direct Tip Control")
     use_stretch:  bpy.props.BoolProperty(name="Manual Stretch")
+    twist_bone:   StringProperty(name="Twist Source", description="Source of the twist constraints, if any")
+    twist_share:  bpy.props.FloatProperty(name="Twist Share", default=1.0)
 
     def init_execute(self, context):
+        self.init_bone_lists()
+        self.init_ik_model(context.active_object)
+
+    def init_bone_lists(self):
         self.fk_bone_list = json.loads(self.fk_bones)
         self.ik_bone_list = json.loads(self.ik_bones)
         self.ctrl_bone_list = json.loads(self.ctrl_bones)
         if not self.use_tip:
             self.twist_control_bone = self.ctrl_bone_list.pop()
 
+    def init_ik_model(self, obj):
+        # Constant data of the closed form model of the spline IK chain. With a direct tip control
+        # the IK result bones are children of the spline IK chain bones, with the same rest pose.
+        bones = obj.data.bones
+        result_chain = self.ik_bone_list[:-1] if self.use_tip else self.ik_bone_list
+        self.ik_chain = [bones[name].parent.name for name in result_chain] if self.use_tip else result_chain
+
+        ik_rest = [bones[name].matrix_local.to_quaternion() for name in self.ik_chain]
+        ctrl_rest = bones[self.ctrl_bone_list[0]].matrix_local.to_quaternion()
+
+        self.ik_rest_deltas = [
+            prev.inverted() @ cur for prev, cur in zip([ctrl_rest, *ik_rest], ik_rest)
+        ]
+        self.ik_lengths = [bones[name].length for name in self.ik_chain]
+        self.ik_total_length = sum(self.ik_lengths)
+        self.ik_fractions = []
+        cur_length = 0
+        for length in self.ik_lengths:
+            cur_length += length
+            self.ik_fractions.append(cur_length / self.ik_total_length)
+
+        spline_ik = next(
+            (con for con in obj.pose.bones[self.ik_chain[-1]].constraints if con.type == 'SPLINE_IK'), None)
+        has_curve = spline_ik is not None and spline_ik.target is not None
+        self.curve_resolution = spline_ik.target.data.resolution_u if has_curve else 12
+        self.fit_curve = spline_ik.y_scale_mode == 'FIT_CURVE' if spline_ik else not self.use_stretch
+
+        if self.use_tip:
+            self.tip_fix_delta = ik_rest[-1].inverted() @ bones[self.fk_bone_list[-1]].matrix_local.to_quaternion()
+
+        # Bones whose Y rotation is the end twist of the chain, either set by drivers on every
+        # chain bone, or read by the twist constraints of the chain from one source bone
+        self.twist_source = [self.twist_bone] if self.twist_bone else self.ik_chain
+
+    def model_ik_twists(self, values):
+        # Twist of every chain bone from the Y rotations of the twist source bones, shaped (frames, bones)
+        if not self.twist_bone:
+            return values
+
+        wrapped = (values[:, :1] + np.pi) % (2 * np.pi) - np.pi
+        return np.repeat(wrapped * self.twist_share, len(self.ik_chain), axis=1)
+
     def save_frame_state(self, context, obj):
         matrices = get_chain_transform_matrices(obj, self.fk_bone_list)
         if not self.use_tip:
@@ -1038,15 +1353,79 @@ class RigifySplineTentacleIk2FkBase:
             matrices.append(last_tail)
         return matrices
 
+    def compute_ik_chain(self, curve_points, base_rot, base_scale):
+        # Pose matrices of the spline IK chain for the given curve points, and the rotation and
+        # scale of the start control, as the spline IK constraint would compute them.
+        polyline = auto_bezier_polylines(np.array([curve_points]), self.curve_resolution)
+        fractions = np.array([0.0, *self.ik_fractions])
+
+        if not self.fit_curve:
+            curve_len = polyline_arc_lengths(polyline)[0, -1]
+            fractions *= base_scale.y * self.ik_total_length / curve_len if curve_len > 0 else 0
+
+        joints = [Vector(co) for co in resample_polylines(polyline, fractions)[0][0]]
+
+        matrices = []
+        rot = base_rot
+
+        for head, tail, delta, length, twist in zip(
+                joints, joints[1:], self.ik_rest_deltas, self.ik_lengths, self.ik_twists):
+            rot = rot @ delta @ Euler((0, twist, 0)).to_quaternion()
+            direction = tail - head
+
+            if direction.length > 1e-8:
+                rot = (rot @ Vector((0, 1, 0))).rotation_difference(direction) @ rot
+
+            if self.fit_curve:
+                y_scale = direction.length / length
+                xz_scale = (base_scale.y / y_scale) ** 0.5 if y_scale > 0 else 1.0
+                scale = Vector((base_scale.x * xz_scale, y_scale, base_scale.z * xz_scale))
+            else:
+                scale = base_scale
+
+            matrices.append(Matrix.LocRotScale(head, rot, scale))
+
+        return matrices
+
+    def apply_tip_fix(self, ik_matrices, base_scale, tip_matrix, tip_length):
+        # Rotation and scale the first IK result bone gets from the direct tip control, as a
+        # fraction of the difference between the tip control and the end of the spline IK chain.
+        end = ik_matrices[-1]
+        base_rot = end.to_quaternion() @ self.tip_fix_delta @ Euler((0, self.ik_twists[-1], 0)).to_quaternion()
+        head = end.translation + end.to_3x3() @ Vector((0, self.ik_lengths[-1], 0))
+        tip_tail = tip_matrix.translation + tip_matrix.to_3x3() @ Vector((0, tip_length, 0))
+        direction = tip_tail - head
+
+        if direction.length > 1e-8:
+            base_rot = (base_rot @ Vector((0, 1, 0))).rotation_difference(direction) @ base_rot
+
+        fix_twist = (base_rot.inverted() @ tip_matrix.to_quaternion()).to_swing_twist('Y')[1]
+        fix_scale = [t / b for t, b in zip(tip_matrix.to_scale(), base_scale)]
+        factor = 1 / (len(self.ik_lengths) + 1)
+
+        first = ik_matrices[0]
+        rot = first.to_quaternion() @ Euler((0, fix_twist * factor, 0)).to_quaternion()
+        scale = first.to_scale()
+        scale = Vector((scale.x * pow(fix_scale[0], factor), scale.y, scale.z * pow(fix_scale[2], factor)))
+
+        return Matrix.LocRotScale(first.translation, rot, scale)
+
+    @staticmethod
+    def maintain_volume_scale(scale):
+        # Effect of a uniform MAINTAIN_VOLUME constraint with the free Y axis in local space
+        total = scale[0] * scale[1] * scale[2]
+        fac = (1 / abs(total)) ** 0.5 if total else 1.0
+        return Vector((scale[0] * fac, scale[1], scale[2] * fac))
+
     def apply_frame_state(self, context, obj, all_matrices):
-        ik_bones = [obj.pose.bones[k] for k in self.ik_bone_list]
         ctrl_bones = [obj.pose.bones[k] for k in self.ctrl_bone_list]
 
         # Reset transformation of controls
         for name in self.ctrl_bone_list + ([] if self.use_tip else [self.twist_control_bone]):
             set_transform_from_matrix(obj, name, Matrix.Identity(4), space='LOCAL', keyflags=self.keyflags)
 
-        # Position the first and last controls and update to ensure switchable parent is ready
+        # Position the first and last controls and update to ensure switchable parent is ready.
+        # This is the only depsgraph update: the IK result is computed from the model below.
         set_transform_from_matrix(
             obj, self.ctrl_bone_list[0], all_matrices[0], keyflags=self.keyflags, no_scale=True, no_rot=True)
 
@@ -1055,6 +1434,14 @@ class RigifySplineTentacleIk2FkBase:
 
         context.view_layer.update()
 
+        # Current end twist of the IK chain bones, computed by their drivers or constraints
+        self.ik_twists = self.model_ik_twists(
+            np.array([[obj.pose.bones[name].rotation_euler.y for name in self.twist_source]]))[0]
+
+        start_matrix = ctrl_bones[0].matrix.copy()
+        start_rot = start_matrix.to_quaternion()
+        start_scale = start_matrix.to_scale()
+
         # Find currently enabled controls
         visible_ctrls = [
             bone for bone in ctrl_bones[1:-1]
@@ -1066,34 +1453,53 @@ class RigifySplineTentacleIk2FkBase:
             (min((i+1) / ctrl_count, max_pos), ctrl) for i, ctrl in enumerate(visible_ctrls)
         ]
 
-        # Measure the fk polyline
+        # Snap visible controls evenly to the fk polyline
         points = [m.translation for m in all_matrices]
-        lengths = [(n - p).length for p, n in zip(points, points[1:])]
-        tot_length = sum(lengths)
-
-        # Snap visible controls evenly to the polyline
-        total = 0
-
-        for seg_len, p, n in zip(lengths, points, points[1:]):
-            prev_total = total
-            total += seg_len / tot_length
-            while ctrl_points and ctrl_points[0][0] <= total:
-                fac, ctrl = ctrl_points.pop(0)
-                fac = (fac - prev_total) / (total - prev_total)
-                assert 0 <= fac <= 1
-                pos = p * (1 - fac) + n * fac
+        curve_points = {}
+
+        if ctrl_points:
+            positions, _ = resample_polylines(np.array([points]), [fac for fac, _ in ctrl_points])
+
+            for (_, ctrl), pos in zip(ctrl_points, positions[0]):
+                curve_points[ctrl.name] = pos = Vector(pos)
                 set_transform_from_matrix(
                     obj, ctrl.name, Matrix.Translation(pos), keyflags=self.keyflags, no_scale=True, no_rot=True)
 
-        # Initial approximation of twist and scale for the base control
-        context.view_layer.update()
+        # Disabled extra controls stay attached to the first or last control
+        start_pose = Matrix.LocRotScale(points[0], start_rot, None)
+        end_pose = Matrix.LocRotScale(points[-1], all_matrices[-1].to_quaternion(), None)
+        start_rest_inv = ctrl_bones[0].bone.matrix_local.inverted()
+        end_rest_inv = ctrl_bones[-1].bone.matrix_local.inverted()
+        half = len(ctrl_bones) // 2
+
+        def curve_point(i, bone):
+            if i == 0:
+                return points[0]
+            if i == len(ctrl_bones) - 1:
+                return points[-1]
+            if bone.name in curve_points:
+                return curve_points[bone.name]
+            pose, rest_inv = (start_pose, start_rest_inv) if i < half else (end_pose, end_rest_inv)
+            return pose @ (rest_inv @ bone.bone.head_local)
+
+        curve = [curve_point(i, bone) for i, bone in enumerate(ctrl_bones)]
+
+        # Twist and scale for the base control from the predicted IK result
+        ik_matrices = self.compute_ik_chain(curve, start_rot, start_scale)
 
-        base_error_rotation = ik_bones[0].matrix.to_quaternion().inverted() @ all_matrices[0].to_quaternion()
+        if self.use_tip:
+            tip_length = ctrl_bones[-1].bone.length
+            ik_first = self.apply_tip_fix(ik_matrices, start_scale, all_matrices[-1], tip_length)
+        else:
+            ik_first = ik_matrices[0]
+
+        base_error_rotation = ik_first.to_quaternion().inverted() @ all_matrices[0].to_quaternion()
         base_twist = base_error_rotation.to_swing_twist('Y')[1]
-        base_scale = [b / a for a, b in zip(ik_bones[0].matrix.to_scale(), all_matrices[0].to_scale())]
+        base_scale = [b / a for a, b in zip(ik_first.to_scale(), all_matrices[0].to_scale())]
 
-        if self.use_stretch and any(con.type == 'MAINTAIN_VOLUME' and not con.mute
-                                    for con in ctrl_bones[0].constraints):
+        use_volume = self.use_stretch and any(con.type == 'MAINTAIN_VOLUME' and not con.mute
+                                              for con in ctrl_bones[0].constraints)
+        if use_volume:
             # Compensate for the maintain volume constraint
             base_scale[0] *= pow(base_scale[1], 1.5)
             base_scale[2] *= pow(base_scale[1], 1.5)
@@ -1112,11 +1518,14 @@ class RigifySplineTentacleIk2FkBase:
 
         # Approximation for the tip twist control, and correction for the base control
         if not self.use_tip:
-            context.view_layer.update()
+            local_scale = self.maintain_volume_scale(base_scale) if use_volume else Vector(base_scale)
+            new_rot = start_rot @ Euler((0, base_twist, 0)).to_quaternion()
+            new_scale = Vector([s * l for s, l in zip(start_scale, local_scale)])
+            ik_last = self.compute_ik_chain(curve, new_rot, new_scale)[-1]
 
-            tip_error_rotation = ik_bones[-1].matrix.to_quaternion().inverted() @ all_matrices[-1].to_quaternion()
+            tip_error_rotation = ik_last.to_quaternion().inverted() @ all_matrices[-1].to_quaternion()
             tip_twist = tip_error_rotation.to_swing_twist('Y')[1]
-            tip_scale = [b / a for a, b in zip(ik_bones[-1].matrix.to_scale(), all_matrices[-1].to_scale())]
+            tip_scale = [b / a for a, b in zip(ik_last.to_scale(), all_matrices[-1].to_scale())]
 
             if self.use_stretch:
                 # Compensate for the maintain volume constraint
@@ -1157,6 +1566,7 @@ def add_spline_snap_ik_to_fk(panel: 'PanelLayout', *,
                              ik_bones: Sequence[str],
                              ik_ctrl_bones: Sequence[str],
                              use_tip: bool, use_stretch: bool,
+                             twist_bone='', twist_share=1.0,
                              rig_name=''):
     panel.use_bake_settings()
     panel.script.add_utilities(SCRIPT_UTILITIES_OP_SNAP_IK_FK)
@@ -1168,6 +1578,8 @@ def add_spline_snap_ik_to_fk(panel: 'PanelLayout', *,
         'ctrl_bones': json.dumps(ik_ctrl_bones),
         'use_tip': use_tip,
         'use_stretch': use_stretch,
+        'twist_bone': twist_bone,
+        'twist_share': twist_share,
     }
 
     text = iface_("IK->FK ({:s})").format(rig_name)
@@ -1179,14 +1591,674 @@ def add_spline_snap_ik_to_fk(panel: 'PanelLayout', *,
         properties=op_props
     )
 
+    add_spline_bake_ik_to_fk(panel, op_props=op_props, rig_name=rig_name)
+
+
+def add_spline_bake_ik_to_fk(panel: 'PanelLayout', *, op_props: dict, rig_name=''):
+    panel.script.add_utilities(SCRIPT_UTILITIES_OP_BAKE_IK_FK)
+    panel.script.register_classes(SCRIPT_REGISTER_OP_BAKE_IK_FK)
+
+    # Register the tentacle for baking all of them at once
+    panel.script.add_utilities([f"SPLINE_TENTACLE_BAKE_RIGS.append({json.dumps(op_props)!r})\n"])
+
+    row = panel.row(align=True)
+    row.operator(
+        'pose.rigify_spline_tentacle_ik2fk_bake_{rig_id}',
+        text=iface_("Bake IK->FK ({:s})").format(rig_name),
+        translate=False,
+        icon='ACTION_TWEAK',
+        properties={'rigs': json.dumps([op_props])}
+    )
+    row.operator(
+        'pose.rigify_spline_tentacle_ik2fk_bake_{rig_id}',
+        text=iface_("All Tentacles"),
+        translate=False,
+        icon='ACTION_TWEAK',
+    )
+
+
+SCRIPT_REGISTER_OP_BAKE_IK_FK = ['POSE_OT_rigify_spline_tentacle_ik2fk_bake']
+
+SCRIPT_UTILITIES_OP_BAKE_IK_FK = SCRIPT_UTILITIES_OP_SNAP_IK_FK + ['''
+#################################
+## Spline Tentacle Bake IK->FK ##
+#################################
+
+# Snap settings of all spline tentacles of the rig, as JSON
+SPLINE_TENTACLE_BAKE_RIGS = []
+
+def np_quat_mul(a, b):
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=-1)
+
+def np_quat_conjugate(q):
+    return q * np.array([1.0, -1.0, -1.0, -1.0])
+
+def np_quat_rotate(q, v):
+    w, u = q[..., :1], q[..., 1:]
+    t = 2 * np.cross(u, v)
+    return v + w * t + np.cross(u, t)
+
+def np_quat_y_rotation(angle):
+    half = np.asarray(angle) / 2
+    zero = np.zeros_like(half)
+    return np.stack([np.cos(half), zero, np.sin(half), zero], axis=-1)
+
+def np_quat_y_twist(q):
+    # Twist angle around Y, like the twist part of Quaternion.to_swing_twist('Y')
+    sign = np.where(q[..., 0] < 0, -1.0, 1.0)
+    return 2 * np.arctan2(q[..., 2] * sign, q[..., 0] * sign)
+
+def np_quat_between(a, b):
+    # Minimal rotations turning directions a into directions b, identity where b is null
+    a = a / np.linalg.norm(a, axis=-1, keepdims=True)
+    b_len = np.linalg.norm(b, axis=-1, keepdims=True)
+    b = b / np.where(b_len > 1e-8, b_len, 1.0)
+    dot = np.sum(a * b, axis=-1, keepdims=True)
+
+    q = np.concatenate([1 + dot, np.cross(a, b)], axis=-1)
+
+    # Half turn around any perpendicular axis for opposite directions
+    ortho = np.cross(a, np.where(np.abs(a[..., :1]) < 0.9, [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]))
+    q = np.where(dot < 1e-8 - 1, np.concatenate([np.zeros_like(dot), ortho], axis=-1), q)
+    q = np.where(b_len > 1e-8, q, [1.0, 0.0, 0.0, 0.0])
+
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+def np_matrix_to_quat(m):
+    # Quaternions of an array of orthonormal 3x3 matrices, using the largest component
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+    trace = m00 + m11 + m22
+
+    def case(s, *values):
+        s = np.sqrt(np.maximum(s, 1e-12)) * 2
+        return np.stack([v / s for v in values], axis=-1)
+
+    cases = np.stack([
+        case(1 + trace, (1 + trace), m21 - m12, m02 - m20, m10 - m01),
+        case(1 + m00 - m11 - m22, m21 - m12, (1 + m00 - m11 - m22), m01 + m10, m02 + m20),
+        case(1 - m00 + m11 - m22, m02 - m20, m01 + m10, (1 - m00 + m11 - m22), m12 + m21),
+        case(1 - m00 - m11 + m22, m10 - m01, m02 + m20, m12 + m21, (1 - m00 - m11 + m22)),
+    ], axis=-2)
+
+    best = np.argmax(np.stack([trace, m00, m11, m22], axis=-1), axis=-1)
+    q = np.take_along_axis(cases, best[..., None, None], axis=-2)[..., 0, :]
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+def np_decompose(matrices):
+    # Locations, rotation quaternions and scales of an array of 4x4 matrices
+    mat3 = matrices[..., :3, :3]
+    scale = np.linalg.norm(mat3, axis=-2)
+    rot = mat3 / np.where(scale > 1e-12, scale, 1.0)[..., None, :]
+    return matrices[..., :3, 3], np_matrix_to_quat(rot), scale
+
+def np_maintain_volume_scale(scale):
+    # Effect of a uniform MAINTAIN_VOLUME constraint with the free Y axis in local space
+    total = np.abs(np.prod(scale, axis=-1, keepdims=True))
+    fac = 1 / np.sqrt(np.where(total > 0, total, 1.0))
+    return scale * np.concatenate([fac, np.ones_like(fac), fac], axis=-1)
+
+def np_local_points(matrices, points):
+    # Points transformed by the inverse of an array of 4x4 matrices
+    homogeneous = np.concatenate([points, np.ones(points.shape[:-1] + (1,))], axis=-1)
+    return (np.linalg.inv(matrices) @ homogeneous[..., None])[..., :3, 0]
+
+def spline_tentacle_capture_frames(scene, objects, frames):
+    # Evaluate every frame once, reading the pose of all armatures with bulk reads
+    captures = {}
+
+    for obj in objects:
+        captures[obj.name] = {
+            'matrix': np.empty((len(frames), len(obj.pose.bones) * 16), dtype=np.float32),
+            'rotation_euler': np.empty((len(frames), len(obj.pose.bones) * 3), dtype=np.float32),
+            'hide': np.empty((len(frames), len(obj.data.bones)), dtype=bool),
+        }
+
+    for i, frame in enumerate(frames):
+        scene.frame_set(int(frame))
+
+        for obj in objects:
+            capture = captures[obj.name]
+            obj.pose.bones.foreach_get('matrix', capture['matrix'][i])
+            obj.pose.bones.foreach_get('rotation_euler', capture['rotation_euler'][i])
+            obj.data.bones.foreach_get('hide', capture['hide'][i])
+
+    for capture in captures.values():
+        # Blender matrices are stored by column
+        capture['matrix'] = capture['matrix'].reshape(len(frames), -1, 4, 4).transpose(0, 1, 3, 2).astype(float)
+        capture['rotation_euler'] = capture['rotation_euler'].reshape(len(frames), -1, 3).astype(float)
+
+    return captures
+
+def spline_tentacle_set_keys(action, data_path, index, group, frames, values):
+    # Replace the keys of an F-Curve within the frame range with one key per frame, in bulk
+    fcurve = action.fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+
+    points = fcurve.keyframe_points
+    co = np.empty(len(points) * 2)
+    points.foreach_get('co', co)
+
+    # Reuse keys already in the range, as left by a previous bake
+    inside = np.flatnonzero((co[0::2] >= frames[0] - 0.5) & (co[0::2] <= frames[-1] + 0.5))
+    for i in reversed(inside[len(frames):]):
+        points.remove(points[int(i)], fast=True)
+
+    reused = inside[:len(frames)]
+    first_new = len(points)
+    points.add(len(frames) - len(reused))
+    targets = np.concatenate([reused, np.arange(first_new, len(points))])
+
+    for attr in ('co', 'handle_left', 'handle_right'):
+        data = np.empty(len(points) * 2)
+        points.foreach_get(attr, data)
+        data = data.reshape(-1, 2)
+        data[targets, 0] = frames
+        data[targets, 1] = values
+        points.foreach_set(attr, data.ravel())
+
+    fcurve.update()
+
+def spline_tentacle_rotation_channels(pbone, quats):
+    # Rotation property of a bone, and its values for an array of quaternions
+    signs = np.where(np.sum(quats[1:] * quats[:-1], axis=-1) < 0, -1.0, 1.0)
+    quats = quats * np.concatenate([[1.0], np.cumprod(signs)])[:, None]
+
+    if pbone.rotation_mode == 'QUATERNION':
+        return 'rotation_quaternion', quats
+
+    if pbone.rotation_mode == 'AXIS_ANGLE':
+        sin = np.sqrt(np.maximum(0.0, 1 - quats[:, 0] ** 2))
+        axis = np.where(sin[:, None] > 1e-8, quats[:, 1:] / np.maximum(sin, 1e-8)[:, None], [0.0, 1.0, 0.0])
+        return 'rotation_axis_angle', np.column_stack([2 * np.arccos(np.clip(quats[:, 0], -1, 1)), axis])
+
+    eulers = [Quaternion(quats[0]).to_euler(pbone.rotation_mode)]
+    for quat in quats[1:]:
+        eulers.append(Quaternion(quat).to_euler(pbone.rotation_mode, eulers[-1]))
+    return 'rotation_euler', np.array(eulers)
+
+def spline_tentacle_key_bone(obj, frames, name, location=None, rotation=None, scale=None):
+    # Key the unlocked transform channels of a bone on every frame; rotation is quaternions
+    action = find_action(obj)
+    pbone = obj.pose.bones[name]
+    frames = np.array(nla_tweak_to_scene(obj.animation_data, list(frames), invert=True))
+
+    channels = []
+    if location is not None:
+        channels.append(('location', location, pbone.lock_location))
+    if rotation is not None:
+        prop, values = spline_tentacle_rotation_channels(pbone, rotation)
+        locks = pbone.lock_rotation if prop == 'rotation_euler' else [False] * 4
+        channels.append((prop, values, locks))
+    if scale is not None:
+        channels.append(('scale', scale, pbone.lock_scale))
+
+    for prop, values, locks in channels:
+        data_path = pbone.path_from_id(prop)
+        for axis in range(values.shape[1]):
+            if not locks[axis]:
+                spline_tentacle_set_keys(action, data_path, axis, name, frames, values[:, axis])
+
+class RigifySplineTentacleIk2FkBakeRig(RigifySplineTentacleIk2FkBase):
+    # IK->FK snap of one spline tentacle over all frames of a bake, solving every frame at once
+    # with the same steps as RigifySplineTentacleIk2FkBase.apply_frame_state.
+
+    def __init__(self, obj, settings):
+        self.obj = obj
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+        self.init_bone_lists()
+        self.init_ik_model(obj)
+
+        self.bone_index = {bone.name: i for i, bone in enumerate(obj.pose.bones)}
+        self.data_index = {bone.name: i for i, bone in enumerate(obj.data.bones)}
+
+        ctrl_bones = [obj.pose.bones[name] for name in self.ctrl_bone_list]
+        drivers = obj.data.animation_data.drivers if obj.data.animation_data else []
+
+        self.use_volume = self.use_stretch and any(con.type == 'MAINTAIN_VOLUME' and not con.mute
+                                                   for con in ctrl_bones[0].constraints)
+        self.switchable = np.array([
+            bool(drivers and drivers.find(bone.bone.path_from_id("hide"))) for bone in ctrl_bones[1:-1]
+        ], dtype=bool)
+
+        # Offsets of the disabled extra controls from the first or last control
+        half = len(ctrl_bones) // 2
+        start_rest_inv = ctrl_bones[0].bone.matrix_local.inverted()
+        end_rest_inv = ctrl_bones[-1].bone.matrix_local.inverted()
+
+        self.mid_at_start = np.array([i < half for i in range(1, len(ctrl_bones) - 1)], dtype=bool)
+        self.mid_offsets = np.array([
+            tuple((start_rest_inv if i < half else end_rest_inv) @ bone.bone.head_local)
+            for i, bone in enumerate(ctrl_bones[1:-1], 1)
+        ]).reshape(-1, 3)
+
+        self.np_rest_deltas = np.array([tuple(q) for q in self.ik_rest_deltas])
+        self.np_tip_fix_delta = np.array(tuple(self.tip_fix_delta)) if self.use_tip else None
+        self.fk_tail_length = obj.data.bones[self.fk_bone_list[-1]].length
+
+    def get_matrices(self, capture, names):
+        return capture['matrix'][:, [self.bone_index[name] for name in names]]
+
+    def all_control_names(self):
+        return self.ctrl_bone_list + ([] if self.use_tip else [self.twist_control_bone])
+
+    def bake_reset_controls(self, frames):
+        count = len(frames)
+        for name in self.all_control_names():
+            spline_tentacle_key_bone(
+                self.obj, frames, name, location=np.zeros((count, 3)),
+                rotation=np.tile([1.0, 0.0, 0.0, 0.0], (count, 1)), scale=np.ones((count, 3)))
+
+    def bake_solve_ends(self, frames, capture):
+        # Position the first and last controls, relative to their pose with reset transforms
+        fk = self.get_matrices(capture, self.fk_bone_list)
+
+        if not self.use_tip:
+            last_tail = fk[:, -1].copy()
+            last_tail[:, :3, 3] += last_tail[:, :3, :3] @ np.array([0.0, self.fk_tail_length, 0.0])
+            fk = np.concatenate([fk, last_tail[:, None]], axis=1)
+
+        self.fk_matrices = fk
+        start_base = self.get_matrices(capture, self.ctrl_bone_list[:1])[:, 0]
+        end_base = self.get_matrices(capture, self.ctrl_bone_list[-1:])[:, 0]
+        _, self.start_rot, self.start_scale = np_decompose(start_base)
+
+        self.ik_twists = self.model_ik_twists(
+            capture['rotation_euler'][:, [self.bone_index[name] for name in self.twist_source], 1])
+        self.mid_hidden = capture['hide'][:, [self.data_index[name] for name in self.ctrl_bone_list[1:-1]]]
+
+        spline_tentacle_key_bone(
+            self.obj, frames, self.ctrl_bone_list[0], location=np_local_points(start_base, fk[:, 0, :3, 3]))
+
+        end_loc, end_rot, end_scale = np_decompose(np.linalg.inv(end_base) @ fk[:, -1])
+        spline_tentacle_key_bone(
+            self.obj, frames, self.ctrl_bone_list[-1], location=end_loc, rotation=end_rot,
+            scale=end_scale if self.use_tip else None)
+
+    def compute_ik_chain_np(self, curve_points, base_rot, base_scale):
+        # Spline IK chain heads, rotations and scales of every frame, like compute_ik_chain
+        polylines = auto_bezier_polylines(curve_points, self.curve_resolution)
+        fractions = np.array([0.0, *self.ik_fractions])
+
+        if not self.fit_curve:
+            curve_len = polyline_arc_lengths(polylines)[:, -1]
+            factor = base_scale[:, 1] * self.ik_total_length / np.where(curve_len > 0, curve_len, np.inf)
+            fractions = fractions[None, :] * factor[:, None]
+
+        joints, _ = resample_polylines(polylines, fractions)
+
+        y_axis = np.array([0.0, 1.0, 0.0])
+        rot = base_rot
+        rots, scales = [], []
+
+        for i, length in enumerate(self.ik_lengths):
+            rot = np_quat_mul(np_quat_mul(rot, self.np_rest_deltas[i]), np_quat_y_rotation(self.ik_twists[:, i]))
+            direction = joints[:, i + 1] - joints[:, i]
+            rot = np_quat_mul(np_quat_between(np_quat_rotate(rot, y_axis), direction), rot)
+            rots.append(rot)
+
+            if self.fit_curve:
+                y_scale = np.linalg.norm(direction, axis=-1) / length
+                xz_scale = np.sqrt(base_scale[:, 1] / np.where(y_scale > 0, y_scale, 1.0))
+                scales.append(np.column_stack([base_scale[:, 0] * xz_scale, y_scale, base_scale[:, 2] * xz_scale]))
+            else:
+                scales.append(base_scale)
+
+        return joints[:, :-1], np.stack(rots, axis=1), np.stack(scales, axis=1)
+
+    def apply_tip_fix_np(self, heads, rots, scales, tip_matrices, tip_length):
+        # First IK result bone rotation and scale with the direct tip control, like apply_tip_fix
+        end_rot = rots[:, -1]
+        base_rot = np_quat_mul(np_quat_mul(end_rot, self.np_tip_fix_delta), np_quat_y_rotation(self.ik_twists[:, -1]))
+        head = heads[:, -1] + np_quat_rotate(end_rot, scales[:, -1] * [0.0, self.ik_lengths[-1], 0.0])
+
+        tip_loc, tip_rot, tip_scale = np_decompose(tip_matrices)
+        tip_tail = tip_loc + np_quat_rotate(tip_rot, tip_scale * [0.0, tip_length, 0.0])
+        base_rot = np_quat_mul(np_quat_between(np_quat_rotate(base_rot, [0.0, 1.0, 0.0]), tip_tail - head), base_rot)
+
+        fix_twist = np_quat_y_twist(np_quat_mul(np_quat_conjugate(base_rot), tip_rot))
+        fix_scale = tip_scale / self.start_scale
+        factor = 1 / (len(self.ik_lengths) + 1)
+
+        rot = np_quat_mul(rots[:, 0], np_quat_y_rotation(fix_twist * factor))
+        fix_scale[:, 1] = 1.0
+        scale = scales[:, 0] * fix_scale ** factor
+        return rot, scale
+
+    def bake_solve_controls(self, frames, capture):
+        # Snap the enabled middle controls and solve the base and tip twist, in bulk
+        fk = self.fk_matrices
+        points = fk[:, :, :3, 3]
+        mid_names = self.ctrl_bone_list[1:-1]
+        mid_base = self.get_matrices(capture, mid_names)
+
+        # Disabled extra controls stay attached to the first or last control
+        _, end_rot, _ = np_decompose(fk[:, -1])
+        curve = np.empty((len(frames), len(self.ctrl_bone_list), 3))
+        curve[:, 0] = points[:, 0]
+        curve[:, -1] = points[:, -1]
+        curve[:, 1:-1] = np.where(
+            self.mid_at_start[None, :, None],
+            points[:, None, 0] + np_quat_rotate(self.start_rot[:, None], self.mid_offsets[None]),
+            points[:, None, -1] + np_quat_rotate(end_rot[:, None], self.mid_offsets[None]),
+        )
+
+        # Snap enabled controls evenly to the FK polyline, grouping frames by enabled controls
+        mid_loc = np.zeros((len(frames), len(mid_names), 3))
+        visible = ~(self.mid_hidden & self.switchable[None, :])
+        patterns, groups = np.unique(visible, axis=0, return_inverse=True)
+        groups = groups.reshape(-1)
+
+        for i, pattern in enumerate(patterns):
+            rows = np.flatnonzero(groups == i)
+            cols = np.flatnonzero(pattern)
+            if len(cols) == 0:
+                continue
+
+            ctrl_count = len(cols) + (0 if self.use_tip else 1)
+            fractions = np.minimum((np.arange(len(cols)) + 1) / ctrl_count, 1 - 0.25 / ctrl_count)
+            pos, _ = resample_polylines(points[rows], fractions)
+
+            curve[np.ix_(rows, cols + 1)] = pos
+            mid_loc[np.ix_(rows, cols)] = np_local_points(mid_base[np.ix_(rows, cols)], pos)
+
+        for i, name in enumerate(mid_names):
+            spline_tentacle_key_bone(self.obj, frames, name, location=mid_loc[:, i])
+
+        # Twist and scale for the base control from the predicted IK result
+        _, fk_rot, fk_scale = np_decompose(fk)
+        heads, rots, scales = self.compute_ik_chain_np(curve, self.start_rot, self.start_scale)
+
+        if self.use_tip:
+            tip_length = self.obj.data.bones[self.ctrl_bone_list[-1]].length
+            first_rot, first_scale = self.apply_tip_fix_np(heads, rots, scales, fk[:, -1], tip_length)
+        else:
+            first_rot, first_scale = rots[:, 0], scales[:, 0]
+
+        base_twist = np_quat_y_twist(np_quat_mul(np_quat_conjugate(first_rot), fk_rot[:, 0]))
+        base_scale = fk_scale[:, 0] / first_scale
+
+        if self.use_volume:
+            base_scale[:, [0, 2]] *= base_scale[:, 1:2] ** 1.5
+
+        if self.use_tip:
+            chain_len = fk.shape[1]
+            tip_factor = chain_len / (chain_len - 1)
+            spline_tentacle_key_bone(
+                self.obj, frames, self.ctrl_bone_list[0],
+                rotation=np_quat_y_rotation(base_twist * tip_factor), scale=base_scale ** tip_factor)
+            return
+
+        # Approximation for the tip twist control, and correction for the base control
+        local_scale = np_maintain_volume_scale(base_scale) if self.use_volume else base_scale
+
+        new_rot = np_quat_mul(self.start_rot, np_quat_y_rotation(base_twist))
+        _, rots, scales = self.compute_ik_chain_np(curve, new_rot, self.start_scale * local_scale)
+
+        tip_twist = np_quat_y_twist(np_quat_mul(np_quat_conjugate(rots[:, -1]), fk_rot[:, -1]))
+
+        if self.use_stretch:
+            tip_scale = fk_scale[:, -1] / scales[:, -1]
+            tip_scale[:, [0, 2]] *= tip_scale[:, 1:2] ** 1.5
+        else:
+            tip_scale = np.ones((len(frames), 3))
+
+        chain_len = fk.shape[1] - 1
+        tip_factor = chain_len / (chain_len - 1)
+
+        spline_tentacle_key_bone(
+            self.obj, frames, self.twist_control_bone, rotation=np_quat_y_rotation(tip_twist * tip_factor),
+            scale=tip_scale ** tip_factor if self.use_stretch else None)
 
-SCRIPT_REGISTER_OP_TOGGLE_CONTROLS = ['POSE_OT_rigify_spline_tentacle_toggle_control']
+        spline_tentacle_key_bone(
+            self.obj, frames, self.ctrl_bone_list[0],
+            rotation=np_quat_y_rotation(base_twist - tip_twist / (chain_len - 1)),
+            scale=base_scale / tip_scale ** (1 / (chain_len - 1)))
+
+class POSE_OT_rigify_spline_tentacle_ik2fk_bake(bpy.types.Operator):
+    bl_idname = "pose.rigify_spline_tentacle_ik2fk_bake_" + rig_id
+    bl_label = "Bake IK->FK"
+    bl_description = ("Snap the IK chains of spline tentacles to FK on every frame of the bake range, in all "
+                      "armatures of this rig in pose mode. Keys are written directly into the action")
+    bl_options = {'UNDO', 'INTERNAL', 'REGISTER'}
+
+    rigs: StringProperty(name="Tentacles", description="Snap settings of the tentacles to bake, all if empty")
+
+    @classmethod
+    def poll(cls, context):
+        return find_action(context.active_object) is not None
+
+    def execute(self, context):
+        scene = context.scene
+        settings = json.loads(self.rigs) if self.rigs else [json.loads(item) for item in SPLINE_TENTACLE_BAKE_RIGS]
+
+        if scene.rigify_transfer_use_frame_range:
+            frames = np.arange(scene.rigify_transfer_start_frame, scene.rigify_transfer_end_frame + 1)
+        else:
+            frames = np.arange(scene.frame_start, scene.frame_end + 1)
+
+        objects = [
+            obj for obj in (context.objects_in_mode or [context.active_object])
+            if obj.type == 'ARMATURE' and obj.data.get("rig_id") == rig_id and find_action(obj)
+        ]
+        jobs = [RigifySplineTentacleIk2FkBakeRig(obj, item) for obj in objects for item in settings]
+
+        if not jobs or len(frames) == 0:
+            self.report({'ERROR'}, "Nothing to bake")
+            return {'CANCELLED'}
+
+        saved_frame = scene.frame_current
+
+        try:
+            # Reset the controls and capture FK and the reset poses in one pass over the frames
+            for job in jobs:
+                job.bake_reset_controls(frames)
+
+            captures = spline_tentacle_capture_frames(scene, objects, frames)
+
+            for job in jobs:
+                job.bake_solve_ends(frames, captures[job.obj.name])
+
+            # Capture again for the switchable parents of the middle controls
+            captures = spline_tentacle_capture_frames(scene, objects, frames)
+
+            for job in jobs:
+                job.bake_solve_controls(frames, captures[job.obj.name])
+        finally:
+            scene.frame_set(saved_frame)
+
+        self.report({'INFO'}, f"Baked {len(jobs)} tentacles over {len(frames)} frames")
+        return {'FINISHED'}
+''']
+
+
+def add_spline_bake_deform(panel: 'PanelLayout', *, deform_bones: Sequence[str], rig_name=''):
+    panel.use_bake_settings()
+    panel.script.add_utilities(SCRIPT_UTILITIES_OP_BAKE_DEFORM)
+    panel.script.register_classes(SCRIPT_REGISTER_OP_BAKE_DEFORM)
+
+    # Register the deform chain for baking all tentacles at once
+    panel.script.add_utilities([f"SPLINE_TENTACLE_DEFORM_CHAINS.append({json.dumps(list(deform_bones))!r})\n"])
+
+    row = panel.row(align=True)
+    row.operator(
+        'pose.rigify_spline_tentacle_bake_deform_{rig_id}',
+        text=iface_("Bake Deform ({:s})").format(rig_name),
+        translate=False,
+        icon='EXPORT',
+        properties={'chains': json.dumps([list(deform_bones)])}
+    )
+    row.operator(
+        'pose.rigify_spline_tentacle_bake_deform_{rig_id}',
+        text=iface_("All Tentacles"),
+        translate=False,
+        icon='EXPORT',
+    )
+
+
+SCRIPT_REGISTER_OP_BAKE_DEFORM = ['POSE_OT_rigify_spline_tentacle_bake_deform']
+
+SCRIPT_UTILITIES_OP_BAKE_DEFORM = SCRIPT_UTILITIES_OP_BAKE_IK_FK + ['''
+######################################
+## Spline Tentacle Deform Bake (FK) ##
+######################################
+
+# Deform bone chains of all spline tentacles of the rig, as JSON
+SPLINE_TENTACLE_DEFORM_CHAINS = []
+
+def spline_tentacle_skeleton_parent(skeleton, name, deform_only):
+    # Parent of a bone in the exported skeleton: the nearest deforming ancestor for the rig itself,
+    # the way exporters limited to deform bones reparent them, or the actual parent otherwise
+    parent = skeleton.bones[name].parent
+    while deform_only and parent is not None and not parent.use_deform:
+        parent = parent.parent
+    return parent.name if parent else None
+
+class POSE_OT_rigify_spline_tentacle_bake_deform(bpy.types.Operator):
+    bl_idname = "pose.rigify_spline_tentacle_bake_deform_" + rig_id
+    bl_label = "Bake Deform Action"
+    bl_description = ("Bake the deformation of spline tentacles over the bake frame range into plain FK keys "
+                      "of a separate action, which plays without the curve, hooks and spline IK, like on "
+                      "a game engine skeleton")
+    bl_options = {'UNDO', 'INTERNAL', 'REGISTER'}
+
+    chains: StringProperty(name="Deform Chains", description="Deform bone chains to bake, all tentacles if empty")
+    target: StringProperty(
+        name="Skeleton",
+        description="Armature object with the deform bones to bake for, which gets the action assigned. "
+                    "If empty, the deform bones of the rig are baked as a skeleton of deform bones only"
+    )
+    action_name: StringProperty(name="Action", description="Action to write, named after the rig action if empty")
+
+    @classmethod
+    def poll(cls, context):
+        return find_action(context.active_object) is not None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        obj = context.active_object
+        scene = context.scene
+        chains = json.loads(self.chains) if self.chains else [json.loads(item) for item in SPLINE_TENTACLE_DEFORM_CHAINS]
+        names = list(dict.fromkeys(name for chain in chains for name in chain))
+
+        target = bpy.data.objects.get(self.target) if self.target else obj
+        if target is None or target.type != 'ARMATURE':
+            self.report({'ERROR'}, f"Skeleton armature not found: {self.target}")
+            return {'CANCELLED'}
+
+        if missing := [name for name in names if name not in target.data.bones]:
+            self.report({'ERROR'}, f"Bones missing in the skeleton: {', '.join(missing)}")
+            return {'CANCELLED'}
+
+        if scene.rigify_transfer_use_frame_range:
+            frames = np.arange(scene.rigify_transfer_start_frame, scene.rigify_transfer_end_frame + 1)
+        else:
+            frames = np.arange(scene.frame_start, scene.frame_end + 1)
+
+        if not names or len(frames) == 0:
+            self.report({'ERROR'}, "Nothing to bake")
+            return {'CANCELLED'}
+
+        saved_frame = scene.frame_current
+        try:
+            pose = spline_tentacle_capture_frames(scene, [obj], frames)[obj.name]['matrix']
+        finally:
+            scene.frame_set(saved_frame)
+
+        # Pose matrices of the baked bones and their skeleton parents, in the skeleton space
+        bone_index = {bone.name: i for i, bone in enumerate(obj.pose.bones)}
+        to_target = np.array(target.matrix_world.inverted() @ obj.matrix_world)
+        pose = to_target @ pose
+
+        bones = target.data.bones
+        parents = [spline_tentacle_skeleton_parent(target.data, name, target == obj) for name in names]
+        rest = np.array([np.array(bones[name].matrix_local) for name in names])
+        parent_rest = np.array([np.array(bones[p].matrix_local) if p else np.identity(4) for p in parents])
+
+        parent_pose = np.empty((len(frames), len(names), 4, 4))
+        for i, parent in enumerate(parents):
+            if parent in bone_index:
+                parent_pose[:, i] = pose[:, bone_index[parent]]
+            else:
+                # Parents not posed by the rig keep their rest pose
+                parent_pose[:, i] = parent_rest[i]
+
+        # Local transforms relative to the parent and the rest pose, as keyed on a skeleton
+        # with full inheritance
+        rest_local = np.linalg.inv(parent_rest) @ rest
+        basis = np.linalg.inv(rest_local) @ np.linalg.inv(parent_pose) @ pose[:, [bone_index[n] for n in names]]
+        location, rotation, scale = np_decompose(basis)
+
+        src_action = find_action(obj)
+        action_name = self.action_name or f"{src_action.name}.deform"
+        action = bpy.data.actions.get(action_name) or bpy.data.actions.new(action_name)
+
+        key_frames = frames.astype(float)
+
+        for i, name in enumerate(names):
+            pbone = target.pose.bones[name]
+            prop, values = spline_tentacle_rotation_channels(pbone, rotation[:, i])
+
+            for data_prop, data in (('location', location[:, i]), (prop, values), ('scale', scale[:, i])):
+                data_path = pbone.path_from_id(data_prop)
+                for axis in range(data.shape[1]):
+                    spline_tentacle_set_keys(action, data_path, axis, name, key_frames, data[:, axis])
+
+        if target != obj:
+            target.animation_data_create().action = action
+
+        self.report({'INFO'}, f"Baked {len(names)} bones over {len(frames)} frames into {action.name}")
+        return {'FINISHED'}
+''']
+
+
+SCRIPT_REGISTER_OP_TOGGLE_CONTROLS = ['POSE_OT_rigify_spline_tentacle_toggle_control',
+                                      'POSE_OT_rigify_spline_tentacle_toggle_controls_batch']
 
 SCRIPT_UTILITIES_OP_TOGGLE_CONTROLS = ['''
 #####################################
 ## Toggle Spline Tentacle Controls ##
 #####################################
 
+# Extra control sets of all spline tentacles of the rig, as JSON
+SPLINE_TENTACLE_TOGGLE_SETS = []
+
+def spline_tentacle_action_start(obj, action, start_frames=None):
+    # Scene frame of the first key of the action, cached per object in start_frames if given
+    if start_frames is not None and obj.name in start_frames:
+        return start_frames[obj.name]
+
+    keys = [fcu.keyframe_points[0].co[0] for fcu in action.fcurves if len(fcu.keyframe_points) > 0]
+    start = nla_tweak_to_scene(obj.animation_data, min(keys)) if keys else None
+
+    if start_frames is not None:
+        start_frames[obj.name] = start
+
+    return start
+
+def spline_tentacle_parse_frames(text):
+    # Sorted frame numbers from a list like "1, 12, 30-34"
+    frames = set()
+
+    for item in text.replace(',', ' ').split():
+        first, _, last = item.partition('-') if not item.startswith('-') else (item, '', '')
+        frames.update(range(int(first), int(last or first) + 1))
+
+    return sorted(frames)
+
 class RigifySplineTentacleToggleControlBase:
     prop_bone:      StringProperty(name="Settings Bone")
     prop_name:      StringProperty(name="Switch Property")
@@ -1209,7 +2281,16 @@ class RigifySplineTentacleToggleControlBase:
     def set_property(self, obj, value):
         obj.pose.bones[self.prop_bone][self.prop_name] = value
 
-    def keyframe_increment(self, context, obj, delta):
+    def get_bone_list(self, name):
+        # Decode the JSON bone lists only once per operator invocation
+        cache = getattr(self, 'bone_list_cache', None)
+        if cache is None:
+            cache = self.bone_list_cache = {}
+        if name not in cache:
+            cache[name] = json.loads(getattr(self, name))
+        return cache[name]
+
+    def keyframe_increment(self, context, obj, delta, start_frames=None):
         action = find_action(obj)
         bone = obj.pose.bones[self.prop_bone]
         prop_quoted = rna_idprop_quote_path(self.prop_name)
@@ -1223,9 +2304,8 @@ class RigifySplineTentacleToggleControlBase:
         frame = context.scene.frame_current
 
         if len(fcurve.keyframe_points) == 0:
-            min_x = min(fcu.keyframe_points[0].co[0] for fcu in action.fcurves if len(fcu.keyframe_points) > 0)
-            min_frame = nla_tweak_to_scene(obj.animation_data, min_x)
-            if min_frame < frame:
+            min_frame = spline_tentacle_action_start(obj, action, start_frames)
+            if min_frame is not None and min_frame < frame:
                 bone.keyframe_insert(prop_quoted, frame=min_frame, options=keyflags)
 
         # Keyframe the new value
@@ -1235,6 +2315,10 @@ class RigifySplineTentacleToggleControlBase:
         bone[self.prop_name] = new_value
         bone.keyframe_insert(prop_quoted, frame=frame, options=keyflags)
 
+        if start_frames is not None:
+            start = start_frames.get(obj.name)
+            start_frames[obj.name] = frame if start is None else min(start, frame)
+
         # Ensure constant interpolation
         for key in fcurve.keyframe_points:
             key.interpolation = 'CONSTANT'
@@ -1242,12 +2326,10 @@ class RigifySplineTentacleToggleControlBase:
         return fcurve, cur_value, new_value
 
     def get_hook_bone(self, obj, index):
-        hook_bones = json.loads(self.hook_bones)
-        return obj.pose.bones[hook_bones[index]]
+        return obj.pose.bones[self.get_bone_list('hook_bones')[index]]
 
     def get_control_bone(self, obj, index):
-        ctrl_bones = json.loads(self.ctrl_bones)
-        return obj.pose.bones[ctrl_bones[index]]
+        return obj.pose.bones[self.get_bone_list('ctrl_bones')[index]]
 
     def get_hook_position(self, obj, index):
         hook = self.get_hook_bone(obj, index)
@@ -1327,9 +2409,123 @@ class POSE_OT_rigify_spline_tentacle_toggle_control(RigifySplineTentacleToggleCo
 
         obj.update_tag(refresh={'DATA'})
         return {'FINISHED'}
+
+class SplineTentacleToggleJob(RigifySplineTentacleToggleControlBase):
+    # One set of extra controls of one tentacle, toggled by the batch operator
+
+    def __init__(self, obj, settings):
+        self.obj = obj
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+    def is_selected(self):
+        bones = self.obj.data.bones
+        return any(bones[name].select for name in [self.prop_bone, *self.get_bone_list('ctrl_bones')])
+
+class POSE_OT_rigify_spline_tentacle_toggle_controls_batch(bpy.types.Operator):
+    bl_idname = "pose.rigify_spline_tentacle_toggle_controls_batch_" + rig_id
+    bl_label = "Toggle And Keyframe Extra Controls"
+    bl_options = {'UNDO', 'REGISTER'}
+
+    enable: bpy.props.BoolProperty(name="Enable Controls")
+    frames: StringProperty(name="Frames", description="Frames to toggle at, like '1, 12, 30-34'. "
+                                                      "The current frame if empty")
+    only_selected: bpy.props.BoolProperty(
+        name="Only Selected", default=True,
+        description="Only toggle the controls of the tentacles with selected controls"
+    )
+
+    @classmethod
+    def description(cls, context, props):
+        return (("Enable" if props.enable else "Disable") +
+                " one more extra control of every tentacle in all armatures of this rig in pose mode, "
+                "at each of the listed frames, keyframing like the single control toggle")
+
+    @classmethod
+    def poll(cls, context):
+        return find_action(context.active_object) is not None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        scene = context.scene
+        delta = 1 if self.enable else -1
+
+        try:
+            frames = spline_tentacle_parse_frames(self.frames) or [scene.frame_current]
+        except ValueError:
+            self.report({'ERROR'}, f"Invalid frame list: {self.frames}")
+            return {'CANCELLED'}
+
+        objects = [
+            obj for obj in (context.objects_in_mode or [context.active_object])
+            if obj.type == 'ARMATURE' and obj.data.get("rig_id") == rig_id and find_action(obj)
+        ]
+        jobs = [SplineTentacleToggleJob(obj, json.loads(item))
+                for obj in objects for item in SPLINE_TENTACLE_TOGGLE_SETS]
+
+        if self.only_selected:
+            jobs = [job for job in jobs if job.is_selected()]
+
+        if not jobs:
+            self.report({'ERROR'}, "No tentacle controls to toggle")
+            return {'CANCELLED'}
+
+        start_frames = {}
+        saved_frame = scene.frame_current
+        toggled = 0
+
+        try:
+            for frame in frames:
+                scene.frame_set(frame)
+
+                active = [job for job in jobs if job.check_increment(job.obj, delta)]
+                indices = {job: job.get_property(job.obj) + min(0, delta) for job in active}
+                positions = {}
+
+                # The hook of an enabled control is captured before the toggle, and of a disabled one after
+                if self.enable:
+                    positions = {job: job.get_hook_position(job.obj, indices[job]) for job in active}
+
+                for job in active:
+                    job.keyframe_increment(context, job.obj, delta, start_frames)
+
+                if not self.enable and active:
+                    for obj in {job.obj for job in active}:
+                        obj.update_tag(refresh={'DATA'})
+
+                    context.view_layer.update()
+
+                    positions = {job: job.get_hook_position(job.obj, indices[job]) for job in active}
+
+                for job in active:
+                    job.set_control_position(context, job.obj, indices[job], *positions[job])
+
+                toggled += len(active)
+        finally:
+            scene.frame_set(saved_frame)
+
+        for obj in objects:
+            obj.update_tag(refresh={'DATA'})
+
+        self.report({'INFO'}, f"Toggled {toggled} controls at {len(frames)} frames")
+        return {'FINISHED'}
 ''']
 
 
+def add_toggle_controls_batch_buttons(panel: 'PanelLayout'):
+    panel.use_bake_settings()
+    panel.script.add_utilities(SCRIPT_UTILITIES_OP_TOGGLE_CONTROLS)
+    panel.script.register_classes(SCRIPT_REGISTER_OP_TOGGLE_CONTROLS)
+
+    row = panel.row(align=True)
+    row.operator('pose.rigify_spline_tentacle_toggle_controls_batch_{rig_id}', text=iface_("Enable Controls"),
+                 translate=False, icon='ADD', properties={'enable': True})
+    row.operator('pose.rigify_spline_tentacle_toggle_controls_batch_{rig_id}', text=iface_("Disable Controls"),
+                 translate=False, icon='REMOVE', properties={'enable': False})
+
+
 def add_toggle_control_button(panel: 'PanelLayout', *,
                               prop_bone: str,
                               prop_name: str,
@@ -1346,9 +2542,14 @@ def add_toggle_control_button(panel: 'PanelLayout', *,
         'prop_name': prop_name,
         'ctrl_bones': json.dumps(ctrl_bones),
         'hook_bones': json.dumps(hook_bones),
-        'enable': enable,
     }
 
+    # Register the control set for the batch toggle
+    if enable:
+        panel.script.add_utilities([f"SPLINE_TENTACLE_TOGGLE_SETS.append({json.dumps(op_props)!r})\n"])
+
+    op_props['enable'] = enable
+
     row = panel.row(align=True)
 
     if enable:
@@ -1361,69 +2562,229 @@ def add_toggle_control_button(panel: 'PanelLayout', *,
                  properties=op_props)
 
 
+
+SCRIPT_REGISTER_OP_SET_LOD = ['POSE_OT_rigify_spline_tentacle_set_lod']
+
+SCRIPT_UTILITIES_OP_SET_LOD = ['''
+#####################################
+## Spline Tentacle Level Of Detail ##
+#####################################
+
+# Level of detail settings of all spline tentacles of the rig, by settings bone
+SPLINE_TENTACLE_LOD_SETS = {}
+
+def spline_tentacle_mute_drivers(id_data, prefixes, mute):
+    anim = id_data.animation_data
+    if anim:
+        for fcurve in anim.drivers:
+            if fcurve.data_path.startswith(prefixes):
+                fcurve.mute = mute
+
+def spline_tentacle_set_lod(obj, settings, level):
+    # Mute the evaluation directly instead of driving it: the IK chain constraints and drivers,
+    # the curve hooks and the shape keys with their drivers are then skipped altogether.
+    mute = level > 0
+    pose_bones = obj.pose.bones
+    ik_bones = settings['ik_bones']
+    curve = None
+
+    for name in ik_bones:
+        for con in pose_bones[name].constraints:
+            if con.type == 'SPLINE_IK':
+                curve = con.target
+            con.mute = mute
+
+    spline_tentacle_mute_drivers(obj, tuple(pose_bones[name].path_from_id() + '.' for name in ik_bones), mute)
+
+    # Take the IK result out of the ORG chain, which then follows FK fully
+    targets = set(settings['org_targets'])
+
+    for name in settings['org_bones']:
+        for con in pose_bones[name].constraints:
+            if getattr(con, 'subtarget', '') in targets:
+                con.mute = mute
+            elif settings['use_fk'] and con.type == 'COPY_TRANSFORMS':
+                spline_tentacle_mute_drivers(obj, (con.path_from_id('influence'),), mute)
+                if mute:
+                    con.influence = 1.0
+
+    if curve:
+        curve.hide_viewport = mute
+
+        for mod in curve.modifiers:
+            if mod.type == 'HOOK':
+                mod.show_viewport = not mute
+
+        keys = curve.data.shape_keys
+        if keys:
+            for key in keys.key_blocks[1:]:
+                key.mute = mute
+            spline_tentacle_mute_drivers(keys, ('key_blocks[',), mute)
+
+    pose_bones[settings['prop_bone']]['lod'] = level
+
+class POSE_OT_rigify_spline_tentacle_set_lod(bpy.types.Operator):
+    bl_idname = "pose.rigify_spline_tentacle_set_lod_" + rig_id
+    bl_label = "Set Level Of Detail"
+    bl_description = "Switch the evaluation of the spline IK chain and its curve on or off for this tentacle"
+    bl_options = {'UNDO', 'INTERNAL', 'REGISTER'}
+
+    prop_bone: StringProperty(name="Settings Bone")
+    level: bpy.props.IntProperty(name="Level", min=0, max=1)
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'ARMATURE' and obj.data.get("rig_id") == rig_id
+
+    def execute(self, context):
+        settings = SPLINE_TENTACLE_LOD_SETS.get(self.prop_bone)
+
+        if settings is None:
+            self.report({'ERROR'}, f"No level of detail switch on {self.prop_bone}")
+            return {'CANCELLED'}
+
+        obj = context.active_object
+        spline_tentacle_set_lod(obj, settings, self.level)
+        obj.update_tag(refresh={'DATA'})
+        return {'FINISHED'}
+''']
+
+
+def add_spline_lod_buttons(panel: 'PanelLayout', *,
+                           prop_bone: str,
+                           ik_bones: Sequence[str],
+                           org_bones: Sequence[str],
+                           org_targets: Sequence[str],
+                           use_fk: bool):
+    panel.script.add_utilities(SCRIPT_UTILITIES_OP_SET_LOD)
+    panel.script.register_classes(SCRIPT_REGISTER_OP_SET_LOD)
+
+    settings = {
+        'prop_bone': prop_bone,
+        'ik_bones': list(ik_bones),
+        'org_bones': list(org_bones),
+        'org_targets': list(org_targets),
+        'use_fk': use_fk,
+    }
+
+    panel.script.add_utilities([
+        f"SPLINE_TENTACLE_LOD_SETS[{prop_bone!r}] = json.loads({json.dumps(settings)!r})\n"
+    ])
+
+    row = panel.row(align=True)
+    row.label(text="Level Of Detail:")
+
+    sub = row.row(align=True)
+    sub.enabled = sub.expr_bone(prop_bone)['lod'] > 0
+    sub.operator('pose.rigify_spline_tentacle_set_lod_{rig_id}', text=iface_("Full"),
+                 translate=False, properties={'prop_bone': prop_bone, 'level': 0})
+
+    sub = row.row(align=True)
+    sub.enabled = sub.expr_bone(prop_bone)['lod'] < 1
+    sub.operator('pose.rigify_spline_tentacle_set_lod_{rig_id}', text=iface_("Low"),
+                 translate=False, properties={'prop_bone': prop_bone, 'level': 1})
+
+# Twist ring widget geometry for the unit size, with Y relative to head_tail
+TWIST_WIDGET_VERTS = np.array([
+    (0.3429814279079437, 0.0, 0.22917263209819794),
+    (0.38110050559043884, -0.05291016772389412, 0.1578568667),
+    (0.40457412600517273, -0.05291016772389412, 0.0804747119),
+    (0.41250014305114746, -0.05291016772389412, 0.0),
+    (0.40457412600517273, -0.05291016772389412, -0.080474764),
+    (0.38110050559043884, -0.05291016772389412, -0.157856911),
+    (0.3429814279079437, 0.0, -0.22917278110980988),
+    (0.22917293012142181, 0.0, -0.3429813086986542),
+    (0.1578570008277893, -0.05291016772389412, -0.3811003565),
+    (0.0804748609662056, -0.05291016772389412, -0.4045739769),
+    (0.0, -0.05291026830673218, -0.4124999940395355),
+    (-0.080474711954593, -0.052910167723892, -0.40457397699),
+    (-0.15785688161849, -0.05291016772394, -0.38110026717974),
+    (-0.22917267680168152, 0.0, -0.3429811894893646),
+    (-0.34298115968704224, 0.0, -0.22917254269123077),
+    (-0.38110023736953, -0.05291016772389, -0.15785665810108),
+    (-0.40457373857498, -0.05291016772389, -0.08047446608543),
+    (-0.4124998152256012, -0.05291016772389412, 0.0),
+    (-0.40457355976104, -0.05291016772389, 0.080475136637687),
+    (-0.38109982013702, -0.05291016772389, 0.15785726904869),
+    (-0.34298068284988403, 0.0, 0.22917301952838898),
+    (-0.2291719913482666, 0.0, 0.34298139810562134),
+    (-0.15785618126392, -0.05291016772389, 0.38110047578811),
+    (-0.08047392964363, -0.05291016772389, 0.40457388758659),
+    (0.0, -0.05291016772389412, 0.41249993443489075),
+    (0.080475620925426, -0.05291016772389, 0.40457367897033),
+    (0.157857790589332, -0.05291016772389, 0.38109987974166),
+    (0.22917351126670837, 0.0, 0.3429807126522064),
+    (0.381100505590438, 0.05290994420647, 0.15785686671733),
+    (0.404574126005172, 0.05290994420647, 0.08047470450401),
+    (0.41250014305114746, 0.05290994420647621, 0.0),
+    (0.404574126005172, 0.05290994420647, -0.0804747715592),
+    (0.381100505590438, 0.05290994420647, -0.1578569114208),
+    (0.157857000827789, 0.05290994420647, -0.3811003565788),
+    (0.080474860966205, 0.05290994420647, -0.4045739769935),
+    (0.0, 0.05290984362363815, -0.4124999940395355),
+    (-0.08047471195459, 0.05290994420647, -0.4045739769935),
+    (-0.15785688161849, 0.05290994420647, -0.38110026717185),
+    (-0.38110023736953, 0.05290994420647, -0.15785665810108),
+    (-0.40457373857498, 0.05290994420647, -0.08047447353601),
+    (-0.4124998152256, 0.05290994420647, 0.0),
+    (-0.40457355976104, 0.05290994420647, 0.080475129187107),
+    (-0.38109982013702, 0.05290994420647, 0.15785726904869),
+    (-0.15785618126392, 0.05290994420647, 0.381100475788116),
+    (-0.08047392964363, 0.05290994420647, 0.404573887586593),
+    (0.0, 0.05290994420647621, 0.41249993443489075),
+    (0.080475620925426, 0.05290994420647, 0.404573678970339),
+    (0.157857790589332, 0.05290994420647, 0.381099879741667),
+], dtype=np.float32)
+
+TWIST_WIDGET_EDGES = np.array([
+    (1, 0), (2, 1), (2, 3), (3, 4), (5, 4), (5, 6), (7, 8), (9, 8), (10, 9), (10, 11),
+    (12, 11), (12, 13), (14, 15), (16, 15), (16, 17), (17, 18), (19, 18), (20, 19), (28, 0), (21, 22),
+    (23, 22), (23, 24), (24, 25), (26, 25), (26, 27), (47, 27), (29, 28), (29, 30), (30, 31), (32, 31),
+    (32, 6), (34, 33), (35, 34), (35, 36), (37, 36), (7, 33), (37, 13), (39, 38), (39, 40), (40, 41),
+    (42, 41), (14, 38), (20, 42), (44, 43), (44, 45), (45, 46), (47, 46), (21, 43),
+], dtype=np.int32)
+
+TWIST_WIDGET_MESH_PROP = 'vizor_twist_widget'
+
+
+def get_twist_widget_mesh(size=1.0, head_tail=0.5):
+    """Get the twist widget mesh shared by all widgets with the same size and head_tail."""
+    key = [round(size, 6), round(head_tail, 6)]
+    name = 'WGT-vizor_twist_%g_%g' % tuple(key)
+
+    mesh = bpy.data.meshes.get(name)
+
+    if mesh is not None:
+        if list(mesh.get(TWIST_WIDGET_MESH_PROP, ())) == key and len(mesh.vertices) == len(TWIST_WIDGET_VERTS):
+            return mesh
+
+        mesh.clear_geometry()
+    else:
+        mesh = bpy.data.meshes.new(name)
+
+    coords = TWIST_WIDGET_VERTS * np.float32(size)
+    coords[:, 1] += head_tail
+
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', coords.ravel())
+    mesh.edges.add(len(TWIST_WIDGET_EDGES))
+    mesh.edges.foreach_set('vertices', TWIST_WIDGET_EDGES.ravel())
+    mesh.update()
+
+    mesh[TWIST_WIDGET_MESH_PROP] = key
+    return mesh
+
+
 def create_twist_widget(rig, bone_name, size=1.0, head_tail=0.5, bone_transform_name=None):
     obj = create_widget(rig, bone_name, bone_transform_name)
     if obj is not None:
-        verts = [(0.3429814279079437 * size, head_tail, 0.22917263209819794 * size),
-                 (0.38110050559043884 * size, head_tail - 0.05291016772389412 * size, 0.1578568667 * size),
-                 (0.40457412600517273 * size, head_tail - 0.05291016772389412 * size, 0.0804747119 * size),
-                 (0.41250014305114746 * size, head_tail - 0.05291016772389412 * size, 0.0),
-                 (0.40457412600517273 * size, head_tail - 0.05291016772389412 * size, -0.080474764 * size),
-                 (0.38110050559043884 * size, head_tail - 0.05291016772389412 * size, -0.157856911 * size),
-                 (0.3429814279079437 * size, head_tail, -0.22917278110980988 * size),
-                 (0.22917293012142181 * size, head_tail, -0.3429813086986542 * size),
-                 (0.1578570008277893 * size, head_tail - 0.05291016772389412 * size, -0.3811003565 * size),
-                 (0.0804748609662056 * size, head_tail - 0.05291016772389412 * size, -0.4045739769 * size),
-                 (0.0, head_tail - 0.05291026830673218 * size, -0.4124999940395355 * size),
-                 (-0.080474711954593 * size, head_tail - 0.052910167723892 * size, -0.40457397699 * size),
-                 (-0.15785688161849 * size, head_tail - 0.05291016772394 * size, -0.38110026717974 * size),
-                 (-0.22917267680168152 * size, head_tail, -0.3429811894893646 * size),
-                 (-0.34298115968704224 * size, head_tail, -0.22917254269123077 * size),
-                 (-0.38110023736953 * size, head_tail - 0.05291016772389 * size, -0.15785665810108 * size),
-                 (-0.40457373857498 * size, head_tail - 0.05291016772389 * size, -0.08047446608543 * size),
-                 (-0.4124998152256012 * size, head_tail - 0.05291016772389412 * size, 0.0),
-                 (-0.40457355976104 * size, head_tail - 0.05291016772389 * size, 0.080475136637687 * size),
-                 (-0.38109982013702 * size, head_tail - 0.05291016772389 * size, 0.157857269048690 * size),
-                 (-0.34298068284988403 * size, head_tail, 0.22917301952838898 * size),
-                 (-0.2291719913482666 * size, head_tail, 0.34298139810562134 * size),
-                 (-0.15785618126392 * size, head_tail - 0.05291016772389 * size, 0.38110047578811 * size),
-                 (-0.08047392964363 * size, head_tail - 0.05291016772389 * size, 0.40457388758659 * size),
-                 (0.0, head_tail - 0.05291016772389412 * size, 0.41249993443489075 * size),
-                 (0.080475620925426 * size, head_tail - 0.05291016772389 * size, 0.40457367897033 * size),
-                 (0.157857790589332 * size, head_tail - 0.05291016772389 * size, 0.38109987974166 * size),
-                 (0.22917351126670837 * size, head_tail, 0.3429807126522064 * size),
-                 (0.381100505590438 * size, head_tail + 0.05290994420647 * size, 0.15785686671733 * size),
-                 (0.404574126005172 * size, head_tail + 0.05290994420647 * size, 0.08047470450401 * size),
-                 (0.41250014305114746 * size, head_tail + 0.05290994420647621 * size, 0.0),
-                 (0.404574126005172 * size, head_tail + 0.05290994420647 * size, -0.0804747715592 * size),
-                 (0.381100505590438 * size, head_tail + 0.05290994420647 * size, -0.1578569114208 * size),
-                 (0.157857000827789 * size, head_tail + 0.05290994420647 * size, -0.3811003565788 * size),
-                 (0.080474860966205 * size, head_tail + 0.05290994420647 * size, -0.4045739769935 * size),
-                 (0.0, head_tail + 0.05290984362363815 * size, -0.4124999940395355 * size),
-                 (-0.08047471195459 * size, head_tail + 0.05290994420647 * size, -0.4045739769935 * size),
-                 (-0.15785688161849 * size, head_tail + 0.05290994420647 * size, -0.38110026717185 * size),
-                 (-0.38110023736953 * size, head_tail + 0.05290994420647 * size, -0.15785665810108 * size),
-                 (-0.40457373857498 * size, head_tail + 0.05290994420647 * size, -0.08047447353601 * size),
-                 (-0.41249981522560 * size, head_tail + 0.05290994420647 * size, 0.0),
-                 (-0.40457355976104 * size, head_tail + 0.05290994420647 * size, 0.080475129187107 * size),
-                 (-0.38109982013702 * size, head_tail + 0.05290994420647 * size, 0.157857269048690 * size),
-                 (-0.15785618126392 * size, head_tail + 0.05290994420647 * size, 0.381100475788116 * size),
-                 (-0.08047392964363 * size, head_tail + 0.05290994420647 * size, 0.404573887586593 * size),
-                 (0.0, head_tail + 0.05290994420647621 * size, 0.41249993443489075 * size),
-                 (0.080475620925426 * size, head_tail + 0.05290994420647 * size, 0.404573678970339 * size),
-                 (0.157857790589332 * size, head_tail + 0.05290994420647 * size, 0.381099879741667 * size)]
-        edges = [(1, 0), (2, 1), (2, 3), (3, 4), (5, 4), (5, 6), (7, 8), (9, 8), (10, 9), (10, 11),
-                 (12, 11), (12, 13), (14, 15), (16, 15), (16, 17), (17, 18), (19, 18), (20, 19),
-                 (28, 0), (21, 22), (23, 22), (23, 24), (24, 25), (26, 25), (26, 27), (47, 27),
-                 (29, 28), (29, 30), (30, 31), (32, 31), (32, 6), (34, 33), (35, 34), (35, 36),
-                 (37, 36), (7, 33), (37, 13), (39, 38), (39, 40), (40, 41), (42, 41), (14, 38),
-                 (20, 42), (44, 43), (44, 45), (45, 46), (47, 46), (21, 43)]
-        faces = []
-
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
-        mesh.update()
+        old_mesh = obj.data
+        obj.data = get_twist_widget_mesh(size, head_tail)
+
+        if old_mesh != obj.data and old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
         return obj
     else:
         return None
@@ -3,27 +3,11 @@ from bpy.types import PoseBone
 from itertools import count
 
 from rigify.base_rig import BaseRig, stage
-from rigify.utils.misc import ArmatureObject, map_list
-from rigify.utils.rig import is_rig_base_bone, connected_children_names
+from rigify.utils.misc import map_list
 from rigify.utils.naming import make_derived_name
 
-def bone_siblings(obj: ArmatureObject, bone: str) -> list[str]:
-    """ Returns a list of the siblings of the given bone.
-        This requires that the bones has a parent.
-    """
-    parent = obj.data.bones[bone].parent
-    connected_siblings = connected_children_names(obj, parent.name)
+from ....utils.topology import get_topology
 
-    if parent is None:
-        return []
-
-    bones = []
-
-    for b in parent.children:
-        if b.name != bone and not is_rig_base_bone(obj, b.name) and b.name not in connected_siblings:
-            bones += [b.name]
-
-    return bones
 
 class Rig(BaseRig):
     '''This is a Feather Rig. A set of sibling bones that are looking stretch bone influenced by two controll bones.
@@ -46,7 +30,7 @@ class Rig(BaseRig):
 
     def find_org_bones(self, bone: PoseBone) -> list[str]:
         base_head = bone.bone.head
-        siblings = bone_siblings(self.obj, bone.name)
+        siblings = get_topology(self).siblings(bone.name)
 
         # Sort list by name and distance
         siblings.sort()
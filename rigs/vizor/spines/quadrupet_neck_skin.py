@@ -4,31 +4,15 @@ from rigify.rigs.spines.super_head import Rig as HeadRig
 from math import radians
 
 from bpy.types import PoseBone
-from rigify.utils.misc import map_list, ArmatureObject
-from rigify.utils.rig import is_rig_base_bone, connected_children_names
+from rigify.utils.misc import map_list
 from rigify.utils.bones import is_same_position, put_bone, flip_bone, align_bone_orientation
 from rigify.utils.naming import make_derived_name
 from rigify.utils.widgets_basic import create_sphere_widget
 
 from itertools import count
 
-def bone_siblings(obj: ArmatureObject, bone: str) -> list[str]:
-    """ Returns a list of the siblings of the given bone.
-        This requires that the bones has a parent.
-    """
-    parent = obj.data.bones[bone].parent
-    connected_siblings = connected_children_names(obj, parent.name)
-
-    if parent is None:
-        return []
-
-    bones = []
+from ....utils.topology import get_topology
 
-    for b in parent.children:
-        if b.name != bone and not is_rig_base_bone(obj, b.name) and b.name not in connected_siblings:
-            bones += [b.name]
-
-    return bones
 
 class Rig(BaseRig):
     """ A "chain_skin" rig.  A set of sibling bones that move based on the parent chain rig.
@@ -52,7 +36,7 @@ class Rig(BaseRig):
 
     def find_org_bones(self, bone: PoseBone) -> list[str]:
         base_head = bone.bone.head
-        siblings = bone_siblings(self.obj, bone.name)
+        siblings = get_topology(self).siblings(bone.name)
 
         # Sort list by name and distance
         siblings.sort()
@@ -11,7 +11,6 @@ from itertools import count, repeat
 from mathutils import Matrix
 
 from rigify.utils.layers import ControlLayersOption
-from rigify.utils.rig import connected_children_names
 from rigify.utils.naming import strip_org, make_mechanism_name, make_derived_name
 from rigify.utils.bones import (put_bone, align_bone_to_axis, align_bone_orientation, TypedBoneDict)
 
@@ -23,6 +22,8 @@ from rigify.utils.switch_parent import SwitchParentBuilder
 
 from rigify.base_rig import stage, BaseRig
 
+from ....utils.topology import get_topology
+
 
 class Rig(BaseRig):
     """
@@ -44,7 +45,7 @@ class Rig(BaseRig):
         self.length = sum([self.get_bone(b).length for b in self.bones.org])
     
     def find_org_bones(self, bone: PoseBone):
-        return [bone.name] + connected_children_names(self.obj, bone.name)
+        return [bone.name] + get_topology(self).connected_chain(bone.name)
     
     def parent_bones(self):
         self.rig_parent_bone = self.get_bone_parent(self.bones.org[0])
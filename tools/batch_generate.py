@@ -0,0 +1,231 @@
+"""
+Batch Rigify generation of many metarigs over a pool of headless Blender processes.
+
+Each item is either a .blend file, in which every metarig is regenerated, or a Vizor metarig
+template name like 'vizor_bird' or 'Vizor Animals/vizor_bird'. Every item runs in its own
+background Blender with this checkout installed and enabled as a Rigify feature set:
+
+    python tools/batch_generate.py --blender /path/to/blender --jobs 8 --save library/*.blend
+    python tools/batch_generate.py --all-templates --output-dir generated/
+
+Generated files are only written with --save (in place, .blend items only) or --output-dir. The per item status,
+timings and log files are collected into one JSON summary, and the exit code is 1 if any item
+failed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.join(REPO_ROOT, 'benchmarks')
+
+sys.path.insert(0, BENCHMARKS_DIR)
+
+from bench_templates import list_templates  # noqa: E402
+
+RESULT_MARKER = 'VIZOR_BATCH_RESULT '
+
+
+##############################
+# Worker, running inside Blender
+
+def find_metarigs():
+    import bpy
+
+    return [
+        obj for obj in bpy.data.objects
+        if obj.type == 'ARMATURE' and any(pbone.rigify_type for pbone in obj.pose.bones)
+    ]
+
+
+def generate_metarig(metarig) -> dict:
+    import bpy
+    import bench_common
+
+    view_layer = bpy.context.view_layer
+
+    if view_layer.objects.get(metarig.name) is None:
+        return {'metarig': metarig.name, 'error': "not in the active view layer"}
+
+    if view_layer.objects.active and view_layer.objects.active.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    view_layer.objects.active = metarig
+
+    start = time.perf_counter()
+    try:
+        rig = bench_common.generate_rig(metarig).obj
+    except Exception as e:
+        return {'metarig': metarig.name, 'error': f"{type(e).__name__}: {e}"}
+
+    return {'metarig': metarig.name, 'rig': rig.name, 'time': time.perf_counter() - start}
+
+
+def run_worker(item: str, args: argparse.Namespace) -> dict:
+    import bpy
+    import bench_common
+
+    if item.endswith('.blend'):
+        bpy.ops.wm.open_mainfile(filepath=item)
+        rigs = [generate_metarig(metarig) for metarig in find_metarigs()]
+        name = os.path.basename(item)
+    else:
+        templates = [t for t in list_templates() if item in (t, t.split('/')[1])]
+        if not templates:
+            return {'error': f"unknown metarig template {item!r}"}
+
+        bench_common.clear_scene()
+        rigs = [generate_metarig(bench_common.add_metarig(templates[0]))]
+        name = templates[0].split('/')[1] + '.blend'
+
+    record = {'rigs': rigs}
+
+    if not rigs:
+        record['error'] = "no metarigs found"
+    elif failed := [rig for rig in rigs if 'error' in rig]:
+        record['error'] = '; '.join(f"{rig['metarig']}: {rig['error']}" for rig in failed)
+    elif args.save and item.endswith('.blend'):
+        bpy.ops.wm.save_mainfile()
+        record['saved'] = item
+    elif args.output_dir:
+        path = os.path.join(os.path.abspath(args.output_dir), name)
+        bpy.ops.wm.save_as_mainfile(filepath=path, copy=True)
+        record['saved'] = path
+
+    return record
+
+
+##############################
+# Pool manager
+
+def log_file_name(index: int, item: str) -> str:
+    return f"{index:04d}_{os.path.basename(item).replace('/', '_').replace(' ', '_')}.log"
+
+
+def run_item(index: int, item: str, args: argparse.Namespace) -> dict:
+    """Process one item in a background Blender, returning its summary record."""
+    cmd = [args.blender, '-b', '--python-exit-code', '1', '--python', os.path.abspath(__file__),
+           '--', '--worker', item]
+    if args.save:
+        cmd.append('--save')
+    if args.output_dir:
+        cmd += ['--output-dir', os.path.abspath(args.output_dir)]
+
+    log_path = os.path.join(args.log_dir, log_file_name(index, item))
+    start = time.perf_counter()
+
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=args.timeout)
+        stdout, stderr, code = proc.stdout, proc.stderr, proc.returncode
+    except subprocess.TimeoutExpired as e:
+        stdout, stderr, code = e.stdout or '', e.stderr or '', None
+        if isinstance(stdout, bytes):
+            stdout, stderr = stdout.decode(errors='replace'), (stderr or b'').decode(errors='replace')
+
+    record = {'item': item, 'wall_time': time.perf_counter() - start, 'log': log_path}
+
+    with open(log_path, 'w', encoding='utf-8') as fp:
+        fp.write(stdout)
+        fp.write(stderr)
+
+    for line in stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            record.update(json.loads(line[len(RESULT_MARKER):]))
+            break
+    else:
+        record['error'] = "timed out" if code is None else f"Blender exited with code {code}"
+
+    record['status'] = 'failed' if 'error' in record else 'ok'
+    return record
+
+
+def run_batch(items: list[str], args: argparse.Namespace) -> list[dict]:
+    os.makedirs(args.log_dir, exist_ok=True)
+
+    results: list[dict] = [{}] * len(items)
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(run_item, i, item, args): i for i, item in enumerate(items)}
+
+        for future in as_completed(futures):
+            record = future.result()
+            results[futures[future]] = record
+            done += 1
+
+            detail = f": {record['error']}" if 'error' in record else ''
+            print(f"[{done}/{len(items)}] {record['status']:6} {record['wall_time']:7.1f} s  "
+                  f"{record['item']}{detail}", flush=True)
+
+    return results
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='batch_generate.py', description="Batch Rigify generation")
+    parser.add_argument('items', nargs='*', help=".blend files or metarig template names")
+    parser.add_argument('--worker', metavar='ITEM', help=argparse.SUPPRESS)
+    parser.add_argument('--all-templates', action='store_true', help="add every Vizor metarig template")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'), help="Blender executable")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="number of concurrent Blender processes, default one per core")
+    parser.add_argument('--timeout', type=float, help="seconds after which an item is failed")
+    parser.add_argument('--save', action='store_true', help="save regenerated .blend files in place, not allowed with template items")
+    parser.add_argument('--output-dir', help="save the results as copies in this directory")
+    parser.add_argument('--log-dir', default='batch_logs', help="directory for the per item logs")
+    parser.add_argument('--summary', default='batch_summary.json', help="summary file to write")
+    return parser
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+    parser = make_parser()
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(RESULT_MARKER + json.dumps(run_worker(args.worker, args)), flush=True)
+        return
+
+    items = [os.path.abspath(item) if item.endswith('.blend') else item for item in args.items]
+    if args.all_templates:
+        items += list_templates()
+
+    if not items:
+        parser.error("nothing to generate")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.save and (templates := [item for item in items if not item.endswith('.blend')]):
+        parser.error(f"--save only applies to .blend files, use --output-dir for the templates "
+                     f"{', '.join(templates)}")
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = run_batch(items, args)
+    failed = [record for record in results if record['status'] != 'ok']
+
+    with open(args.summary, 'w', encoding='utf-8') as fp:
+        json.dump({
+            'total_time': time.perf_counter() - start,
+            'jobs': args.jobs,
+            'succeeded': len(results) - len(failed),
+            'failed': len(failed),
+            'results': results,
+        }, fp, indent=2)
+        fp.write('\n')
+
+    print(f"{len(results) - len(failed)} succeeded, {len(failed)} failed; summary in {args.summary}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import inspect
+import numpy as np
+
+
+# Arc length parametrization of polylines, and the evaluation of AUTO handle Bezier curves into them.
+#
+# Works on stacks of polylines shaped (frames, points, 3), so that chain rigs and bake operators
+# can resample the positions of controls along a chain for a whole frame range at once, with
+# cumulative sums and a single sorted lookup instead of per frame Python loops.
+#
+# The same functions are embedded into the generated rig UI script through
+# SCRIPT_UTILITIES_ARC_LENGTH, for operators that run without the feature set.
+
+
+def polyline_arc_lengths(points: np.ndarray) -> np.ndarray:
+    """Cumulative lengths at the points of a stack of polylines, shaped (frames, points)."""
+    seg_lengths = np.linalg.norm(np.diff(points, axis=1), axis=2)
+    return np.concatenate([np.zeros((points.shape[0], 1)), np.cumsum(seg_lengths, axis=1)], axis=1)
+
+
+def resample_polylines(points: np.ndarray, fractions) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positions at fractions of the length of a stack of polylines shaped (frames, points, 3),
+    for fractions shaped (count,) or (frames, count). Returns the positions shaped
+    (frames, count, 3) and the total lengths of the polylines.
+    """
+    points = np.asarray(points, dtype=float)
+    frames, count = points.shape[0], points.shape[1]
+
+    cumulative = polyline_arc_lengths(points)
+    total = cumulative[:, -1]
+
+    fractions = np.broadcast_to(np.clip(fractions, 0.0, 1.0), (frames, np.shape(fractions)[-1]))
+    target = fractions * total[:, None]
+
+    # Look up all frames at once, offsetting each frame to keep the flattened array sorted
+    norm = np.where(total > 0, total, 1.0)[:, None]
+    offset = np.arange(frames)[:, None] * 2.0
+    index = np.searchsorted((cumulative / norm + offset).ravel(), (target / norm + offset).ravel(), side='right')
+    index = np.clip(index.reshape(frames, -1) - 1 - np.arange(frames)[:, None] * count, 0, count - 2)
+
+    rows = np.arange(frames)[:, None]
+    start = cumulative[rows, index]
+    seg = cumulative[rows, index + 1] - start
+    t = np.clip((target - start) / np.where(seg > 0, seg, 1.0), 0.0, 1.0)[..., None]
+
+    return points[rows, index] * (1 - t) + points[rows, index + 1] * t, total
+
+
+def auto_bezier_polylines(points: np.ndarray, resolution: int) -> np.ndarray:
+    """
+    Evaluate open Bezier splines with AUTO handles through a stack of points shaped (frames, points, 3)
+    the way Blender does, into polylines with the given number of segments per spline segment.
+    """
+    prev_pts = np.concatenate([2 * points[:, :1] - points[:, 1:2], points[:, :-1]], axis=1)
+    next_pts = np.concatenate([points[:, 1:], 2 * points[:, -1:] - points[:, -2:-1]], axis=1)
+
+    dvec_a = points - prev_pts
+    dvec_b = next_pts - points
+    len_a = np.linalg.norm(dvec_a, axis=-1, keepdims=True)
+    len_b = np.linalg.norm(dvec_b, axis=-1, keepdims=True)
+    len_a = np.where(len_a > 0, len_a, 1.0)
+    len_b = np.where(len_b > 0, len_b, 1.0)
+
+    tvec = dvec_b / len_b + dvec_a / len_a
+    length = np.linalg.norm(tvec, axis=-1, keepdims=True) * 2.5614
+    length = np.where(length > 0, length, 1.0)
+
+    left = points - tvec * (len_a / length)
+    right = points + tvec * (len_b / length)
+
+    t = (np.arange(1, resolution + 1) / resolution)[None, None, :, None]
+    u = 1 - t
+    samples = (points[:, :-1, None] * (u * u * u) + right[:, :-1, None] * (3 * u * u * t) +
+               left[:, 1:, None] * (3 * u * t * t) + points[:, 1:, None] * (t * t * t))
+
+    return np.concatenate([points[:, :1], samples.reshape(points.shape[0], -1, 3)], axis=1)
+
+
+SCRIPT_UTILITIES_ARC_LENGTH = ['''
+###################################
+## Polyline Arc Length Utilities ##
+###################################
+
+import numpy as np
+
+''' + '\n'.join(map(inspect.getsource, (polyline_arc_lengths, resample_polylines, auto_bezier_polylines)))]
@@ -0,0 +1,252 @@
+import bpy
+import re
+import json
+
+from collections import Counter
+
+from rigify.base_generate import BaseGenerator
+from rigify.utils.errors import MetarigError
+from rigify.utils.naming import strip_org
+
+from .profiling import ReportPlugin, REPORT_PLUGINS, ENV_FLAG_VALUES, get_env_setting, write_report_text
+
+
+# Rig complexity budget report.
+#
+# Enabled by the VIZOR_BUDGET environment variable, set to a flag or to the path of a budget JSON
+# file, or by a 'vizor_budget' custom property on the metarig armature data holding budget JSON.
+# After generation, every bone, constraint, driver, modifier and shape key of the rig and its
+# helper objects is attributed to the rig instance that created it, and instances over budget
+# are flagged. The report is printed and stored in the 'vizor_budget' text datablock.
+#
+# Budgets map a rig type, 'default' or 'total' to limits of the counted metrics, for example:
+#
+#   {"default": {"constraints": 40},
+#    "vizor.limbs.spline_tentacle": {"mch_bones": 30, "drivers": 20},
+#    "total": {"def_bones": 75},
+#    "strict": true}
+#
+# Per type limits override the default ones for instances of that type, total limits apply to
+# the whole rig, and strict budgets make generation fail instead of only flagging the overruns.
+
+BUDGET_ENV_VAR = 'VIZOR_BUDGET'
+BUDGET_PROPERTY = 'vizor_budget'
+BUDGET_TEXT = 'vizor_budget'
+
+METRICS = ('bones', 'org_bones', 'mch_bones', 'def_bones', 'ctrl_bones',
+           'constraints', 'drivers', 'modifiers', 'shape_keys')
+
+BONE_PREFIX_METRICS = {'ORG': 'org_bones', 'MCH': 'mch_bones', 'DEF': 'def_bones'}
+
+UNOWNED = '(unowned)'
+
+BONE_PATH_PATTERN = re.compile(r'^pose\.bones\["((?:[^"\\]|\\.)*)"\]')
+
+
+def get_budget_source(generator: BaseGenerator):
+    prop = generator.metarig.data.get(BUDGET_PROPERTY)
+    if prop is not None:
+        return prop
+    return get_env_setting(BUDGET_ENV_VAR)
+
+
+def load_budget(generator: BaseGenerator) -> dict:
+    source = get_budget_source(generator)
+
+    if hasattr(source, 'to_dict'):
+        return source.to_dict()
+    if not isinstance(source, str) or source.lower() in ENV_FLAG_VALUES:
+        return {}
+    if source.lstrip().startswith('{'):
+        return json.loads(source)
+
+    with open(source, encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def bone_from_path(data_path: str) -> str | None:
+    if match := BONE_PATH_PATTERN.match(data_path):
+        return match.group(1).replace('\\"', '"').replace('\\\\', '\\')
+    return None
+
+
+def driver_sources(obj: bpy.types.Object):
+    """Yield the datablocks of an object that can hold drivers."""
+    yield obj
+
+    if obj.data is not None:
+        yield obj.data
+
+        if shape_keys := getattr(obj.data, 'shape_keys', None):
+            yield shape_keys
+
+
+class ComplexityReport(ReportPlugin):
+    """Attributes the generated rig elements to rig instances, and checks them against budgets."""
+
+    @classmethod
+    def is_enabled(cls, generator):
+        return get_budget_source(generator) is not None
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.counts: dict[str, Counter] = {}
+        self.instance_types: dict[str, str] = {UNOWNED: UNOWNED}
+
+    ##############################
+    # Attribution
+
+    def instance_name(self, rig) -> str:
+        name = strip_org(rig.base_bone)
+
+        if name not in self.instance_types:
+            self.instance_types[name] = self.generator.metarig.pose.bones[name].rigify_type
+
+        return name
+
+    def find_bone_owners(self) -> dict[str, str]:
+        generator = self.generator
+        owners = {}
+
+        for rig in generator.rig_list:
+            owners[rig.base_bone] = self.instance_name(rig)
+
+        for name, rig in getattr(generator, 'bone_owners', {}).items():
+            if rig is not None and hasattr(rig, 'base_bone'):
+                owners[name] = self.instance_name(rig)
+
+        return owners
+
+    def add(self, owner: str, metric: str, count=1):
+        self.counts.setdefault(owner, Counter())[metric] += count
+
+    def driver_owner(self, fcurve, default: str, owners: dict[str, str]) -> str:
+        obj = self.obj
+
+        if fcurve.id_data == obj and (bone := bone_from_path(fcurve.data_path)):
+            return owners.get(bone, UNOWNED)
+
+        for var in fcurve.driver.variables:
+            for target in var.targets:
+                if target.id == obj:
+                    bone = target.bone_target or bone_from_path(target.data_path)
+                    if bone in owners:
+                        return owners[bone]
+
+        return default
+
+    def object_owner(self, other: bpy.types.Object, owners: dict[str, str]) -> str | None:
+        """Attribute a helper object by the rig bones it is parented, hooked or constrained to."""
+        obj = self.obj
+        refs = Counter()
+
+        if other.parent == obj and other.parent_type == 'BONE':
+            refs[owners.get(other.parent_bone, UNOWNED)] += 1
+
+        for mod in other.modifiers:
+            if mod.type == 'HOOK' and mod.object == obj and mod.subtarget:
+                refs[owners.get(mod.subtarget, UNOWNED)] += 1
+
+        for con in other.constraints:
+            if getattr(con, 'target', None) == obj and getattr(con, 'subtarget', ''):
+                refs[owners.get(con.subtarget, UNOWNED)] += 1
+
+        return refs.most_common(1)[0][0] if refs else None
+
+    def collect_counts(self):
+        obj = self.obj
+        owners = self.find_bone_owners()
+
+        for bone in obj.data.bones:
+            owner = owners.get(bone.name, UNOWNED)
+            prefix = bone.name.split('-', 1)[0] if '-' in bone.name else ''
+            self.add(owner, 'bones')
+            self.add(owner, BONE_PREFIX_METRICS.get(prefix, 'ctrl_bones'))
+
+        for pbone in obj.pose.bones:
+            if pbone.constraints:
+                self.add(owners.get(pbone.name, UNOWNED), 'constraints', len(pbone.constraints))
+
+        if obj.animation_data:
+            for fcurve in obj.animation_data.drivers:
+                self.add(self.driver_owner(fcurve, UNOWNED, owners), 'drivers')
+
+        for other in bpy.data.objects:
+            if other == obj:
+                continue
+
+            owner = self.object_owner(other, owners)
+
+            if owner is not None:
+                self.add(owner, 'modifiers', len(other.modifiers))
+
+                if shape_keys := getattr(other.data, 'shape_keys', None):
+                    self.add(owner, 'shape_keys', len(shape_keys.key_blocks) - 1)
+
+            for id_data in driver_sources(other):
+                if id_data.animation_data:
+                    for fcurve in id_data.animation_data.drivers:
+                        if (driver_owner := self.driver_owner(fcurve, owner, owners)) is not None:
+                            self.add(driver_owner, 'drivers')
+
+    ##############################
+    # Budgets
+
+    def check_budgets(self, budget: dict) -> list[str]:
+        overruns = []
+        default = budget.get('default', {})
+
+        for name, counts in self.counts.items():
+            if name == UNOWNED:
+                continue
+
+            rig_type = self.instance_types[name]
+            limits = {**default, **budget.get(rig_type, {})}
+
+            for metric, limit in limits.items():
+                if counts[metric] > limit:
+                    overruns.append(f"{name} ({rig_type}): {metric} {counts[metric]} > {limit}")
+
+        totals = sum(self.counts.values(), Counter())
+
+        for metric, limit in budget.get('total', {}).items():
+            if totals[metric] > limit:
+                overruns.append(f"total: {metric} {totals[metric]} > {limit}")
+
+        return overruns
+
+    def make_report(self, overruns: list[str]) -> str:
+        totals = sum(self.counts.values(), Counter())
+        over_names = {line.split(' (', 1)[0].split(':', 1)[0] for line in overruns}
+
+        header = ''.join(f'{metric:>12}' for metric in METRICS)
+        lines = [f"Vizor rig complexity of {self.obj.name}", "", f"  {'':<40}{header}"]
+
+        def row(mark, label, counts):
+            return f"{mark} {label:<40}" + ''.join(f'{counts[metric]:12d}' for metric in METRICS)
+
+        for name, counts in sorted(self.counts.items(), key=lambda item: -item[1]['bones']):
+            label = f"{name} ({self.instance_types[name]})" if name != UNOWNED else name
+            lines.append(row('!' if name in over_names else ' ', label[:40], counts))
+
+        lines.append(row('!' if 'total' in over_names else ' ', 'total', totals))
+
+        if overruns:
+            lines += ["", "Over budget:"] + [f"  {line}" for line in overruns]
+
+        return '\n'.join(lines) + '\n'
+
+    def finalize(self):
+        self.collect_counts()
+
+        budget = load_budget(self.generator)
+        overruns = self.check_budgets(budget)
+
+        write_report_text(BUDGET_TEXT, self.make_report(overruns))
+
+        if overruns and budget.get('strict'):
+            raise MetarigError(f"Rig complexity over budget: {'; '.join(overruns)}")
+
+
+REPORT_PLUGINS.append(ComplexityReport)
@@ -0,0 +1,124 @@
+import bpy
+
+from rigify.base_rig import stage, RigComponent
+from rigify.utils.naming import make_derived_name, strip_org
+
+
+# Fold and spread of a group of feathers.
+#
+# The pose of the feathers in the metarig is recorded as their folded state. A spread property
+# blends all feathers of the group between that pose and the rest pose with one driver: the
+# property becomes the X location of a spread MCH bone, which a Transform constraint on every
+# posed feather maps to its recorded rotation.
+
+
+class FeatherFold(RigComponent):
+    """Records the folded pose of the feathers of a rig, and blends them to the rest pose with a spread property."""
+
+    rotations: dict[str, tuple[float, float, float]]
+
+    # Bone that gets the fold constraint of a feather, by ORG name. Feathers not listed are constrained directly.
+    fold_bones: dict[str, str]
+
+    # Controls that show the spread property in the panel, the first holds it unless a bone is chosen
+    panel_bones: list[str]
+
+    spread_bone: str
+
+    def __init__(self, owner, feathers: list[str]):
+        super().__init__(owner)
+
+        self.params = owner.params
+        self.fold_bones = {}
+        self.panel_bones = []
+        self.rotations = self.record_rotations(feathers)
+
+        if not self.rotations:
+            owner.raise_error("Fold From Metarig Pose is enabled, but no feathers are posed in the metarig")
+
+    def record_rotations(self, feathers: list[str]) -> dict[str, tuple[float, float, float]]:
+        """Read the folded state of the feathers from the pose of their bones in the metarig."""
+        pose_bones = self.owner.generator.metarig.pose.bones
+        rotations = {}
+
+        for name in feathers:
+            pbone = pose_bones.get(strip_org(name))
+            if pbone is None:
+                continue
+
+            euler = pbone.matrix_basis.to_euler('XYZ')
+            if max(map(abs, euler)) > 1e-4:
+                rotations[name] = tuple(euler)
+
+        return rotations
+
+    @stage.generate_bones
+    def make_spread_bone(self):
+        base_bone = self.owner.base_bone
+        self.spread_bone = self.copy_bone(base_bone, make_derived_name(base_bone, 'mch', '_spread'), scale=0.25)
+
+    @stage.parent_bones
+    def parent_spread_bone(self):
+        self.set_bone_parent(self.spread_bone, self.owner.base_bone)
+
+    def get_property_bone(self) -> str:
+        bone = self.params.feather_fold_spread_bone
+        if not bone:
+            return self.panel_bones[0] if self.panel_bones else self.owner.base_bone
+        if bone not in self.obj.pose.bones:
+            self.owner.raise_error("Spread property bone {} doesn't exist in the generated rig", bone)
+        return bone
+
+    @stage.rig_bones
+    def rig_fold(self):
+        # The only driver of the group: the spread value becomes the X location of the spread MCH,
+        # which the Transform constraints of all feathers read directly
+        prop_bone = self.get_property_bone()
+        prop_name = self.params.feather_fold_spread_property
+
+        self.make_property(prop_bone, prop_name, default=1.0,
+                           description="Blend the feathers between the folded (0) and spread (1) pose")
+        self.make_driver(self.spread_bone, 'location', index=0, variables=[(prop_bone, prop_name)])
+
+        for name, (x, y, z) in self.rotations.items():
+            self.make_constraint(
+                self.fold_bones.get(name, name), 'TRANSFORM', self.spread_bone, name='fold',
+                map_from='LOCATION', map_to='ROTATION', to_euler_order='XYZ', mix_mode_rot='AFTER',
+                owner_space='LOCAL', target_space='LOCAL',
+                from_min_x=0.0, from_max_x=1.0,
+                map_to_x_from='X', map_to_y_from='X', map_to_z_from='X',
+                to_min_x_rot=x, to_min_y_rot=y, to_min_z_rot=z,
+                to_max_x_rot=0.0, to_max_y_rot=0.0, to_max_z_rot=0.0,
+            )
+
+    @stage.configure_bones
+    def configure_spread_property(self):
+        prop_bone = self.get_property_bone()
+        panel = self.owner.script.panel_with_selected_check(self.owner, [prop_bone, *self.panel_bones])
+        panel.custom_prop(prop_bone, self.params.feather_fold_spread_property, text="Spread", slider=True)
+
+
+def add_parameters(params):
+    params.feather_fold = bpy.props.BoolProperty(
+        name="Fold From Metarig Pose", default=False,
+        description="Record the pose of the feathers in the metarig as the folded state, and blend "
+                    "between it and the rest pose with a spread property"
+    )
+    params.feather_fold_spread_bone = bpy.props.StringProperty(
+        name="Property Bone", default="",
+        description="Generated bone holding the spread property, e.g. the wing controller shared "
+                    "by all feather groups of the wing. Empty uses the first control of the feathers"
+    )
+    params.feather_fold_spread_property = bpy.props.StringProperty(
+        name="Property", default="wing_spread",
+        description="Name of the spread property"
+    )
+
+
+def parameters_ui(layout, params):
+    layout.prop(params, 'feather_fold')
+
+    col = layout.column()
+    col.active = params.feather_fold
+    col.prop(params, 'feather_fold_spread_bone')
+    col.prop(params, 'feather_fold_spread_property')
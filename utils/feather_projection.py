@@ -0,0 +1,140 @@
+import numpy as np
+
+from mathutils import Vector
+
+
+# Placement of feather targets on the stretch bone of a feather fan.
+#
+# Every feather line is intersected with the stretch bone segment after projecting both onto the
+# plane of the fan. The plane is fitted to the heads and tails of all feathers and the stretch
+# bone (PCA), so fans in any orientation work, and all feathers are solved at once as arrays.
+#
+# The same intersections give every feather its position along the fan, from which the feather
+# field rig derives the interpolation weights between its guide feathers.
+
+
+def fit_projection_plane(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Least squares plane through points shaped (count, 3), as its centroid and the two principal
+    axes spanning it, shaped (2, 3).
+    """
+    origin = points.mean(axis=0)
+    _, _, axes = np.linalg.svd(points - origin)
+    return origin, axes[:2]
+
+
+def intersect_lines_with_segment(seg_head: np.ndarray, seg_tail: np.ndarray,
+                                 heads: np.ndarray, tails: np.ndarray,
+                                 eps=1e-6) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Intersect the infinite lines through heads and tails shaped (count, 3) with a segment, in the
+    best fitting plane of all of them. Returns the points on the segment shaped (count, 3), and a
+    mask of the lines that are parallel to the segment or miss it.
+    """
+    origin, axes = fit_projection_plane(np.vstack([heads, tails, seg_head, seg_tail]))
+
+    a = axes @ (seg_head - origin)
+    seg_dir = axes @ (seg_tail - seg_head)
+    starts = (heads - origin) @ axes.T
+    dirs = (tails - heads) @ axes.T
+
+    # Solve a + t * seg_dir = start + s * dir for t, by 2D cross products
+    def cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    denom = cross(seg_dir, dirs)
+    scale = np.linalg.norm(seg_dir) * np.linalg.norm(dirs, axis=1)
+    parallel = np.abs(denom) <= eps * np.where(scale > 0, scale, 1.0)
+
+    t = cross(starts - a, dirs) / np.where(parallel, 1.0, denom)
+    failed = parallel | (t < -eps) | (t > 1 + eps)
+
+    t = np.clip(t, 0.0, 1.0)
+    return seg_head + t[:, None] * (seg_tail - seg_head), failed
+
+
+def fan_fractions(heads: np.ndarray, tails: np.ndarray, eps=1e-6) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positions of feathers shaped (count, 3) along the fan, as fractions of the segment from the
+    tail of the first feather to the tail of the last one. Returns the fractions and the mask of
+    feathers that don't cross that segment.
+    """
+    seg_head, seg_tail = tails[0], tails[-1]
+    positions, failed = intersect_lines_with_segment(seg_head, seg_tail, heads, tails, eps)
+
+    seg_dir = seg_tail - seg_head
+    length_sq = seg_dir @ seg_dir
+    if length_sq <= eps * eps:
+        return np.zeros(len(heads)), np.ones(len(heads), dtype=bool)
+
+    # The end feathers define the segment, even when they lie along it
+    fractions = (positions - seg_head) @ seg_dir / length_sq
+    fractions[[0, -1]] = 0.0, 1.0
+    failed[[0, -1]] = False
+    return fractions, failed
+
+
+def interpolation_weights(fractions: np.ndarray, guide_fractions: np.ndarray) -> np.ndarray:
+    """
+    Piecewise linear weights of guides at increasing fractions for feathers at fractions, shaped
+    (feathers, guides). Every row sums to one and has at most two non-zero weights.
+    """
+    count, guides = len(fractions), len(guide_fractions)
+    weights = np.zeros((count, guides))
+
+    if guides == 1:
+        weights[:, 0] = 1.0
+        return weights
+
+    index = np.clip(np.searchsorted(guide_fractions, fractions, side='right') - 1, 0, guides - 2)
+    start = guide_fractions[index]
+    span = guide_fractions[index + 1] - start
+    t = np.clip((fractions - start) / np.where(span > 0, span, 1.0), 0.0, 1.0)
+
+    rows = np.arange(count)
+    weights[rows, index] = 1 - t
+    weights[rows, index + 1] += t
+    return weights
+
+
+def find_feather_targets(rig, feathers: list[str], segment: str) -> list[Vector]:
+    """
+    Positions on the segment bone where the extended feather bones cross it, for all feathers
+    of the rig at once. Raises a rig error listing the feathers without an intersection.
+    """
+    if not feathers:
+        return []
+
+    feather_bones = [rig.get_bone(name) for name in feathers]
+    segment_bone = rig.get_bone(segment)
+
+    heads = np.array([bone.head for bone in feather_bones])
+    tails = np.array([bone.tail for bone in feather_bones])
+
+    positions, failed = intersect_lines_with_segment(
+        np.array(segment_bone.head), np.array(segment_bone.tail), heads, tails)
+
+    if failed.any():
+        rig.raise_error("Can't find the projected intersection with {} for feathers: {}",
+                        segment, ', '.join(name for name, fail in zip(feathers, failed) if fail))
+
+    return [Vector(pos) for pos in positions]
+
+
+def find_feather_fractions(rig, feathers: list[str]) -> np.ndarray:
+    """
+    Positions of all feathers of the rig along the fan from the first to the last feather, as
+    fractions. Raises a rig error listing the feathers that don't cross it.
+    """
+    feather_bones = [rig.get_bone(name) for name in feathers]
+
+    heads = np.array([bone.head for bone in feather_bones])
+    tails = np.array([bone.tail for bone in feather_bones])
+
+    fractions, failed = fan_fractions(heads, tails)
+
+    if failed.any():
+        rig.raise_error("Can't place feathers between {} and {}: {}", feathers[0], feathers[-1],
+                        ', '.join(name for name, fail in zip(feathers, failed) if fail))
+
+    return fractions
@@ -0,0 +1,959 @@
+import bpy
+import os
+import glob
+import re
+import sys
+import json
+import math
+import base64
+import hashlib
+import warnings
+
+from array import array
+from typing import Any
+
+from rna_prop_ui import rna_idprop_ui_create
+
+from rigify.utils.misc import ArmatureObject
+
+
+# Metarig data layout:
+#
+#   colors            -- Rigify color sets, in order.
+#   collections       -- bone collections with their Rigify UI settings, parents first.
+#   bones             -- the bone table: creation order names, parent indices, use_connect
+#                        flags, packed transforms, and sparse non-default edit bone settings.
+#   pose              -- the parameter table: one record per bone with a non-default
+#                        rigify_type, pose settings, collections, parameters, constraints
+#                        or custom properties.
+#   active_collection -- index of the active bone collection.
+#   base              -- marks a variant patch: the name of the base metarig data file in the
+#                        same directory, to which the rest of the file is applied at load time
+#                        (see apply_metarig_patch).
+#   mirror            -- if true, only the center and .L side bones are stored, and every .L
+#                        bone without a stored .R counterpart is mirrored across X at load time,
+#                        except the ones listed in the 'unpaired' entry of the bone table.
+#                        The same applies to the parameter table records.
+#
+# The packed transforms are little-endian float32 values stored as base64 and laid out
+# as all heads (3 floats per bone), then all tails (3 floats), then all rolls (1 float),
+# so each attribute can be assigned through a single foreach_set call.
+
+METARIG_DATA_VERSION = 1
+
+# Values Blender assigns to new bones, which are omitted from the data.
+EDIT_BONE_DEFAULTS: dict[str, Any] = {
+    'inherit_scale': 'FULL',
+    'bbone_segments': 1,
+    'bbone_easein': 1.0,
+    'bbone_easeout': 1.0,
+}
+
+POSE_BONE_DEFAULTS: dict[str, Any] = {
+    'lock_location': [False, False, False],
+    'lock_rotation': [False, False, False],
+    'lock_rotation_w': False,
+    'lock_scale': [False, False, False],
+    'rotation_mode': 'QUATERNION',
+}
+
+# Constraint target value standing for the metarig object itself.
+TARGET_SELF = '<metarig>'
+
+MIRROR_SIDE_PATTERN = re.compile(r'\.L(?=$|[.\s])')
+UNMIRROR_SIDE_PATTERN = re.compile(r'\.R(?=$|[.\s])')
+
+CONSTRAINT_SKIP_PROPERTIES = {'rna_type', 'type', 'is_valid', 'active', 'show_expanded', 'is_override_data_editable'}
+
+
+##############################
+# Packed float arrays
+
+def pack_floats(values) -> str:
+    data = array('f', values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return base64.b64encode(data.tobytes()).decode('ascii')
+
+
+def unpack_floats(text: str) -> array:
+    data = array('f')
+    data.frombytes(base64.b64decode(text))
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data
+
+
+def foreach_set_from(collection, attr: str, start: int, values, size=1):
+    """Bulk-assign values to the collection items starting at index start, keeping the earlier ones."""
+    if start:
+        total = len(collection) * size
+        if isinstance(values, array):
+            full = array(values.typecode, bytes(values.itemsize * total))
+        else:
+            full = [False] * total
+        collection.foreach_get(attr, full)
+        full[start * size:] = values
+        values = full
+
+    collection.foreach_set(attr, values)
+
+
+##############################
+# Reading and writing files
+
+_data_cache: dict[str, tuple[dict[str, float], dict]] = {}
+
+
+def load_metarig_data(path: str) -> dict:
+    """Read a metarig data file, reusing the parsed result while the files it uses are unchanged."""
+    cached = _data_cache.get(path)
+
+    if cached is None or any(os.path.getmtime(p) != mtime for p, mtime in cached[0].items()):
+        mtimes = {}
+        data = read_metarig_file(path, mtimes)
+
+        if data.get('mirror'):
+            data = expand_mirrored_data(data)
+
+        cached = _data_cache[path] = (mtimes, data)
+
+    return cached[1]
+
+
+def read_metarig_file(path: str, mtimes: dict[str, float] | None = None) -> dict:
+    """Read a metarig data file as stored, applying it to its base metarig if it is a variant patch."""
+    if mtimes is not None:
+        mtimes[path] = os.path.getmtime(path)
+
+    with open(path, encoding='utf-8') as fp:
+        data = json.load(fp)
+
+    if data.get('version') != METARIG_DATA_VERSION:
+        raise ValueError(f"Unsupported metarig data version in {path}")
+
+    if base_name := data.get('base'):
+        base = read_metarig_file(os.path.join(os.path.dirname(path), base_name), mtimes)
+        data = apply_metarig_patch(base, data)
+
+    return data
+
+
+def write_metarig_data(data: dict, path: str):
+    """Write metarig data with one table record per line, to keep diffs readable."""
+    def dump(value):
+        return json.dumps(value, separators=(',', ':'))
+
+    lines = []
+
+    for key, value in data.items():
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            items = ',\n'.join(dump(item) for item in value)
+            lines.append(f'{dump(key)}:[\n{items}\n]')
+        elif isinstance(value, dict) and key == 'bones':
+            items = ',\n'.join(f'{dump(k)}:{dump(v)}' for k, v in value.items())
+            lines.append(f'{dump(key)}:{{\n{items}\n}}')
+        else:
+            lines.append(f'{dump(key)}:{dump(value)}')
+
+    with open(path, 'w', encoding='utf-8', newline='\n') as fp:
+        fp.write('{\n' + ',\n'.join(lines) + '\n}\n')
+
+
+##############################
+# Mirroring
+
+def mirror_name(name: str) -> str:
+    """Flip the .L side markers in a bone or collection name to .R"""
+    return MIRROR_SIDE_PATTERN.sub('.R', name)
+
+
+def unmirror_name(name: str) -> str:
+    return UNMIRROR_SIDE_PATTERN.sub('.L', name)
+
+
+def mirror_value(value):
+    if isinstance(value, str):
+        return mirror_name(value)
+    if isinstance(value, list):
+        return [mirror_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: mirror_value(item) for key, item in value.items()}
+    return value
+
+
+def mirror_pose_entry(entry: dict) -> dict:
+    return {key: value if key == 'type' else mirror_value(value) for key, value in entry.items()}
+
+
+def split_transforms(table: dict) -> tuple[array, array, array]:
+    count = len(table['names'])
+    transforms = unpack_floats(table['transforms'])
+    return transforms[0:count * 3], transforms[count * 3:count * 6], transforms[count * 6:count * 7]
+
+
+def expand_mirrored_data(data: dict) -> dict:
+    """Build the complete metarig data from data storing only the center and .L side."""
+    table = data['bones']
+    names = table['names']
+    heads, tails, rolls = split_transforms(table)
+    extra = table.get('extra', {})
+    stored = set(names)
+    unpaired = set(table.get('unpaired', ()))
+
+    # Each mirrored bone is created right after its .L counterpart
+    sources: list[tuple[str, int, bool]] = []
+
+    for i, name in enumerate(names):
+        sources.append((name, i, False))
+        flipped = mirror_name(name)
+        if flipped != name and flipped not in stored and name not in unpaired:
+            sources.append((flipped, i, True))
+
+    index = {name: i for i, (name, _, _) in enumerate(sources)}
+    new_heads = array('f')
+    new_tails = array('f')
+    new_rolls = array('f')
+    new_parents = []
+    new_extra = {}
+
+    for name, i, mirrored in sources:
+        sign = -1.0 if mirrored else 1.0
+        new_heads.extend((heads[i * 3] * sign, heads[i * 3 + 1], heads[i * 3 + 2]))
+        new_tails.extend((tails[i * 3] * sign, tails[i * 3 + 1], tails[i * 3 + 2]))
+        new_rolls.append(rolls[i] * sign)
+
+        parent = table['parents'][i]
+        if parent >= 0:
+            parent_name = names[parent]
+            if mirrored:
+                parent_name = mirror_name(parent_name)
+            parent = index[parent_name]
+        new_parents.append(parent)
+
+        if settings := extra.get(names[i]):
+            new_extra[name] = settings
+
+    # Mirror the parameter table records, unless overridden by a stored .R record
+    pose_names = {entry['name'] for entry in data['pose']}
+    new_pose = []
+
+    for entry in data['pose']:
+        new_pose.append(entry)
+        flipped = mirror_name(entry['name'])
+        if flipped != entry['name'] and flipped in index and flipped not in pose_names:
+            new_pose.append(mirror_pose_entry(entry))
+
+    result = {key: value for key, value in data.items() if key != 'mirror'}
+    result['bones'] = {
+        'names': [name for name, _, _ in sources],
+        'parents': new_parents,
+        'connect': [table['connect'][i] for _, i, _ in sources],
+        'transforms': pack_floats([*new_heads, *new_tails, *new_rolls]),
+        'extra': new_extra,
+    }
+    result['pose'] = new_pose
+    return result
+
+
+def make_mirrored_data(data: dict) -> dict:
+    """Drop the .R side bones and records that are exact mirrors of their .L counterparts."""
+    table = data['bones']
+    names = table['names']
+    parents = table['parents']
+    heads, tails, rolls = split_transforms(table)
+    extra = table.get('extra', {})
+    index = {name: i for i, name in enumerate(names)}
+
+    def is_mirror_bone(left: int, right: int) -> bool:
+        if (heads[left * 3] != -heads[right * 3] or tails[left * 3] != -tails[right * 3]
+                or heads[left * 3 + 1:left * 3 + 3] != heads[right * 3 + 1:right * 3 + 3]
+                or tails[left * 3 + 1:left * 3 + 3] != tails[right * 3 + 1:right * 3 + 3]
+                or rolls[left] != -rolls[right]):
+            return False
+        if table['connect'][left] != table['connect'][right]:
+            return False
+        if extra.get(names[left]) != extra.get(names[right]):
+            return False
+        left_parent = names[parents[left]] if parents[left] >= 0 else None
+        right_parent = names[parents[right]] if parents[right] >= 0 else None
+        return right_parent == (left_parent and mirror_name(left_parent))
+
+    mirrored = {
+        names[right] for right, name in enumerate(names)
+        if unmirror_name(name) != name and unmirror_name(name) in index
+        and is_mirror_bone(index[unmirror_name(name)], right)
+    }
+    # Stored bones refer to their parent by index, so the parent has to be stored too
+    changed = True
+    while changed:
+        changed = False
+        for i, name in enumerate(names):
+            if name not in mirrored and parents[i] >= 0 and names[parents[i]] in mirrored:
+                mirrored.discard(names[parents[i]])
+                changed = True
+
+    stored = [i for i, name in enumerate(names) if name not in mirrored]
+    unpaired = [name for name in names if mirror_name(name) != name and mirror_name(name) not in index]
+    remap = {old: new for new, old in enumerate(stored)}
+
+    pose = {entry['name']: entry for entry in data['pose']}
+    new_pose = []
+
+    for entry in data['pose']:
+        name = entry['name']
+        left_name = unmirror_name(name)
+        if left_name != name and left_name in pose and mirror_pose_entry(pose[left_name]) == entry:
+            continue
+        new_pose.append(entry)
+
+    for name in names:
+        left_name = unmirror_name(name)
+        if left_name != name and left_name in pose and name not in pose:
+            # Stop the .L record from being mirrored onto a bone with default settings
+            new_pose.append({'name': name})
+
+    result = dict(data)
+    result['mirror'] = True
+    result['bones'] = {
+        'names': [names[i] for i in stored],
+        'parents': [remap[parents[i]] if parents[i] >= 0 else -1 for i in stored],
+        'connect': [table['connect'][i] for i in stored],
+        'transforms': pack_floats([
+            *(v for i in stored for v in heads[i * 3:i * 3 + 3]),
+            *(v for i in stored for v in tails[i * 3:i * 3 + 3]),
+            *(rolls[i] for i in stored),
+        ]),
+        'extra': {name: settings for name, settings in extra.items() if name not in mirrored},
+        'unpaired': unpaired,
+    }
+    result['pose'] = new_pose
+    return result
+
+
+##############################
+# Variant patches
+#
+# A patch file stores a metarig variant as changes to its (stored, not mirror-expanded) base:
+#
+#   colors, collections, active_collection -- replace the base tables when present.
+#   remove   -- names of base bones to delete, along with their parameter table records.
+#   types    -- rigify_type remapping applied to all base records, e.g. 'limbs.arm' to 'game.limbs.arm'.
+#   bones    -- a bone table of new or changed bones, with parent names instead of indices;
+#               these are created after the unchanged base bones, in table order.
+#   unpaired -- replaces the base list of .L bones without a mirrored side.
+#   pose     -- parameter table records: new ones are added, existing ones replaced, or merged
+#               key by key with 'merge' (a null value deletes the key), or deleted with 'remove'.
+
+PATCH_TABLE_KEYS = ('colors', 'collections', 'active_collection')
+
+
+def bone_table_to_dict(table: dict, parent_names=False) -> dict[str, tuple]:
+    names = table['names']
+    heads, tails, rolls = split_transforms(table)
+    extra = table.get('extra', {})
+    result = {}
+
+    for i, name in enumerate(names):
+        parent = table['parents'][i]
+        if not parent_names:
+            parent = names[parent] if parent >= 0 else None
+        result[name] = (tuple(heads[i * 3:i * 3 + 3]), tuple(tails[i * 3:i * 3 + 3]), rolls[i],
+                        parent, table['connect'][i], extra.get(name))
+
+    return result
+
+
+def dict_to_bone_table(bones: dict[str, tuple], parent_names=False) -> dict:
+    names = list(bones)
+    index = {name: i for i, name in enumerate(names)}
+    items = list(bones.values())
+
+    if parent_names:
+        parents = [item[3] for item in items]
+    else:
+        parents = [index[item[3]] if item[3] is not None else -1 for item in items]
+
+    return {
+        'names': names,
+        'parents': parents,
+        'connect': [item[4] for item in items],
+        'transforms': pack_floats([
+            *(v for item in items for v in item[0]),
+            *(v for item in items for v in item[1]),
+            *(item[2] for item in items),
+        ]),
+        'extra': {name: item[5] for name, item in bones.items() if item[5]},
+    }
+
+
+def merge_pose_entry(entry: dict, changes: dict) -> dict:
+    result = dict(entry)
+
+    for key, value in changes.items():
+        if key in ('name', 'merge'):
+            continue
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict) and isinstance(result.get(key), dict):
+            merged = dict(result[key])
+            for sub_key, sub_value in value.items():
+                if sub_value is None:
+                    merged.pop(sub_key, None)
+                else:
+                    merged[sub_key] = sub_value
+            result[key] = merged
+        else:
+            result[key] = value
+
+    return result
+
+
+def apply_metarig_patch(base: dict, patch: dict) -> dict:
+    """Build stored metarig data by applying a variant patch to its stored base data."""
+    result = {key: value for key, value in base.items() if key not in ('bones', 'pose')}
+
+    for key in PATCH_TABLE_KEYS:
+        if key in patch:
+            result[key] = patch[key]
+
+    removed = set(patch.get('remove', ()))
+
+    # Bone table
+    bones = {name: item for name, item in bone_table_to_dict(base['bones']).items() if name not in removed}
+
+    if 'bones' in patch:
+        changed = bone_table_to_dict(patch['bones'], parent_names=True)
+        bones = {name: item for name, item in bones.items() if name not in changed}
+        bones.update(changed)
+
+    result['bones'] = table = dict_to_bone_table(bones)
+
+    if 'unpaired' in patch:
+        table['unpaired'] = patch['unpaired']
+    elif 'unpaired' in base['bones']:
+        table['unpaired'] = [name for name in base['bones']['unpaired'] if name not in removed]
+
+    # Parameter table
+    types = patch.get('types', {})
+    records = {}
+
+    for entry in base['pose']:
+        if entry['name'] not in removed:
+            if entry.get('type') in types:
+                entry = dict(entry, type=types[entry['type']])
+            records[entry['name']] = entry
+
+    for entry in patch.get('pose', ()):
+        name = entry['name']
+        if entry.get('remove'):
+            records.pop(name, None)
+        elif entry.get('merge') and name in records:
+            records[name] = merge_pose_entry(records[name], entry)
+        else:
+            records[name] = {key: value for key, value in entry.items() if key != 'merge'}
+
+    result['pose'] = list(records.values())
+    return result
+
+
+def make_metarig_patch(base: dict, variant: dict, base_name: str) -> dict:
+    """Compute the patch turning the stored base data into the stored variant data."""
+    patch = {'version': METARIG_DATA_VERSION, 'base': base_name}
+
+    for key in PATCH_TABLE_KEYS:
+        if variant[key] != base[key]:
+            patch[key] = variant[key]
+
+    base_bones = bone_table_to_dict(base['bones'])
+    variant_bones = bone_table_to_dict(variant['bones'])
+
+    removed = [name for name in base_bones if name not in variant_bones]
+    if removed:
+        patch['remove'] = removed
+
+    # Infer the most common type change of each base type
+    base_records = {entry['name']: entry for entry in base['pose'] if entry['name'] not in removed}
+    variant_records = {entry['name']: entry for entry in variant['pose']}
+    type_changes: dict[str, dict[str, int]] = {}
+
+    for name, entry in base_records.items():
+        if 'type' in entry:
+            new_type = variant_records.get(name, {}).get('type')
+            targets = type_changes.setdefault(entry['type'], {})
+            targets[new_type] = targets.get(new_type, 0) + 1
+
+    types = {}
+    for old_type, targets in type_changes.items():
+        new_type = max(targets, key=targets.get)
+        if new_type is not None and new_type != old_type:
+            types[old_type] = new_type
+    if types:
+        patch['types'] = types
+
+    changed = {name: item for name, item in variant_bones.items() if base_bones.get(name) != item}
+    if changed:
+        patch['bones'] = dict_to_bone_table(changed, parent_names=True)
+
+    if variant['bones'].get('unpaired', []) != [name for name in base['bones'].get('unpaired', ())
+                                                if name not in removed]:
+        patch['unpaired'] = variant['bones'].get('unpaired', [])
+
+    records = []
+
+    for name, entry in variant_records.items():
+        base_entry = base_records.get(name)
+        if base_entry is None:
+            records.append(entry)
+            continue
+        if base_entry.get('type') in types:
+            base_entry = dict(base_entry, type=types[base_entry['type']])
+        if base_entry == entry:
+            continue
+
+        changes = {'name': name, 'merge': True}
+        for key in base_entry.keys() | entry.keys():
+            old, new = base_entry.get(key), entry.get(key)
+            if old == new:
+                continue
+            if isinstance(old, dict) and isinstance(new, dict):
+                changes[key] = {k: new.get(k) for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+            else:
+                changes[key] = new
+        records.append(changes)
+
+    records += [{'name': name, 'remove': True} for name in base_records if name not in variant_records]
+
+    if records:
+        patch['pose'] = records
+
+    return patch
+
+
+##############################
+# Creating the metarig
+
+def create_metarig_from_file(obj: ArmatureObject, path: str, use_library=True) -> dict[str, str]:
+    """Build the metarig from a data file, appending it from the library cache when possible."""
+    if not use_library or not is_empty_armature(obj):
+        return create_metarig(obj, load_metarig_data(path))
+
+    lib_path = library_file_path(path)
+
+    if os.path.exists(lib_path):
+        try:
+            return append_metarig_from_library(obj, path, lib_path)
+        except OSError as e:
+            warnings.warn(f"Could not append the metarig from the library cache {lib_path}, "
+                          f"rebuilding it from {path}: {e}")
+
+    bones = create_metarig(obj, load_metarig_data(path))
+
+    try:
+        save_metarig_library(obj, lib_path)
+    except OSError as e:
+        warnings.warn(f"Could not write the metarig library cache {lib_path}: {e}")
+
+    return bones
+
+
+def create_metarig(obj: ArmatureObject, data: dict) -> dict[str, str]:
+    """Build the metarig described by data in the armature object, returning the bone name map."""
+    if data.get('mirror'):
+        data = expand_mirrored_data(data)
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    arm = obj.data
+
+    create_color_sets(arm, data['colors'])
+    bone_collections = create_bone_collections(arm, data['collections'])
+    bones = create_edit_bones(arm, data['bones'])
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    for entry in data['pose']:
+        configure_pose_bone(obj, bones, bone_collections, entry)
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    select_new_bones(arm, bones)
+
+    arm.collections.active_index = data['active_collection']
+
+    return bones
+
+
+def create_color_sets(arm, colors: list[dict]):
+    for i in range(len(colors)):
+        arm.rigify_colors.add()
+
+    for i, info in enumerate(colors):
+        color_set = arm.rigify_colors[i]
+        for attr, value in info.items():
+            setattr(color_set, attr, value)
+
+
+def create_bone_collections(arm, collections: list[dict]) -> dict[str, bpy.types.BoneCollection]:
+    bone_collections = {}
+
+    for bcoll in list(arm.collections_all):
+        arm.collections.remove(bcoll)
+
+    for info in collections:
+        name = info['name']
+        new_bcoll = arm.collections.new(name, parent=bone_collections.get(info.get('parent')))
+        new_bcoll.rigify_ui_row = info.get('ui_row', 0)
+        new_bcoll.rigify_ui_title = info.get('ui_title', '')
+        new_bcoll.rigify_sel_set = info.get('sel_set', False)
+        new_bcoll.rigify_color_set_id = info.get('color_set_id', 0)
+        bone_collections[name] = new_bcoll
+
+    return bone_collections
+
+
+def create_edit_bones(arm, table: dict) -> dict[str, str]:
+    edit_bones = arm.edit_bones
+    names = table['names']
+    count = len(names)
+
+    start = len(edit_bones)
+    new_bones = [edit_bones.new(name) for name in names]
+    bones = {name: bone.name for name, bone in zip(names, new_bones)}
+
+    transforms = unpack_floats(table['transforms'])
+
+    if len(transforms) != count * 7:
+        raise ValueError("Metarig transform table does not match the bone count")
+
+    foreach_set_from(edit_bones, 'head', start, transforms[0:count * 3], 3)
+    foreach_set_from(edit_bones, 'tail', start, transforms[count * 3:count * 6], 3)
+    foreach_set_from(edit_bones, 'roll', start, transforms[count * 6:count * 7])
+    foreach_set_from(edit_bones, 'use_connect', start, [bool(v) for v in table['connect']])
+
+    for bone, parent in zip(new_bones, table['parents']):
+        if parent >= 0:
+            bone.parent = new_bones[parent]
+
+    for name, settings in table.get('extra', {}).items():
+        bone = edit_bones[bones[name]]
+        for attr, value in settings.items():
+            setattr(bone, attr, value)
+
+    return bones
+
+
+def configure_pose_bone(obj: ArmatureObject, bones: dict[str, str],
+                        bone_collections: dict[str, bpy.types.BoneCollection], entry: dict,
+                        assign_collections=True):
+    pbone = obj.pose.bones[bones[entry['name']]]
+
+    if 'type' in entry:
+        pbone.rigify_type = entry['type']
+
+    for attr, value in entry.get('pose', {}).items():
+        setattr(pbone, attr, value)
+
+    if assign_collections and (coll_names := entry.get('collections')):
+        assert not len(pbone.bone.collections)
+        for name in coll_names:
+            bone_collections[name].assign(pbone)
+
+    params = pbone.rigify_parameters
+
+    for attr, value in entry.get('params', {}).items():
+        try:
+            setattr(params, attr, value)
+        except AttributeError:
+            pass
+
+    for attr, coll_names in entry.get('coll_refs', {}).items():
+        ref_list = getattr(params, attr + '_coll_refs', None)
+        if ref_list is not None:
+            for name in coll_names:
+                ref_list.add().set_collection(bone_collections[name])
+
+    for con_info in entry.get('constraints', ()):
+        con = pbone.constraints.new(con_info['type'])
+        for attr, value in con_info['props'].items():
+            if attr == 'target' and value == TARGET_SELF:
+                value = obj
+            setattr(con, attr, value)
+
+    for prop_info in entry.get('custom_props', ()):
+        rna_idprop_ui_create(pbone, **prop_info)
+
+
+def select_new_bones(arm, bones: dict[str, str]):
+    """Select the new bones, make the last one active and size their B-Bone display."""
+    edit_bones = arm.edit_bones
+    count = len(edit_bones)
+
+    if count == len(bones):
+        mask = [True] * count
+    else:
+        new_names = set(bones.values())
+        mask = [bone.name in new_names for bone in edit_bones]
+
+    for attr in ('select', 'select_head', 'select_tail'):
+        edit_bones.foreach_set(attr, mask)
+
+    heads = array('f', bytes(12 * count))
+    tails = array('f', bytes(12 * count))
+    sizes = array('f', bytes(4 * count))
+    edit_bones.foreach_get('head', heads)
+    edit_bones.foreach_get('tail', tails)
+    edit_bones.foreach_get('bbone_x', sizes)
+
+    for i, selected in enumerate(mask):
+        if selected:
+            sizes[i] = math.dist(heads[i * 3:i * 3 + 3], tails[i * 3:i * 3 + 3]) * 0.05
+
+    edit_bones.foreach_set('bbone_x', sizes)
+    edit_bones.foreach_set('bbone_z', sizes)
+
+    if bones:
+        edit_bones.active = edit_bones[bones[next(reversed(bones))]]
+
+
+##############################
+# Prebuilt library cache
+#
+# Metarigs built from data files are saved as armature datablocks in .blend files in the user
+# data directory, named after the template and a hash of its sources. Adding the metarig again
+# appends the armature and only applies the parameter table, since pose bones belong to the object.
+#
+# The VIZOR_METARIG_CACHE environment variable replaces the cache directory, e.g. to keep
+# benchmarks and tests out of the user data directory.
+
+LIBRARY_CACHE_DIR = 'vizor_metarigs'
+LIBRARY_CACHE_ENV_VAR = 'VIZOR_METARIG_CACHE'
+
+
+def metarig_source_hash(path: str) -> str:
+    """Hash the data files a metarig is built from, along with the data and Blender versions."""
+    load_metarig_data(path)
+
+    digest = hashlib.sha1(f'{METARIG_DATA_VERSION}:{bpy.app.version_string}'.encode())
+
+    for file_path in sorted(_data_cache[path][0]):
+        with open(file_path, 'rb') as fp:
+            digest.update(fp.read())
+
+    return digest.hexdigest()[:16]
+
+
+def library_file_path(path: str) -> str:
+    name = os.path.splitext(os.path.basename(path))[0]
+    cache_dir = (os.environ.get(LIBRARY_CACHE_ENV_VAR, '').strip()
+                 or os.path.join(bpy.utils.user_resource('DATAFILES'), LIBRARY_CACHE_DIR))
+    return os.path.join(cache_dir, f'{name}-{metarig_source_hash(path)}.blend')
+
+
+def is_empty_armature(obj: ArmatureObject) -> bool:
+    arm = obj.data
+    bones = arm.edit_bones if obj.mode == 'EDIT' else arm.bones
+    return arm.users == 1 and not len(bones)
+
+
+def save_metarig_library(obj: ArmatureObject, lib_path: str):
+    """Write the armature of a freshly built metarig to the cache, replacing outdated versions."""
+    cache_dir, file_name = os.path.split(lib_path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    pattern = glob.escape(file_name.rsplit('-', 1)[0]) + '-*.blend'
+    for old_path in glob.glob(os.path.join(cache_dir, pattern)):
+        os.remove(old_path)
+
+    # Flush the edit bones, and write through a temporary file so that parallel jobs never
+    # append a partially written library.
+    bpy.ops.object.mode_set(mode='OBJECT')
+    temp_path = f'{lib_path}.{os.getpid()}.tmp'
+    try:
+        bpy.data.libraries.write(temp_path, {obj.data}, fake_user=True)
+        os.replace(temp_path, lib_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        bpy.ops.object.mode_set(mode='EDIT')
+
+
+def append_metarig_from_library(obj: ArmatureObject, path: str, lib_path: str) -> dict[str, str]:
+    """Replace the empty armature of the object with the cached one, and configure the pose bones."""
+    data = load_metarig_data(path)
+
+    with bpy.data.libraries.load(lib_path) as (data_from, data_to):
+        data_to.armatures = data_from.armatures[:1]
+
+    if not data_to.armatures or data_to.armatures[0] is None:
+        raise OSError(f"No armature in {lib_path}")
+
+    arm = data_to.armatures[0]
+    arm.use_fake_user = False
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    old_arm = obj.data
+    name = old_arm.name
+    obj.data = arm
+    bpy.data.armatures.remove(old_arm)
+    arm.name = name
+
+    bones = {bone.name: bone.name for bone in arm.bones}
+    bone_collections = {bcoll.name: bcoll for bcoll in arm.collections_all}
+
+    for entry in data['pose']:
+        configure_pose_bone(obj, bones, bone_collections, entry, assign_collections=False)
+
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    return bones
+
+
+##############################
+# Capturing an existing metarig
+
+def metarig_to_data(obj: ArmatureObject) -> dict:
+    """Capture the metarig in the armature object as data for create_metarig()."""
+    bpy.ops.object.mode_set(mode='EDIT')
+    arm = obj.data
+
+    data = {
+        'version': METARIG_DATA_VERSION,
+        'colors': [color_set_to_data(color_set) for color_set in arm.rigify_colors],
+        'collections': [collection_to_data(bcoll) for bcoll in arm.collections_all],
+        'bones': edit_bones_to_data(arm),
+    }
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    data['pose'] = [entry for pbone in obj.pose.bones if (entry := pose_bone_to_data(obj, pbone))]
+    data['active_collection'] = arm.collections.active_index
+
+    return data
+
+
+def color_set_to_data(color_set) -> dict:
+    return {
+        'name': color_set.name,
+        'active': [round(v, 4) for v in color_set.active],
+        'normal': [round(v, 4) for v in color_set.normal],
+        'select': [round(v, 4) for v in color_set.select],
+        'standard_colors_lock': color_set.standard_colors_lock,
+    }
+
+
+def collection_to_data(bcoll) -> dict:
+    info = {'name': bcoll.name}
+    if bcoll.parent:
+        info['parent'] = bcoll.parent.name
+    if bcoll.rigify_ui_row:
+        info['ui_row'] = bcoll.rigify_ui_row
+    if bcoll.rigify_ui_title:
+        info['ui_title'] = bcoll.rigify_ui_title
+    if bcoll.rigify_sel_set:
+        info['sel_set'] = True
+    if bcoll.rigify_color_set_id:
+        info['color_set_id'] = bcoll.rigify_color_set_id
+    return info
+
+
+def edit_bones_to_data(arm) -> dict:
+    edit_bones = arm.edit_bones
+    count = len(edit_bones)
+    names = [bone.name for bone in edit_bones]
+    index = {name: i for i, name in enumerate(names)}
+
+    heads = array('f', bytes(12 * count))
+    tails = array('f', bytes(12 * count))
+    rolls = array('f', bytes(4 * count))
+    edit_bones.foreach_get('head', heads)
+    edit_bones.foreach_get('tail', tails)
+    edit_bones.foreach_get('roll', rolls)
+
+    extra = {}
+
+    for bone in edit_bones:
+        settings = {attr: getattr(bone, attr) for attr, default in EDIT_BONE_DEFAULTS.items()
+                    if getattr(bone, attr) != default}
+        if settings:
+            extra[bone.name] = settings
+
+    return {
+        'names': names,
+        'parents': [index[bone.parent.name] if bone.parent else -1 for bone in edit_bones],
+        'connect': [int(bone.use_connect) for bone in edit_bones],
+        'transforms': pack_floats([*heads, *tails, *rolls]),
+        'extra': extra,
+    }
+
+
+def pose_bone_to_data(obj: ArmatureObject, pbone) -> dict | None:
+    entry = {}
+
+    if pbone.rigify_type:
+        entry['type'] = pbone.rigify_type
+
+    pose = {}
+    for attr, default in POSE_BONE_DEFAULTS.items():
+        value = getattr(pbone, attr)
+        value = list(value) if isinstance(default, list) else value
+        if value != default:
+            pose[attr] = value
+    if pose:
+        entry['pose'] = pose
+
+    if pbone.bone.collections:
+        entry['collections'] = [bcoll.name for bcoll in pbone.bone.collections]
+
+    params = {}
+    coll_refs = {}
+    for key in pbone.rigify_parameters.keys():
+        value = getattr(pbone.rigify_parameters, key, None)
+        if key.endswith('_coll_refs'):
+            if value:
+                coll_refs[key[:-len('_coll_refs')]] = [ref.name for ref in value]
+        elif isinstance(value, (bool, int, float, str)):
+            params[key] = value
+        elif value is not None and hasattr(value, '__len__'):
+            params[key] = list(value)
+    if params:
+        entry['params'] = params
+    if coll_refs:
+        entry['coll_refs'] = coll_refs
+
+    if pbone.constraints:
+        entry['constraints'] = [constraint_to_data(obj, con) for con in pbone.constraints]
+
+    custom_props = []
+    for key in pbone.keys():
+        if key not in pbone.bl_rna.properties and isinstance(pbone[key], (int, float, str)):
+            ui_data = pbone.id_properties_ui(key).as_dict()
+            custom_props.append({'prop': key, **ui_data})
+    if custom_props:
+        entry['custom_props'] = custom_props
+
+    if entry:
+        entry = {'name': pbone.name, **entry}
+        return entry
+
+    return None
+
+
+def constraint_to_data(obj: ArmatureObject, con) -> dict:
+    props = {'name': con.name}
+
+    for prop in con.bl_rna.properties:
+        attr = prop.identifier
+        if prop.is_readonly or attr in CONSTRAINT_SKIP_PROPERTIES or attr == 'name':
+            continue
+        if prop.type == 'COLLECTION' or getattr(prop, 'is_enum_flag', False):
+            continue
+
+        value = getattr(con, attr)
+
+        if prop.type == 'POINTER':
+            if value == obj:
+                props[attr] = TARGET_SELF
+        elif getattr(prop, 'is_array', False):
+            props[attr] = list(value)
+        else:
+            props[attr] = value
+
+    return {'type': con.type, 'props': props}
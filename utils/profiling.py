@@ -0,0 +1,211 @@
+import bpy
+import os
+import time
+
+from rigify.base_generate import BaseGenerator, GeneratorPlugin
+from rigify.generate import Generator
+from rigify.utils.metaclass import BaseStagedClass
+
+
+# Generation stage profiling and reports.
+#
+# While the feature set is registered, generations that have a report enabled run with the Rigify
+# stage dispatch wrapped, to create the report plugins at the start of the generation and to route
+# every stage call through the stage profiler when it is active. Other generations are untouched.
+#
+# Profiling is enabled by the VIZOR_PROFILE environment variable set to a true flag or a path,
+# or a true 'vizor_profile' custom property on the metarig armature data. Every stage invocation
+# of every rig and sub-object is timed, excluding the time of nested sub-objects, and a sorted
+# report is printed and stored in the 'vizor_profile' text datablock after generation. If the
+# environment variable is set to a file path instead of a flag, the report is also written to
+# that file.
+
+PROFILE_ENV_VAR = 'VIZOR_PROFILE'
+PROFILE_PROPERTY = 'vizor_profile'
+PROFILE_TEXT = 'vizor_profile'
+
+ENV_FLAG_VALUES = {'1', 'true', 'yes', 'on'}
+ENV_FALSE_VALUES = {'0', 'false', 'no', 'off'}
+
+
+# Report plugin classes, created at the start of each generation for which is_enabled() is true
+REPORT_PLUGINS: list[type['ReportPlugin']] = []
+
+
+def get_env_setting(name: str) -> str | None:
+    """Value of a flag or path environment variable, or None if it is unset, empty or a false flag."""
+    value = os.environ.get(name, '').strip()
+    if not value or value.lower() in ENV_FALSE_VALUES:
+        return None
+    return value
+
+
+def is_profiling_enabled(generator: BaseGenerator) -> bool:
+    if get_env_setting(PROFILE_ENV_VAR):
+        return True
+    return bool(generator.metarig.data.get(PROFILE_PROPERTY))
+
+
+def rig_label(rig) -> str:
+    """Describe a rig or sub-object as its rig type and base bone."""
+    module = rig.__class__.__module__
+    rig_type = module.split('.rigs.', 1)[-1]
+    if rig_type == module:
+        rig_type = f'{module}.{rig.__class__.__name__}'
+
+    base_bone = getattr(rig, 'base_bone', None) or getattr(getattr(rig, 'owner', None), 'base_bone', None)
+    return f'{rig_type} ({base_bone})' if base_bone else rig_type
+
+
+def write_report_text(name: str, report: str):
+    """Print a report and store it in a text datablock."""
+    print(report)
+
+    text = bpy.data.texts.get(name) or bpy.data.texts.new(name)
+    text.from_string(report)
+
+
+class ReportPlugin(GeneratorPlugin):
+    """Base of the plugins that inspect a generation without contributing to the rig."""
+
+    priority = -1000
+
+    @classmethod
+    def is_enabled(cls, generator: BaseGenerator) -> bool:
+        return False
+
+
+class StageProfiler(ReportPlugin):
+    """Accumulates stage timings of one generation, and reports them in the finalize stage."""
+
+    @classmethod
+    def is_enabled(cls, generator):
+        return is_profiling_enabled(generator)
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        generator.vizor_stage_profiler = self
+
+        # (rig label, stage) -> [seconds, calls]
+        self.records: dict[tuple[str, str], list] = {}
+        self.rig_types: dict[str, str] = {}
+        self.stack: list[list[float]] = []
+
+    def invoke(self, rig, stage: str, invoke_stage):
+        label = rig_label(rig)
+        self.rig_types[label] = label.split(' (', 1)[0]
+
+        self.stack.append([0.0])
+        start = time.perf_counter()
+        try:
+            invoke_stage(rig, stage)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self.stack.pop()[0]
+            if self.stack:
+                self.stack[-1][0] += elapsed
+
+            record = self.records.setdefault((label, stage), [0.0, 0])
+            record[0] += elapsed - nested
+            record[1] += 1
+
+    def make_report(self) -> str:
+        total = sum(seconds for seconds, _ in self.records.values())
+        stages: dict[str, float] = {}
+        types: dict[str, list] = {}
+
+        for (label, stage), (seconds, calls) in self.records.items():
+            stages[stage] = stages.get(stage, 0.0) + seconds
+            type_record = types.setdefault(self.rig_types[label], [0.0, set()])
+            type_record[0] += seconds
+            type_record[1].add(label)
+
+        lines = [f"Vizor generation profile of {self.generator.metarig.name}: {total:.3f} s in rig stages", ""]
+
+        lines.append("Per stage:")
+        for stage, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+            lines.append(f"  {seconds:9.4f} s  {stage}")
+
+        lines += ["", "Per rig type:"]
+        for rig_type, (seconds, labels) in sorted(types.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {seconds:9.4f} s  {len(labels):4d} x  {rig_type}")
+
+        lines += ["", "Per rig instance and stage:"]
+        for (label, stage), (seconds, calls) in sorted(self.records.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {seconds:9.4f} s  {calls:4d} calls  {stage:<20} {label}")
+
+        return '\n'.join(lines) + '\n'
+
+    def finalize(self):
+        report = self.make_report()
+        write_report_text(PROFILE_TEXT, report)
+
+        path = get_env_setting(PROFILE_ENV_VAR)
+        if path and path.lower() not in ENV_FLAG_VALUES:
+            with open(path, 'w', encoding='utf-8') as fp:
+                fp.write(report)
+
+
+REPORT_PLUGINS.append(StageProfiler)
+
+
+def make_report_invoke_stage(generator: BaseGenerator, invoke_stage):
+    """Wrap the Rigify stage dispatch for one generation, to start its report plugins and time its stages."""
+
+    def rigify_invoke_stage(self, stage):
+        if isinstance(self, ReportPlugin):
+            return invoke_stage(self, stage)
+
+        if not getattr(generator, 'vizor_reports_started', False):
+            if stage != 'initialize':
+                return invoke_stage(self, stage)
+
+            generator.vizor_reports_started = True
+
+            for plugin_class in REPORT_PLUGINS:
+                if plugin_class.is_enabled(generator):
+                    plugin_class(generator)
+
+        profiler = getattr(generator, 'vizor_stage_profiler', None)
+
+        if profiler is None:
+            return invoke_stage(self, stage)
+
+        return profiler.invoke(self, stage, invoke_stage)
+
+    return rigify_invoke_stage
+
+
+# Methods replaced by install_generation_hooks, restored by uninstall_generation_hooks
+_original_methods = {}
+
+
+def install_generation_hooks():
+    """
+    Wrap Generator.generate, to wrap the stage dispatch for the duration of the generations
+    that have a report enabled. Other generations run the original dispatch.
+    """
+    if 'generate' in _original_methods:
+        return
+
+    generate = _original_methods['generate'] = Generator.generate
+
+    def generate_with_reports(self):
+        if not any(plugin_class.is_enabled(self) for plugin_class in REPORT_PLUGINS):
+            return generate(self)
+
+        invoke_stage = BaseStagedClass.rigify_invoke_stage
+        BaseStagedClass.rigify_invoke_stage = make_report_invoke_stage(self, invoke_stage)
+
+        try:
+            return generate(self)
+        finally:
+            BaseStagedClass.rigify_invoke_stage = invoke_stage
+
+    Generator.generate = generate_with_reports
+
+
+def uninstall_generation_hooks():
+    if generate := _original_methods.pop('generate', None):
+        Generator.generate = generate
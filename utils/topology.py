@@ -0,0 +1,86 @@
+from rigify.utils.misc import ArmatureObject
+from rigify.utils.rig import get_rigify_type
+
+
+# Armature topology index.
+#
+# Rigs look up siblings and connected chains of the metarig bones while they are created, which
+# with the Rigify helpers walks and scans the children of the same parents over and over. The
+# index reads every bone once per generation and answers these queries from dictionaries.
+#
+# It describes the bones as they are when the rigs are created, so it is meant for the ORG bones,
+# not for the bones added during generation.
+
+
+class ArmatureTopology:
+    """Children, connected chains, sibling groups and rig base flags of the bones of an armature."""
+
+    def __init__(self, obj: ArmatureObject):
+        self.obj = obj
+
+        self.parents: dict[str, str | None] = {}
+        self.child_names: dict[str, list[str]] = {}
+        self.rig_bases: set[str] = {pbone.name for pbone in obj.pose.bones if get_rigify_type(pbone)}
+
+        connected: dict[str, bool] = {}
+
+        for bone in obj.data.bones:
+            self.parents[bone.name] = bone.parent.name if bone.parent else None
+            self.child_names[bone.name] = []
+            connected[bone.name] = bone.use_connect
+
+        for name, parent in self.parents.items():
+            if parent is not None:
+                self.child_names[parent].append(name)
+
+        # The only connected child that is not a rig base, if there is exactly one
+        self.next_connected: dict[str, str | None] = {}
+
+        # Children of each parent that can be siblings: neither rig bases nor the connected chain
+        self.sibling_groups: dict[str, list[str]] = {}
+
+        for name, children in self.child_names.items():
+            links = [child for child in children if connected[child] and child not in self.rig_bases]
+            self.next_connected[name] = links[0] if len(links) == 1 else None
+            self.sibling_groups[name] = [
+                child for child in children
+                if child not in self.rig_bases and child != self.next_connected[name]
+            ]
+
+    def is_rig_base(self, name: str) -> bool:
+        return name in self.rig_bases
+
+    def children(self, name: str) -> list[str]:
+        return list(self.child_names[name])
+
+    def connected_chain(self, name: str) -> list[str]:
+        """Names of the connected chain continuing the bone, like connected_children_names."""
+        chain = []
+        name = self.next_connected[name]
+
+        while name is not None:
+            chain.append(name)
+            name = self.next_connected[name]
+
+        return chain
+
+    def siblings(self, name: str) -> list[str]:
+        """
+        Other children of the parent of the bone, except rig base bones and the bone continuing
+        the connected chain of the parent.
+        """
+        parent = self.parents[name]
+        if parent is None:
+            return []
+        return [child for child in self.sibling_groups[parent] if child != name]
+
+
+def get_topology(rig) -> ArmatureTopology:
+    """Get the topology index of the armature being generated, building it once per generation."""
+    generator = rig.generator
+    topology = getattr(generator, 'vizor_topology', None)
+
+    if topology is None or topology.obj != rig.obj:
+        topology = generator.vizor_topology = ArmatureTopology(rig.obj)
+
+    return topology